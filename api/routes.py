@@ -9,6 +9,7 @@ from sqlalchemy import update
 from pydantic import BaseModel, Field, validator
 from typing import Optional, List
 from datetime import datetime
+from contextlib import aclosing
 import json
 import logging
 
@@ -16,7 +17,7 @@ import logging
 from database import get_db
 from services.db_service import DatabaseService
 from services.llm_service import LLMService
-from websocket_handler import manager
+from websocket_handler import manager, send_vote_update, send_status_update
 from models_db import ComplaintDB
 import os
 
@@ -74,6 +75,27 @@ class VoteRequest(BaseModel):
             }
         }
 
+class BatchVoteItem(BaseModel):
+    """One vote inside a batch vote request"""
+    roll_number: str = Field(..., min_length=5, max_length=20)
+    vote_type: str = Field(..., pattern="^(upvote|downvote)$")
+
+class BatchVoteRequest(BaseModel):
+    """Batch vote request (many students, one complaint)"""
+    complaint_id: str = Field(..., min_length=10)
+    votes: List[BatchVoteItem]
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "complaint_id": "abc-123-def-456",
+                "votes": [
+                    {"roll_number": "22CS045", "vote_type": "upvote"},
+                    {"roll_number": "22EC012", "vote_type": "downvote"}
+                ]
+            }
+        }
+
 class StatusUpdateRequest(BaseModel):
     """Status update request"""
     complaint_id: str
@@ -103,6 +125,59 @@ class ComplaintResponse(BaseModel):
 # ENDPOINT 1: SUBMIT COMPLAINT
 # ============================================
 
+# Max complaints accepted by one bulk submission
+MAX_BULK_COMPLAINTS = 50
+
+def _submission_result(new_complaint: ComplaintDB, analysis: dict, authority: dict) -> dict:
+    """Build the per-complaint submission response body"""
+    return {
+        "success": True,
+        "complaint_id": new_complaint.id,
+        "message": "Complaint submitted successfully",
+        "title": new_complaint.title,
+        "priority": analysis.get("priority"),
+        "category": analysis.get("category"),
+        "urgency_score": analysis.get("urgency_score"),
+        "assigned_to": authority.get("authority"),
+        "authority_email": authority.get("email"),
+        "summary": analysis.get("summary"),
+        "status": new_complaint.status
+    }
+
+async def _store_complaint(
+    db_service: DatabaseService,
+    complaint: ComplaintSubmission,
+    analysis: dict
+) -> dict:
+    """Create the student/complaint rows for an analyzed submission"""
+    student = await db_service.get_or_create_student(
+        roll_number=complaint.register_number,
+        name=complaint.name,
+        email=f"{complaint.register_number}@srec.ac.in",
+        department=complaint.department,
+        stay_type=complaint.stay_type
+    )
+    
+    authority = llm_service.get_authority_from_category(
+        analysis.get("category", "other")
+    )
+    
+    new_complaint = await db_service.create_complaint(
+        student_id=student.id,
+        title=complaint.title,
+        description=complaint.description,
+        visibility=complaint.visibility,
+        image_url=complaint.image_url,
+        priority=analysis.get("priority", "medium"),
+        llm_analysis=json.dumps(analysis),
+        llm_category=analysis.get("category"),
+        assigned_authority=authority.get("authority"),
+        authority_email=authority.get("email")
+    )
+    
+    logger.info(f"✅ Complaint created: {new_complaint.id}")
+    return _submission_result(new_complaint, analysis, authority)
+
 @router.post(
     "/complaints",
     status_code=status.HTTP_201_CREATED,
@@ -117,8 +192,8 @@ async def submit_complaint(
     Submit a new complaint
     
     **Process:**
-    1. Create/update student record
-    2. Analyze complaint with LLM
+    1. Analyze complaint with LLM
+    2. Create/update student record
     3. Route to appropriate authority
     4. Create complaint in database
     5. Return complaint ID and analysis
@@ -132,64 +207,105 @@ async def submit_complaint(
     try:
         db_service = DatabaseService(db)
         
-        # Step 1: Get or create student
-        student = await db_service.get_or_create_student(
-            roll_number=complaint.register_number,
-            name=complaint.name,
-            email=f"{complaint.register_number}@srec.ac.in",
-            department=complaint.department,
-            stay_type=complaint.stay_type
-        )
-        
         logger.info(f"📝 Processing complaint from {complaint.register_number}")
         
-        # Step 2: Analyze with LLM
+        # Step 1: Analyze with LLM
         analysis = await llm_service.analyze_complaint(
             title=complaint.title,
             description=complaint.description
         )
         
-        # Step 3: Get authority routing
-        authority = llm_service.get_authority_from_category(
-            analysis.get("category", "other")
+        # Steps 2-4: Student record, authority routing, complaint row
+        return await _store_complaint(db_service, complaint, analysis)
+    
+    except Exception as e:
+        logger.error(f"❌ Error submitting complaint: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error submitting complaint: {str(e)}"
         )
-        
-        # Step 4: Create complaint
-        new_complaint = await db_service.create_complaint(
-            student_id=student.id,
-            title=complaint.title,
-            description=complaint.description,
-            visibility=complaint.visibility,
-            image_url=complaint.image_url,
-            priority=analysis.get("priority", "medium"),
-            llm_analysis=json.dumps(analysis),
-            llm_category=analysis.get("category"),
-            assigned_authority=authority.get("authority"),
-            authority_email=authority.get("email")
+
+# ============================================
+# ENDPOINT 1B: BULK SUBMIT COMPLAINTS
+# ============================================
+
+@router.post(
+    "/complaints/bulk",
+    status_code=status.HTTP_201_CREATED,
+    summary="Submit several complaints at once",
+    description="Submit a JSON array of complaints; LLM analysis runs concurrently for the whole batch"
+)
+async def submit_complaints_bulk(
+    complaints: List[ComplaintSubmission],
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Submit a batch of complaints in one round trip
+    
+    **Process:**
+    1. Analyze every complaint concurrently with the LLM
+    2. Create each complaint's student and complaint records as soon as
+       its analysis lands, while slower analyses are still running
+    
+    **Returns:**
+    - results: One submission result per complaint, in input order. Each
+      complaint is committed on its own, so a failed one is reported in its
+      slot ({"success": false, "message": ...}) while the others keep their
+      complaint IDs; resubmit only the failed ones.
+    - count / failed: How many were created / not created
+    """
+    if not complaints:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No complaints provided"
+        )
+    
+    if len(complaints) > MAX_BULK_COMPLAINTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_BULK_COMPLAINTS} complaints per bulk submission"
         )
+    
+    try:
+        db_service = DatabaseService(db)
+        
+        logger.info(f"📝 Processing bulk submission of {len(complaints)} complaints")
         
-        logger.info(f"✅ Complaint created: {new_complaint.id}")
+        # Analyses arrive in completion order; the session is not safe for
+        # concurrent use, so rows are written one at a time as they land.
+        # aclosing cancels the remaining analyses if the loop is abandoned.
+        results = [None] * len(complaints)
+        async with aclosing(llm_service.stream_analyze_multiple([
+            {"title": c.title, "description": c.description} for c in complaints
+        ])) as analyses:
+            async for idx, analysis in analyses:
+                try:
+                    results[idx] = await _store_complaint(db_service, complaints[idx], analysis)
+                except Exception as e:
+                    # Earlier complaints are already committed; report this one
+                    # and keep the session usable for the rest
+                    await db.rollback()
+                    logger.error(f"❌ Error storing bulk complaint {idx}: {e}")
+                    results[idx] = {
+                        "success": False,
+                        "title": complaints[idx].title,
+                        "message": f"Error submitting complaint: {str(e)}"
+                    }
+        
+        failed = sum(1 for result in results if not result["success"])
         
-        # Step 5: Return response (FIXED: use new_complaint.title)
         return {
-            "success": True,
-            "complaint_id": new_complaint.id,
-            "message": "Complaint submitted successfully",
-            "title": new_complaint.title,  # ✅ FIX: Use complaint object, not analysis
-            "priority": analysis.get("priority"),
-            "category": analysis.get("category"),
-            "urgency_score": analysis.get("urgency_score"),
-            "assigned_to": authority.get("authority"),
-            "authority_email": authority.get("email"),
-            "summary": analysis.get("summary"),
-            "status": new_complaint.status
+            "success": failed == 0,
+            "count": len(results) - failed,
+            "failed": failed,
+            "results": results
         }
     
     except Exception as e:
-        logger.error(f"❌ Error submitting complaint: {e}")
+        logger.error(f"❌ Error submitting complaints in bulk: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error submitting complaint: {str(e)}"
+            detail=f"Error submitting complaints in bulk: {str(e)}"
         )
 
 # ============================================
@@ -355,6 +471,42 @@ async def get_public_complaints(
 # ENDPOINT 4: GET COMPLAINT DETAILS
 # ============================================
 
+def _complaint_detail(complaint: ComplaintDB) -> dict:
+    """Format a complaint (with its student loaded) for the details endpoints"""
+    # Parse LLM analysis
+    llm_analysis = None
+    if complaint.llm_analysis:
+        try:
+            llm_analysis = json.loads(complaint.llm_analysis)
+        except:
+            pass
+    
+    return {
+        "complaint_id": complaint.id,
+        "title": complaint.title,
+        "description": complaint.description,
+        "status": complaint.status,
+        "priority": complaint.priority,
+        "visibility": complaint.visibility,
+        "upvotes": complaint.upvotes,
+        "downvotes": complaint.downvotes,
+        "net_votes": complaint.upvotes - complaint.downvotes,
+        "category": complaint.llm_category,
+        "student": {
+            "name": complaint.student.name,
+            "roll_number": complaint.student.roll_number,
+            "department": complaint.student.department,
+            "stay_type": complaint.student.stay_type
+        },
+        "assigned_authority": complaint.assigned_authority,
+        "authority_email": complaint.authority_email,
+        "submitted_at": complaint.submitted_at.isoformat(),
+        "updated_at": complaint.updated_at.isoformat(),
+        "resolved_at": complaint.resolved_at.isoformat() if complaint.resolved_at else None,
+        "image_url": complaint.image_url,
+        "llm_analysis": llm_analysis
+    }
+
 @router.get(
     "/complaints/{complaint_id}",
     summary="Get complaint details",
@@ -384,41 +536,7 @@ async def get_complaint_detail(
                 detail=f"Complaint {complaint_id} not found"
             )
         
-        # Parse LLM analysis
-        llm_analysis = None
-        if complaint.llm_analysis:
-            try:
-                llm_analysis = json.loads(complaint.llm_analysis)
-            except:
-                pass
-        
-        # Format response
-        response = {
-            "success": True,
-            "complaint_id": complaint.id,
-            "title": complaint.title,
-            "description": complaint.description,
-            "status": complaint.status,
-            "priority": complaint.priority,
-            "visibility": complaint.visibility,
-            "upvotes": complaint.upvotes,
-            "downvotes": complaint.downvotes,
-            "net_votes": complaint.upvotes - complaint.downvotes,
-            "category": complaint.llm_category,
-            "student": {
-                "name": complaint.student.name,
-                "roll_number": complaint.student.roll_number,
-                "department": complaint.student.department,
-                "stay_type": complaint.student.stay_type
-            },
-            "assigned_authority": complaint.assigned_authority,
-            "authority_email": complaint.authority_email,
-            "submitted_at": complaint.submitted_at.isoformat(),
-            "updated_at": complaint.updated_at.isoformat(),
-            "resolved_at": complaint.resolved_at.isoformat() if complaint.resolved_at else None,
-            "image_url": complaint.image_url,
-            "llm_analysis": llm_analysis
-        }
+        response = {"success": True, **_complaint_detail(complaint)}
         
         logger.info(f"📄 Retrieved complaint details: {complaint_id}")
         return response
@@ -432,6 +550,70 @@ async def get_complaint_detail(
             detail=f"Error retrieving complaint: {str(e)}"
         )
 
+# ============================================
+# ENDPOINT 4B: GET COMPLAINT DETAILS (BATCH)
+# ============================================
+
+MAX_COMPLAINT_IDS = 100
+
+@router.get(
+    "/complaints",
+    summary="Get details of several complaints",
+    description="Get full details of up to 100 complaints in one request"
+)
+async def get_complaint_details_batch(
+    ids: str = Query(..., min_length=1, description="Comma-separated complaint UUIDs"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get full details of several complaints with one query
+    
+    **Query Parameters:**
+    - ids: Comma-separated complaint UUIDs (max 100)
+    
+    **Returns:**
+    Complaints in the same shape as GET /complaints/{complaint_id}, in
+    request order, plus the IDs that were not found
+    """
+    complaint_ids = list(dict.fromkeys(
+        complaint_id.strip() for complaint_id in ids.split(",") if complaint_id.strip()
+    ))
+    if not complaint_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No complaint IDs provided"
+        )
+    if len(complaint_ids) > MAX_COMPLAINT_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_COMPLAINT_IDS} complaint IDs per request"
+        )
+    
+    try:
+        db_service = DatabaseService(db)
+        
+        complaints = await db_service.get_complaints_by_ids(complaint_ids)
+        by_id = {complaint.id: complaint for complaint in complaints}
+        
+        logger.info(f"📄 Retrieved {len(by_id)}/{len(complaint_ids)} complaint details")
+        
+        return {
+            "success": True,
+            "count": len(by_id),
+            "complaints": [
+                _complaint_detail(by_id[complaint_id])
+                for complaint_id in complaint_ids if complaint_id in by_id
+            ],
+            "not_found": [complaint_id for complaint_id in complaint_ids if complaint_id not in by_id]
+        }
+    
+    except Exception as e:
+        logger.error(f"❌ Error retrieving complaints: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error retrieving complaints: {str(e)}"
+        )
+
 # ============================================
 # ENDPOINT 5: VOTE ON COMPLAINT
 # ============================================
@@ -491,17 +673,14 @@ async def vote_on_complaint(
             )
         
         # Broadcast real-time update via WebSocket
-        await manager.broadcast_vote_update(
+        await send_vote_update(
             complaint_id=vote.complaint_id,
-            vote_data={
-                "upvotes": result["upvotes"],
-                "downvotes": result["downvotes"],
-                "total_votes": result["upvotes"] + result["downvotes"],
-                "action": result["action"],
-                "vote_type": vote.vote_type,
-                "priority_updated": result.get("priority_updated", False),
-                "new_priority": result.get("new_priority")
-            }
+            upvotes=result["upvotes"],
+            downvotes=result["downvotes"],
+            action=result["action"],
+            vote_type=vote.vote_type,
+            priority_updated=result.get("priority_updated", False),
+            new_priority=result.get("new_priority")
         )
         
         logger.info(f"🗳️ Vote {result['action']}: {vote.vote_type} on {vote.complaint_id}")
@@ -533,6 +712,108 @@ async def vote_on_complaint(
             detail=f"Vote error: {str(e)}"
         )
 
+# ============================================
+# ENDPOINT 5B: BATCH VOTE ON COMPLAINT
+# ============================================
+
+# Max votes accepted by one batch vote request
+MAX_BATCH_VOTES = 500
+
+@router.post(
+    "/vote/batch",
+    summary="Cast several votes on a complaint at once",
+    description="Apply many students' votes to one complaint in a single transaction"
+)
+async def vote_on_complaint_batch(
+    batch: BatchVoteRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Vote on a complaint for many students in one round trip
+    
+    **Features:**
+    - Same toggle/change rules as /vote, applied in order
+    - One database transaction for the whole batch
+    - One WebSocket broadcast and one priority recalculation
+    
+    **Request Body:**
+    - complaint_id: Complaint UUID
+    - votes: List of {roll_number, vote_type}
+    
+    **Returns:**
+    Created/updated/deleted counts + final vote counts + priority changes
+    """
+    if not batch.votes:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No votes provided"
+        )
+    
+    if len(batch.votes) > MAX_BATCH_VOTES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_BATCH_VOTES} votes per batch"
+        )
+    
+    try:
+        db_service = DatabaseService(db)
+        
+        # Resolve (or create) every voter in one query
+        students = await db_service.get_or_create_voters(
+            [v.roll_number for v in batch.votes]
+        )
+        
+        result = await db_service.vote_on_complaint_batch(
+            complaint_id=batch.complaint_id,
+            votes=[(students[v.roll_number].id, v.vote_type) for v in batch.votes]
+        )
+        
+        if not result["success"]:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=result["message"]
+            )
+        
+        # Broadcast real-time update via WebSocket
+        await send_vote_update(
+            complaint_id=batch.complaint_id,
+            upvotes=result["upvotes"],
+            downvotes=result["downvotes"],
+            action="batch",
+            priority_updated=result["priority_updated"],
+            new_priority=result["new_priority"]
+        )
+        
+        logger.info(f"🗳️ Vote batch of {len(batch.votes)} on {batch.complaint_id}")
+        
+        response = {
+            "success": True,
+            "message": result["message"],
+            "created": result["created"],
+            "updated": result["updated"],
+            "deleted": result["deleted"],
+            "upvotes": result["upvotes"],
+            "downvotes": result["downvotes"],
+            "net_votes": result["upvotes"] - result["downvotes"],
+            "priority_updated": result["priority_updated"]
+        }
+        
+        if result["priority_updated"]:
+            response["old_priority"] = result["old_priority"]
+            response["new_priority"] = result["new_priority"]
+            logger.info(f"📊 Priority auto-updated: {result['old_priority']} → {result['new_priority']}")
+        
+        return response
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Vote batch error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Vote batch error: {str(e)}"
+        )
+
 # ============================================
 # ENDPOINT 6: GET VOTE STATISTICS
 # ============================================
@@ -621,7 +902,7 @@ async def websocket_vote_endpoint(
     - Broadcast to all connected clients
     """
     # Connect client
-    await manager.connect(websocket, complaint_id)
+    conn_id = await manager.connect(websocket, complaint_id)
     logger.info(f"🔌 WebSocket connected for complaint {complaint_id}")
     
     try:
@@ -631,18 +912,18 @@ async def websocket_vote_endpoint(
             
             # Handle ping/pong for keep-alive
             if data == "ping":
-                await websocket.send_json({"type": "pong", "timestamp": datetime.utcnow().isoformat()})
+                await manager.send_personal_message(conn_id, {"type": "pong", "timestamp": datetime.utcnow()})
             
             # Optional: handle other client messages
             else:
                 logger.debug(f"📨 Received from client: {data}")
     
     except WebSocketDisconnect:
-        await manager.disconnect(websocket, complaint_id)
+        await manager.disconnect(conn_id, complaint_id)
         logger.info(f"🔌 WebSocket disconnected for complaint {complaint_id}")
     except Exception as e:
         logger.error(f"❌ WebSocket error: {e}")
-        await manager.disconnect(websocket, complaint_id)
+        await manager.disconnect(conn_id, complaint_id)
 
 # ============================================
 # ENDPOINT 8: UPDATE COMPLAINT STATUS (NEW!)
@@ -705,16 +986,13 @@ async def update_complaint_status(
         logger.info(f"✏️  Status updated: {update.complaint_id} → {update.new_status}")
         
         # Broadcast status change via WebSocket
-        await manager.broadcast_status_update(
+        await send_status_update(
             complaint_id=update.complaint_id,
-            status_data={
-                "old_status": old_status,
-                "new_status": update.new_status,
-                "updated_by": authority.name,
-                "updated_by_roll": authority.roll_number,
-                "reason": update.reason,
-                "timestamp": datetime.utcnow().isoformat()
-            }
+            old_status=old_status,
+            new_status=update.new_status,
+            updated_by=authority.name,
+            reason=update.reason,
+            updated_by_roll=authority.roll_number
         )
         
         return {
@@ -940,6 +1218,85 @@ async def recalculate_priority(
 # BONUS ENDPOINTS
 # ============================================
 
+# Fields the search endpoint can project; `fields` selects a subset
+_SEARCH_FIELD_GETTERS = {
+    "complaint_id": lambda c: c.id,
+    "title": lambda c: c.title,
+    "description": lambda c: c.description,
+    "status": lambda c: c.status,
+    "priority": lambda c: c.priority,
+    "upvotes": lambda c: c.upvotes,
+    "downvotes": lambda c: c.downvotes,
+    "category": lambda c: c.llm_category,
+    "student_name": lambda c: c.student.name,
+    "department": lambda c: c.student.department,
+    "submitted_at": lambda c: c.submitted_at.isoformat()
+}
+_SEARCH_STUDENT_FIELDS = frozenset({"student_name", "department"})
+
+@router.get(
+    "/search",
+    summary="Search complaints",
+    description="Search public complaints by keyword, optionally returning only selected fields"
+)
+async def search_complaints(
+    query: str = Query(..., min_length=1, max_length=100, description="Search keyword"),
+    limit: int = Query(20, ge=1, le=100, description="Max results"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return (default: all)"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Search public complaints by title or description
+    
+    **Query Parameters:**
+    - query: Search keyword
+    - limit: Max results (default: 20, max: 100)
+    - fields: Comma-separated projection, e.g. `title,description`
+    
+    **Returns:**
+    Matching complaints containing only the requested fields
+    """
+    if fields:
+        requested = list(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+        unknown = [f for f in requested if f not in _SEARCH_FIELD_GETTERS]
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields: {', '.join(unknown)}"
+            )
+    else:
+        requested = list(_SEARCH_FIELD_GETTERS)
+    
+    try:
+        db_service = DatabaseService(db)
+        
+        # Skip the student join entirely when no student field is requested
+        complaints = await db_service.search_complaints(
+            query=query,
+            limit=limit,
+            include_student=not _SEARCH_STUDENT_FIELDS.isdisjoint(requested),
+            public_only=True
+        )
+        
+        getters = [(name, _SEARCH_FIELD_GETTERS[name]) for name in requested]
+        complaint_list = [{name: get(c) for name, get in getters} for c in complaints]
+        
+        logger.info(f"🔎 Search '{query}' matched {len(complaint_list)} complaints")
+        
+        return {
+            "success": True,
+            "count": len(complaint_list),
+            "query": query,
+            "complaints": complaint_list
+        }
+    
+    except Exception as e:
+        logger.error(f"❌ Error searching complaints: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error searching complaints: {str(e)}"
+        )
+
 @router.get(
     "/stats",
     summary="Get overall statistics",
@@ -4,7 +4,6 @@ FastAPI server with PostgreSQL, WebSocket, and LLM integration
 """
 
 import os
-import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -17,7 +16,8 @@ from dotenv import load_dotenv
 # Import local modules
 from database import init_db, close_db, check_db_connection, engine
 from api.routes import router
-from websocket_handler import manager, periodic_cleanup_task
+from websocket_handler import manager
+from services.llm_service import close_groq_clients, open_llm_cache, close_llm_cache
 
 # Load environment variables
 load_dotenv()
@@ -83,11 +83,6 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"❌ Database initialization failed: {e}")
     
-    # Start background tasks
-    logger.info("🔄 Starting background tasks...")
-    cleanup_task = asyncio.create_task(periodic_cleanup_task())
-    logger.info("✅ Background tasks started")
-    
     # Check LLM service
     groq_key = os.getenv("GROQ_API_KEY")
     if groq_key:
@@ -95,6 +90,9 @@ async def lifespan(app: FastAPI):
     else:
         logger.warning("⚠️  Groq API key not found - LLM features disabled")
     
+    # Open the LLM response cache now rather than on the first complaint
+    open_llm_cache()
+    
     # Startup complete
     logger.info("=" * 60)
     logger.info("✅ CAMPUSVOICE BACKEND READY!")
@@ -109,19 +107,17 @@ async def lifespan(app: FastAPI):
     logger.info("🛑 CAMPUSVOICE BACKEND SHUTTING DOWN")
     logger.info("=" * 60)
     
-    # Cancel background tasks
-    logger.info("⏹️  Stopping background tasks...")
-    cleanup_task.cancel()
-    try:
-        await cleanup_task
-    except asyncio.CancelledError:
-        logger.info("✅ Background tasks stopped")
-    
     # Disconnect all WebSocket clients
     logger.info("🔌 Disconnecting WebSocket clients...")
     await manager.disconnect_all()
     logger.info("✅ All WebSocket clients disconnected")
     
+    # Close pooled LLM client connections
+    logger.info("🤖 Closing LLM client connections...")
+    await close_groq_clients()
+    close_llm_cache()
+    logger.info("✅ LLM client connections closed")
+    
     # Close database connections
     logger.info("🗄️  Closing database connections...")
     await close_db()
@@ -357,6 +353,10 @@ if __name__ == "__main__":
     workers = int(os.getenv("WORKERS", "1"))  # Change to 1 for WebSocket testing
     reload = False  # ← CHANGE THIS TO False for WebSocket testing
     
+    # uvloop ships with uvicorn[standard]; "auto" falls back to asyncio where
+    # it is unavailable (e.g. Windows). Set EVENT_LOOP=uvloop to require it.
+    loop = os.getenv("EVENT_LOOP", "auto")
+    
     # Run server
     uvicorn.run(
         "main:app",
@@ -364,6 +364,11 @@ if __name__ == "__main__":
         port=port,
         reload=reload,
         workers=1,  # Must be 1 for WebSocket
+        loop=loop,
+        # Dead WebSocket clients are detected with protocol-level PING frames;
+        # a missed PONG closes the socket and the endpoint disconnects it
+        ws_ping_interval=20.0,
+        ws_ping_timeout=10.0,
         log_level=os.getenv("LOG_LEVEL", "info").lower(),
         access_log=True,
         use_colors=True
@@ -123,6 +123,41 @@ class DatabaseService:
         result = await self.db.execute(stmt)
         return result.scalars().first()
     
+    async def get_or_create_voters(self, roll_numbers: List[str]) -> Dict[str, StudentDB]:
+        """
+        Resolve many roll numbers to students in one query, creating
+        minimal records for the ones that do not exist yet
+        
+        Args:
+            roll_numbers: Student roll numbers
+        
+        Returns:
+            dict: roll_number -> StudentDB
+        """
+        wanted = set(roll_numbers)
+        stmt = select(StudentDB).where(StudentDB.roll_number.in_(wanted))
+        result = await self.db.execute(stmt)
+        students = {s.roll_number: s for s in result.scalars().all()}
+        
+        missing = [
+            StudentDB(
+                roll_number=roll_number,
+                name="Student",
+                email=f"{roll_number}@srec.ac.in",
+                department="Unknown"
+            )
+            for roll_number in wanted - students.keys()
+        ]
+        
+        if missing:
+            self.db.add_all(missing)
+            await self.db.commit()
+            for student in missing:
+                students[student.roll_number] = student
+            logger.info(f"✅ Created {len(missing)} voter record(s)")
+        
+        return students
+    
     # ============================================
     # COMPLAINT OPERATIONS
     # ============================================
@@ -199,6 +234,23 @@ class DatabaseService:
         result = await self.db.execute(stmt)
         return result.scalars().first()
     
+    async def get_complaints_by_ids(self, complaint_ids: List[str]) -> List[ComplaintDB]:
+        """
+        Get several complaints by ID in one query, student relationship loaded
+        
+        Args:
+            complaint_ids: Complaint UUIDs
+        
+        Returns:
+            List of ComplaintDB found (unordered; missing IDs are skipped)
+        """
+        stmt = select(ComplaintDB).options(
+            selectinload(ComplaintDB.student)
+        ).where(ComplaintDB.id.in_(complaint_ids))
+        
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+    
     async def get_student_complaints(
         self,
         student_id: int,
@@ -363,6 +415,59 @@ class DatabaseService:
     # VOTE OPERATIONS (WITH AUTO PRIORITY UPDATE)
     # ============================================
     
+    async def _recalculate_priority(self, complaint: ComplaintDB, old_priority: str) -> bool:
+        """
+        Recalculate a complaint's priority from its current vote counts
+        
+        Args:
+            complaint: Complaint whose counts were just updated
+            old_priority: Priority before the votes were applied
+        
+        Returns:
+            bool: True if the priority changed and was saved
+        """
+        # Only recalculate if we have LLM analysis
+        if not complaint.llm_analysis:
+            return False
+        
+        try:
+            from services.llm_service import LLMService
+            llm_service = LLMService()
+            
+            llm_analysis = json.loads(complaint.llm_analysis)
+            
+            # Calculate new priority score
+            priority_score = await llm_service.calculate_priority_score(
+                analysis=llm_analysis,
+                upvotes=complaint.upvotes,
+                downvotes=complaint.downvotes
+            )
+            
+            # Get new priority label
+            new_priority = llm_service.get_priority_label(priority_score)
+            
+            # Update if changed
+            if new_priority != old_priority:
+                complaint.priority = new_priority
+                
+                # Update llm_priority_score if field exists
+                try:
+                    complaint.llm_priority_score = priority_score
+                except AttributeError:
+                    pass  # Field doesn't exist in model
+                
+                self.db.add(complaint)
+                await self.db.commit()
+                await self.db.refresh(complaint)
+                
+                logger.info(f"📊 Priority auto-updated: {old_priority} → {new_priority} (score: {priority_score})")
+                return True
+        
+        except Exception as e:
+            logger.warning(f"Could not recalculate priority: {e}")
+        
+        return False
+    
     async def vote_on_complaint(
         self,
         complaint_id: str,
@@ -480,47 +585,9 @@ class DatabaseService:
             # AUTO-RECALCULATE PRIORITY BASED ON VOTES
             # ============================================
             
-            priority_updated = False
+            priority_updated = await self._recalculate_priority(complaint, old_priority)
             new_priority = complaint.priority
             
-            # Only recalculate if we have LLM analysis
-            if complaint.llm_analysis:
-                try:
-                    from services.llm_service import LLMService
-                    llm_service = LLMService()
-                    
-                    llm_analysis = json.loads(complaint.llm_analysis)
-                    
-                    # Calculate new priority score
-                    priority_score = await llm_service.calculate_priority_score(
-                        analysis=llm_analysis,
-                        upvotes=complaint.upvotes,
-                        downvotes=complaint.downvotes
-                    )
-                    
-                    # Get new priority label
-                    new_priority = llm_service.get_priority_label(priority_score)
-                    
-                    # Update if changed
-                    if new_priority != old_priority:
-                        complaint.priority = new_priority
-                        
-                        # Update llm_priority_score if field exists
-                        try:
-                            complaint.llm_priority_score = priority_score
-                        except AttributeError:
-                            pass  # Field doesn't exist in model
-                        
-                        self.db.add(complaint)
-                        await self.db.commit()
-                        await self.db.refresh(complaint)
-                        priority_updated = True
-                        
-                        logger.info(f"📊 Priority auto-updated: {old_priority} → {new_priority} (score: {priority_score})")
-                
-                except Exception as e:
-                    logger.warning(f"Could not recalculate priority: {e}")
-            
             logger.info(f"✅ Vote {action}: {vote_type} on complaint {complaint_id}")
             
             return {
@@ -543,6 +610,139 @@ class DatabaseService:
                 "action": None
             }
     
+    async def vote_on_complaint_batch(
+        self,
+        complaint_id: str,
+        votes: List[tuple]
+    ) -> Dict:
+        """
+        Apply many votes to one complaint in a single transaction
+        
+        Each vote follows the same toggle rules as vote_on_complaint, in
+        order; a student listed more than once gets the net result (the
+        counts below are net changes). The priority is recalculated once
+        at the end.
+        
+        Args:
+            complaint_id: Complaint UUID
+            votes: List of (student_id, vote_type)
+        
+        Returns:
+            dict: {
+                "success": bool,
+                "message": str,
+                "created": int,
+                "updated": int,
+                "deleted": int,
+                "upvotes": int,
+                "downvotes": int,
+                "priority_updated": bool,
+                "old_priority": str,
+                "new_priority": str
+            }
+        """
+        try:
+            complaint = await self.get_complaint(complaint_id)
+            if not complaint:
+                return {
+                    "success": False,
+                    "message": "Complaint not found"
+                }
+            
+            # Fetch every existing vote for these students at once
+            stmt = select(VoteDB).where(
+                and_(
+                    VoteDB.complaint_id == complaint_id,
+                    VoteDB.student_id.in_({student_id for student_id, _ in votes})
+                )
+            )
+            result = await self.db.execute(stmt)
+            existing = {v.student_id: v for v in result.scalars().all()}
+            
+            old_priority = complaint.priority
+            counts = {"created": 0, "updated": 0, "deleted": 0}
+            
+            # Play the toggle rules through in order first, so a student who
+            # appears more than once ends with one net change. Applying each
+            # vote directly would delete a vote added earlier in the same
+            # batch (never flushed), or insert a row that a pending delete
+            # still holds under unique_vote_per_user.
+            final = {student_id: vote.vote_type for student_id, vote in existing.items()}
+            for student_id, vote_type in votes:
+                final[student_id] = None if final.get(student_id) == vote_type else vote_type
+            
+            for student_id, vote_type in final.items():
+                existing_vote = existing.get(student_id)
+                if vote_type == (existing_vote.vote_type if existing_vote else None):
+                    continue
+                
+                # CASE 1: No existing vote - CREATE NEW
+                if not existing_vote:
+                    vote = VoteDB(
+                        complaint_id=complaint_id,
+                        student_id=student_id,
+                        vote_type=vote_type
+                    )
+                    if vote_type == "upvote":
+                        complaint.upvotes += 1
+                    else:
+                        complaint.downvotes += 1
+                    
+                    self.db.add(vote)
+                    counts["created"] += 1
+                
+                # CASE 2: Toggled off - REMOVE VOTE
+                elif vote_type is None:
+                    if existing_vote.vote_type == "upvote":
+                        complaint.upvotes = max(0, complaint.upvotes - 1)
+                    else:
+                        complaint.downvotes = max(0, complaint.downvotes - 1)
+                    
+                    await self.db.delete(existing_vote)
+                    counts["deleted"] += 1
+                
+                # CASE 3: Different vote type - CHANGE VOTE
+                else:
+                    if existing_vote.vote_type == "upvote":
+                        complaint.upvotes = max(0, complaint.upvotes - 1)
+                        complaint.downvotes += 1
+                    else:
+                        complaint.downvotes = max(0, complaint.downvotes - 1)
+                        complaint.upvotes += 1
+                    
+                    existing_vote.vote_type = vote_type
+                    counts["updated"] += 1
+            
+            self.db.add(complaint)
+            await self.db.commit()
+            await self.db.refresh(complaint)
+            
+            priority_updated = await self._recalculate_priority(complaint, old_priority)
+            
+            logger.info(
+                f"✅ Vote batch on complaint {complaint_id}: "
+                f"{counts['created']} created, {counts['updated']} updated, {counts['deleted']} deleted"
+            )
+            
+            return {
+                "success": True,
+                "message": f"{len(votes)} vote(s) applied",
+                **counts,
+                "upvotes": complaint.upvotes,
+                "downvotes": complaint.downvotes,
+                "priority_updated": priority_updated,
+                "old_priority": old_priority if priority_updated else None,
+                "new_priority": complaint.priority if priority_updated else None
+            }
+        
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"❌ Vote batch error: {e}")
+            return {
+                "success": False,
+                "message": f"Vote batch error: {str(e)}"
+            }
+    
     async def get_user_vote(
         self,
         complaint_id: str,
@@ -739,7 +939,9 @@ class DatabaseService:
     async def search_complaints(
         self,
         query: str,
-        limit: int = 20
+        limit: int = 20,
+        include_student: bool = True,
+        public_only: bool = False
     ) -> List[ComplaintDB]:
         """
         Search complaints by title or description
@@ -747,15 +949,23 @@ class DatabaseService:
         Args:
             query: Search query
             limit: Max results
+            include_student: Eager-load the student relationship
+            public_only: Only match public complaints
         
         Returns:
             List of matching complaints
         """
         search_pattern = f"%{query}%"
         
-        stmt = select(ComplaintDB).options(
-            selectinload(ComplaintDB.student)
-        ).where(
+        stmt = select(ComplaintDB)
+        
+        if include_student:
+            stmt = stmt.options(selectinload(ComplaintDB.student))
+        
+        if public_only:
+            stmt = stmt.where(ComplaintDB.visibility == "Public")
+        
+        stmt = stmt.where(
             or_(
                 ComplaintDB.title.ilike(search_pattern),
                 ComplaintDB.description.ilike(search_pattern)
@@ -3,14 +3,20 @@ LLM Service for Complaint Analysis
 Groq API integration for intelligent complaint processing
 """
 
-from groq import Groq
-import json
+from groq import AsyncGroq, RateLimitError
+import httpx
+import orjson
 import os
-from typing import Dict, Optional
+from typing import AsyncIterator, Dict, Optional, Tuple
 import logging
 from dotenv import load_dotenv
 import asyncio
-from functools import wraps
+import hashlib
+import diskcache
+import sqlite3
+import time
+from collections import OrderedDict
+from types import MappingProxyType
 
 # Load environment variables
 load_dotenv()
@@ -20,19 +26,329 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # ============================================
-# ASYNC WRAPPER FOR GROQ (Sync to Async)
+# PERSISTENT RESPONSE CACHE
 # ============================================
 
-def async_wrap(func):
+# Raw JSON responses keyed by (model, content hash); survives restarts and
+# is shared by every worker process on the host. Lives in a private
+# per-user directory, never a shared one like /tmp: diskcache unpickles
+# what it reads, so whoever can write there can run code in the server.
+_CACHE_HOME = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+LLM_CACHE_DIR = os.getenv("LLM_CACHE_DIR") or os.path.join(_CACHE_HOME, "campusvoice", "llm")
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", str(7 * 86400)))  # 7 days
+
+# Opened by open_llm_cache() (on startup, or on first use), not at import
+_llm_cache: Optional[diskcache.Cache] = None
+_llm_cache_failed = False
+
+def open_llm_cache() -> Optional[diskcache.Cache]:
+    """
+    Open the persistent response cache (safe to call repeatedly)
+    
+    The directory is created, or tightened, to mode 0700. If that fails
+    (e.g. it belongs to another user), analysis runs without the disk tier.
+    
+    Returns:
+        diskcache.Cache: The open cache, or None if it is unavailable
+    """
+    global _llm_cache, _llm_cache_failed
+    if _llm_cache is None and not _llm_cache_failed:
+        try:
+            os.makedirs(LLM_CACHE_DIR, mode=0o700, exist_ok=True)
+            os.chmod(LLM_CACHE_DIR, 0o700)
+            _llm_cache = diskcache.Cache(LLM_CACHE_DIR, size_limit=1 << 30)  # 1 GB
+            logger.info(f"✅ LLM disk cache opened at {LLM_CACHE_DIR}")
+        except (OSError, sqlite3.Error) as e:
+            _llm_cache_failed = True
+            logger.error(f"❌ LLM disk cache unavailable at {LLM_CACHE_DIR}: {e}")
+    return _llm_cache
+
+# Errors a cache read/write can raise; analysis carries on without the cache
+_CACHE_ERRORS = (diskcache.Timeout, sqlite3.Error, OSError)
+
+async def _disk_cache_get(key: str) -> Optional[str]:
+    """
+    Read a raw response from the disk cache in a worker thread
+    
+    SQLite can block for up to diskcache's lock timeout when several
+    workers share the cache, so it is never read on the event loop.
+    
+    Returns:
+        str: Cached raw JSON, or None on a miss or cache error
+    """
+    disk_cache = open_llm_cache()
+    if disk_cache is None:
+        return None
+    try:
+        return await asyncio.to_thread(disk_cache.get, key)
+    except _CACHE_ERRORS as e:
+        logger.warning(f"⚠️  LLM disk cache read failed: {e}")
+        return None
+
+async def _disk_cache_set(key: str, response_text: str):
+    """Write a raw response to the disk cache in a worker thread (errors are logged)"""
+    disk_cache = open_llm_cache()
+    if disk_cache is None:
+        return
+    try:
+        await asyncio.to_thread(disk_cache.set, key, response_text, expire=LLM_CACHE_TTL)
+    except _CACHE_ERRORS as e:
+        logger.warning(f"⚠️  LLM disk cache write failed: {e}")
+
+def close_llm_cache():
+    """
+    Close the persistent response cache
+    
+    Call this on application shutdown
+    """
+    global _llm_cache
+    if _llm_cache is not None:
+        _llm_cache.close()
+        _llm_cache = None
+
+# ============================================
+# IN-PROCESS RESPONSE CACHE
+# ============================================
+
+# Hot tier in front of the disk cache, same keys; repeats of a complaint
+# are answered without touching SQLite or re-parsing the raw response
+LLM_MEMORY_CACHE_SIZE = int(os.getenv("LLM_MEMORY_CACHE_SIZE", "4096"))
+
+class _MemoryCache:
+    """
+    Bounded in-memory LRU of expanded analyses
+    
+    Values are stored orjson-encoded so every hit hands the caller its own
+    copy (callers are free to mutate the analysis they receive). Entries
+    expire after ttl seconds, like the disk tier's.
     """
-    Decorator to run sync functions in async context
-    Groq SDK is synchronous, so we wrap it for async usage
+    
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # key -> (monotonic insert time, encoded analysis)
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """Return a fresh copy of the cached analysis, or None if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, payload = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return orjson.loads(payload)
+    
+    def put(self, key: str, analysis: Dict):
+        """Store an analysis, evicting the least recently used over capacity"""
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = (time.monotonic(), orjson.dumps(analysis))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+_memory_cache = _MemoryCache(LLM_MEMORY_CACHE_SIZE, LLM_CACHE_TTL)
+
+# Fields an analysis must contain to be considered valid
+_REQUIRED_ANALYSIS_FIELDS = frozenset({"priority", "category", "summary"})
+
+# Shared read-only fallback template (key_issues is a tuple so the
+# shallow copies handed to callers never share a mutable list)
+_FALLBACK_ANALYSIS = MappingProxyType({
+    "priority": "medium",
+    "category": "other",
+    "sentiment": "neutral",
+    "urgency_score": 50,
+    "impact_level": "individual",
+    "summary": "Complaint requires manual review",
+    "key_issues": ("Manual review required",),
+    "suggested_authority": "Student Affairs Officer"
+})
+
+# ============================================
+# PROMPT TEMPLATES
+# ============================================
+
+# Built once at import; per call only the complaint fields are substituted
+# with %-formatting (the JSON braces below need no escaping)
+ANALYZE_PROMPT_TEMPLATE = """Analyze this campus complaint and provide a structured response.
+
+Complaint Title: %s
+Complaint Description: %s
+
+You are analyzing a complaint from an engineering college campus. Carefully categorize based on these rules:
+
+CATEGORY RULES (VERY IMPORTANT):
+- "food": Mess, canteen, food quality, hygiene, menu, food timing, dining hall issues
+- "infrastructure": Buildings, classrooms, labs, maintenance, AC, fans, lights, electricity, water supply, furniture, equipment, wifi (except hostel wifi), library infrastructure (AC, furniture, space)
+- "academic": Classes, exams, faculty, curriculum, library BOOKS/RESOURCES, timetable, course content
+- "hostel": Hostel rooms, hostel facilities, hostel mess, hostel rules, roommates, hostel wifi, hostel maintenance
+- "transport": College bus, transport timing, vehicle issues, parking, shuttle service
+- "other": Everything else not clearly fitting above
+
+PRIORITY RULES:
+- "critical": Safety hazards, health emergencies, major infrastructure failure affecting many students, fire/electrical hazards
+- "high": Significant disruption to academics or daily life, urgent repairs needed, affecting multiple people or important facilities
+- "medium": Moderate issues that need attention but not urgent, affecting individuals or small groups, quality issues
+- "low": Minor inconveniences, suggestions, cosmetic issues, low-impact problems
+
+IMPORTANT EXAMPLES:
+- "Library AC not working" = INFRASTRUCTURE (not academic)
+- "Library books missing" = ACADEMIC (not infrastructure)
+- "Mess food quality" = FOOD
+- "Hostel wifi slow" = HOSTEL (not infrastructure)
+- "Classroom projector broken" = INFRASTRUCTURE
+- "Professor teaching method" = ACADEMIC
+
+Provide analysis in the following JSON format ONLY (no other text), using exactly these short keys:
+{
+    "p": "low" | "medium" | "high" | "critical",
+    "c": "food" | "infrastructure" | "academic" | "hostel" | "transport" | "other",
+    "s": "negative" | "neutral" | "positive",
+    "u": 0-100 urgency score,
+    "i": "individual" | "group" | "campus-wide",
+    "sm": "Brief 1-sentence summary of the core issue",
+    "k": ["at most 3 short key issues"],
+    "a": "Name of the department/authority that should handle this"
+}
+
+Be very careful with categorization. Think step by step about which category fits best."""
+
+RESOLUTION_PROMPT_TEMPLATE = """Suggest actionable resolution steps for this campus complaint.
+
+Title: %s
+Description: %s
+Category: %s
+
+Provide 3-5 specific, actionable steps that the assigned authority can take to resolve this issue.
+Format as a numbered list. Be practical and campus-specific."""
+
+_ANALYZE_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a campus complaint analysis system for an engineering college. Provide structured, accurate JSON responses ONLY. Pay close attention to proper categorization based on the rules provided."
+}
+
+_RESOLUTION_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a campus administration advisor. Provide practical, actionable resolution steps."
+}
+
+# ============================================
+# PROMPT INPUT TRIMMING
+# ============================================
+
+# Description budget sent to the LLM, at ~4 chars/token: the first 384 and
+# last 128 tokens are kept, which is where complaints state the problem and
+# the ask. Descriptions within the budget are passed through untouched.
+DESCRIPTION_HEAD_CHARS = 384 * 4
+DESCRIPTION_TAIL_CHARS = 128 * 4
+_TRUNCATION_MARKER = " …[truncated]… "
+
+def _truncate_text(
+    text: str,
+    head: int = DESCRIPTION_HEAD_CHARS,
+    tail: int = DESCRIPTION_TAIL_CHARS
+) -> str:
+    """
+    Trim text to head + tail characters, keeping both ends
+    
+    Args:
+        text: Text to trim
+        head: Characters to keep from the start
+        tail: Characters to keep from the end
+    
+    Returns:
+        str: Original text, or head + marker + tail when over budget
+    """
+    if len(text) <= head + tail:
+        return text
+    return f"{text[:head]}{_TRUNCATION_MARKER}{text[-tail:]}"
+
+# ============================================
+# COMPACT RESPONSE SCHEMA
+# ============================================
+
+# The model answers with short keys to cut output tokens; they are expanded
+# back to the public analysis schema right after parsing
+_SHORT_KEYS = MappingProxyType({
+    "p": "priority",
+    "c": "category",
+    "s": "sentiment",
+    "u": "urgency_score",
+    "i": "impact_level",
+    "sm": "summary",
+    "k": "key_issues",
+    "a": "suggested_authority"
+})
+MAX_KEY_ISSUES = 3
+
+def _expand_field(key: str, value):
+    """Map a short response key to its public name (and cap key_issues)"""
+    key = _SHORT_KEYS.get(key, key)
+    if key == "key_issues" and isinstance(value, list):
+        value = value[:MAX_KEY_ISSUES]
+    return key, value
+
+def _expand_analysis(raw: Dict) -> Dict:
+    """
+    Expand a compact LLM response into the public analysis schema
+    
+    Long keys pass through unchanged, so cache entries written before the
+    compact schema still load correctly
     """
-    @wraps(func)
-    async def wrapper(*args, **kwargs):
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, lambda: func(*args, **kwargs))
-    return wrapper
+    return dict(_expand_field(key, value) for key, value in raw.items())
+
+# ============================================
+# SHARED GROQ CLIENT (connection pooling)
+# ============================================
+
+# One AsyncGroq client per API key, reused by every LLMService instance so
+# TLS sessions and HTTP/2 connections survive across requests
+_GROQ_CLIENTS: Dict[str, AsyncGroq] = {}
+
+# Retries on 408/409/429/5xx and connection errors are handled by the SDK:
+# exponential backoff (0.5s initial, 8s cap) with jitter, preferring the
+# server's Retry-After header when Groq rate-limits us
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "3"))
+
+def get_groq_client(api_key: str) -> AsyncGroq:
+    """
+    Get the shared AsyncGroq client for an API key (created on first use)
+    
+    Args:
+        api_key: Groq API key
+    
+    Returns:
+        AsyncGroq: Client backed by a pooled HTTP/2 httpx.AsyncClient
+    """
+    client = _GROQ_CLIENTS.get(api_key)
+    if client is None:
+        http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=30
+        )
+        client = AsyncGroq(
+            api_key=api_key,
+            http_client=http_client,
+            max_retries=LLM_MAX_RETRIES
+        )
+        _GROQ_CLIENTS[api_key] = client
+        logger.info("✅ Groq client pool created (HTTP/2)")
+    return client
+
+async def close_groq_clients():
+    """
+    Close all shared Groq clients
+    
+    Call this on application shutdown
+    """
+    for client in _GROQ_CLIENTS.values():
+        await client.close()
+    _GROQ_CLIENTS.clear()
 
 # ============================================
 # LLM SERVICE CLASS
@@ -56,7 +372,7 @@ class LLMService:
         api_key: Optional[str] = None,
         model: Optional[str] = None,
         temperature: float = 0.1,  # Lower for consistent categorization
-        max_tokens: int = 500
+        max_tokens: int = 220  # Compact JSON answer is ~150 tokens
     ):
         """
         Initialize LLM service
@@ -76,7 +392,7 @@ class LLMService:
             logger.warning("⚠️  GROQ_API_KEY not found. LLM features will be disabled.")
             self.client = None
         else:
-            self.client = Groq(api_key=self.api_key)
+            self.client = get_groq_client(self.api_key)
             logger.info(f"✅ Groq LLM initialized with model: {self.model}")
     
     def _is_available(self) -> bool:
@@ -87,68 +403,57 @@ class LLMService:
     # IMPROVED COMPLAINT ANALYSIS
     # ============================================
     
-    @async_wrap
-    def _sync_analyze_complaint(self, title: str, description: str) -> Dict:
+    def _cache_key(self, title: str, description: str) -> str:
         """
-        Synchronous complaint analysis (wrapped for async)
+        Build the response cache key for a complaint
+        
+        Keyed by model as well as content so switching LLM_MODEL never
+        serves answers produced by a different model
+        """
+        digest = hashlib.blake2b(
+            f"{title}\x00{description}".encode("utf-8"),
+            digest_size=16
+        ).hexdigest()
+        return f"analysis:{self.model}:{digest}"
+    
+    def _analysis_messages(self, title: str, description: str) -> list:
+        """
+        Build the chat messages for complaint analysis
+        """
+        description = _truncate_text(description)
+        prompt = ANALYZE_PROMPT_TEMPLATE % (title, description)
+        
+        return [
+            _ANALYZE_SYSTEM_MESSAGE,
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ]
+    
+    async def _analyze_with_llm(self, title: str, description: str) -> Dict:
+        """
+        Complaint analysis via the Groq API
         
         Internal method - use analyze_complaint() instead
         """
-        prompt = f"""Analyze this campus complaint and provide a structured response.
-
-Complaint Title: {title}
-Complaint Description: {description}
-
-You are analyzing a complaint from an engineering college campus. Carefully categorize based on these rules:
-
-CATEGORY RULES (VERY IMPORTANT):
-- "food": Mess, canteen, food quality, hygiene, menu, food timing, dining hall issues
-- "infrastructure": Buildings, classrooms, labs, maintenance, AC, fans, lights, electricity, water supply, furniture, equipment, wifi (except hostel wifi), library infrastructure (AC, furniture, space)
-- "academic": Classes, exams, faculty, curriculum, library BOOKS/RESOURCES, timetable, course content
-- "hostel": Hostel rooms, hostel facilities, hostel mess, hostel rules, roommates, hostel wifi, hostel maintenance
-- "transport": College bus, transport timing, vehicle issues, parking, shuttle service
-- "other": Everything else not clearly fitting above
-
-PRIORITY RULES:
-- "critical": Safety hazards, health emergencies, major infrastructure failure affecting many students, fire/electrical hazards
-- "high": Significant disruption to academics or daily life, urgent repairs needed, affecting multiple people or important facilities
-- "medium": Moderate issues that need attention but not urgent, affecting individuals or small groups, quality issues
-- "low": Minor inconveniences, suggestions, cosmetic issues, low-impact problems
-
-IMPORTANT EXAMPLES:
-- "Library AC not working" = INFRASTRUCTURE (not academic)
-- "Library books missing" = ACADEMIC (not infrastructure)
-- "Mess food quality" = FOOD
-- "Hostel wifi slow" = HOSTEL (not infrastructure)
-- "Classroom projector broken" = INFRASTRUCTURE
-- "Professor teaching method" = ACADEMIC
-
-Provide analysis in the following JSON format ONLY (no other text):
-{{
-    "priority": "low" | "medium" | "high" | "critical",
-    "category": "food" | "infrastructure" | "academic" | "hostel" | "transport" | "other",
-    "sentiment": "negative" | "neutral" | "positive",
-    "urgency_score": 0-100,
-    "impact_level": "individual" | "group" | "campus-wide",
-    "summary": "Brief 1-sentence summary of the core issue",
-    "key_issues": ["issue1", "issue2", "issue3"],
-    "suggested_authority": "Name of the department/authority that should handle this"
-}}
-
-Be very careful with categorization. Think step by step about which category fits best."""
-
+        cache_key = self._cache_key(title, description)
+        
         try:
-            chat_completion = self.client.chat.completions.create(
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a campus complaint analysis system for an engineering college. Provide structured, accurate JSON responses ONLY. Pay close attention to proper categorization based on the rules provided."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
+            remembered = _memory_cache.get(cache_key)
+            if remembered is not None:
+                logger.info("⚡ LLM memory cache hit")
+                return remembered
+            
+            cached = await _disk_cache_get(cache_key)
+            if cached is not None:
+                logger.info("⚡ LLM cache hit")
+                analysis = _expand_analysis(orjson.loads(cached))
+                _memory_cache.put(cache_key, analysis)
+                return analysis
+            
+            chat_completion = await self.client.chat.completions.create(
+                messages=self._analysis_messages(title, description),
                 model=self.model,
                 temperature=self.temperature,  # Low temperature for consistency
                 max_tokens=self.max_tokens,
@@ -157,16 +462,24 @@ Be very careful with categorization. Think step by step about which category fit
             
             # Parse response
             response_text = chat_completion.choices[0].message.content
-            analysis = json.loads(response_text)
+            analysis = _expand_analysis(orjson.loads(response_text))
+            
+            # Store the raw JSON string (no pickling) only after it parsed
+            await _disk_cache_set(cache_key, response_text)
+            _memory_cache.put(cache_key, analysis)
             
             logger.info(f"✅ LLM Analysis complete: Priority={analysis.get('priority')}, Category={analysis.get('category')}")
             
             return analysis
         
-        except json.JSONDecodeError as e:
+        except (orjson.JSONDecodeError, ValueError) as e:
             logger.error(f"❌ JSON parse error: {e}")
             return self._get_fallback_analysis()
         
+        except RateLimitError as e:
+            logger.warning(f"⚠️  LLM rate limited after {LLM_MAX_RETRIES} retries: {e}")
+            return self._get_fallback_analysis()
+        
         except Exception as e:
             logger.error(f"❌ LLM API error: {e}")
             return self._get_fallback_analysis()
@@ -196,7 +509,7 @@ Be very careful with categorization. Think step by step about which category fit
             return self._get_fallback_analysis()
         
         try:
-            return await self._sync_analyze_complaint(title, description)
+            return await self._analyze_with_llm(title, description)
         except Exception as e:
             logger.error(f"❌ Analysis error: {e}")
             return self._get_fallback_analysis()
@@ -326,27 +639,17 @@ Be very careful with categorization. Think step by step about which category fit
     # RESOLUTION SUGGESTIONS
     # ============================================
     
-    @async_wrap
-    def _sync_suggest_resolution(self, title: str, description: str, category: str) -> str:
+    async def _suggest_with_llm(self, title: str, description: str, category: str) -> str:
         """
-        Synchronous resolution suggestion (wrapped for async)
+        Resolution suggestion via the Groq API
         """
-        prompt = f"""Suggest actionable resolution steps for this campus complaint.
-
-Title: {title}
-Description: {description}
-Category: {category}
-
-Provide 3-5 specific, actionable steps that the assigned authority can take to resolve this issue.
-Format as a numbered list. Be practical and campus-specific."""
+        description = _truncate_text(description)
+        prompt = RESOLUTION_PROMPT_TEMPLATE % (title, description, category)
 
         try:
-            chat_completion = self.client.chat.completions.create(
+            chat_completion = await self.client.chat.completions.create(
                 messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a campus administration advisor. Provide practical, actionable resolution steps."
-                    },
+                    _RESOLUTION_SYSTEM_MESSAGE,
                     {
                         "role": "user",
                         "content": prompt
@@ -381,7 +684,7 @@ Format as a numbered list. Be practical and campus-specific."""
             return "LLM service unavailable. Manual review required."
         
         try:
-            return await self._sync_suggest_resolution(title, description, category)
+            return await self._suggest_with_llm(title, description, category)
         except Exception as e:
             logger.error(f"❌ Suggestion error: {e}")
             return "Error generating suggestions. Manual review required."
@@ -390,6 +693,38 @@ Format as a numbered list. Be practical and campus-specific."""
     # BATCH PROCESSING
     # ============================================
     
+    async def stream_analyze_multiple(
+        self,
+        complaints: list
+    ) -> AsyncIterator[Tuple[int, Dict]]:
+        """
+        Analyze multiple complaints, yielding each result as soon as it lands
+        
+        All analyses run concurrently; results come back in completion order
+        so callers can persist them while slower LLM calls are in flight
+        (see POST /complaints/bulk). Closing the generator early cancels
+        the analyses still running.
+        
+        Args:
+            complaints: List of dicts with 'title' and 'description'
+        
+        Yields:
+            tuple: (index into complaints, analysis result)
+        """
+        async def analyze_indexed(idx: int, complaint: dict) -> Tuple[int, Dict]:
+            return idx, await self.analyze_complaint(
+                complaint["title"], complaint["description"]
+            )
+        
+        tasks = [asyncio.ensure_future(analyze_indexed(i, c)) for i, c in enumerate(complaints)]
+        
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+    
     async def analyze_multiple_complaints(self, complaints: list) -> list:
         """
         Analyze multiple complaints in batch
@@ -400,20 +735,21 @@ Format as a numbered list. Be practical and campus-specific."""
         Returns:
             list: List of analysis results
         """
-        tasks = [
-            self.analyze_complaint(c["title"], c["description"])
-            for c in complaints
-        ]
+        results = [None] * len(complaints)
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        async def analyze_into(idx: int, complaint: dict):
+            # Fill the slot directly; failures fall back in the same pass
+            try:
+                results[idx] = await self.analyze_complaint(
+                    complaint["title"], complaint["description"]
+                )
+            except Exception as e:
+                logger.error(f"❌ Batch analysis error: {e}")
+                results[idx] = self._get_fallback_analysis()
         
-        # Filter out exceptions
-        valid_results = [
-            r if not isinstance(r, Exception) else self._get_fallback_analysis()
-            for r in results
-        ]
+        await asyncio.gather(*(analyze_into(i, c) for i, c in enumerate(complaints)))
         
-        return valid_results
+        return results
     
     # ============================================
     # FALLBACK & UTILITIES
@@ -423,19 +759,14 @@ Format as a numbered list. Be practical and campus-specific."""
         """
         Get fallback analysis when LLM is unavailable
         
+        Callers serialize the result with json.dumps (which rejects
+        mappingproxy), so a shallow dict copy of the frozen template is
+        returned instead of the proxy itself.
+        
         Returns:
             dict: Default analysis structure
         """
-        return {
-            "priority": "medium",
-            "category": "other",
-            "sentiment": "neutral",
-            "urgency_score": 50,
-            "impact_level": "individual",
-            "summary": "Complaint requires manual review",
-            "key_issues": ["Manual review required"],
-            "suggested_authority": "Student Affairs Officer"
-        }
+        return dict(_FALLBACK_ANALYSIS)
     
     async def validate_analysis(self, analysis: Dict) -> bool:
         """
@@ -447,8 +778,7 @@ Format as a numbered list. Be practical and campus-specific."""
         Returns:
             bool: True if valid
         """
-        required_fields = ["priority", "category", "summary"]
-        return all(field in analysis for field in required_fields)
+        return _REQUIRED_ANALYSIS_FIELDS.issubset(analysis)
     
     # ============================================
     # TESTING & DEBUGGING
@@ -488,6 +818,9 @@ Format as a numbered list. Be practical and campus-specific."""
 # CONVENIENCE FUNCTIONS
 # ============================================
 
+# Reused by quick_analyze() so repeated calls share one service and client
+_QUICK_SERVICE: Optional[LLMService] = None
+
 async def quick_analyze(title: str, description: str) -> Dict:
     """
     Quick analysis function for standalone use
@@ -499,8 +832,10 @@ async def quick_analyze(title: str, description: str) -> Dict:
     Returns:
         dict: Analysis result
     """
-    service = LLMService()
-    return await service.analyze_complaint(title, description)
+    global _QUICK_SERVICE
+    if _QUICK_SERVICE is None:
+        _QUICK_SERVICE = LLMService()
+    return await _QUICK_SERVICE.analyze_complaint(title, description)
 
 # ============================================
 # EXPORT
@@ -508,5 +843,9 @@ async def quick_analyze(title: str, description: str) -> Dict:
 
 __all__ = [
     "LLMService",
+    "get_groq_client",
+    "close_groq_clients",
+    "open_llm_cache",
+    "close_llm_cache",
     "quick_analyze"
 ]
@@ -0,0 +1,44 @@
+"""
+pytest glue for the API test suite
+
+Run: pytest tests/test_api.py
+     pytest -n auto --dist loadfile tests/test_api.py   (with pytest-xdist)
+
+The test_* functions in test_api.py assert, so pytest runs them as-is;
+the fixtures below supply the live backend and the shared complaint.
+run_all_tests stays the script entry point.
+"""
+
+import pytest
+import requests
+
+import test_api
+
+# Modules whose tests talk to a running backend; nothing else needs one
+LIVE_API_MODULES = (test_api,)
+
+
+@pytest.fixture(scope="session")
+def live_server():
+    """Skip the requesting tests when the backend is not up"""
+    try:
+        test_api.SESSION.get(f"{test_api.API_URL}/health", timeout=test_api.TIMEOUT)
+    except requests.RequestException:
+        pytest.skip(f"CampusVoice backend not reachable at {test_api.BASE_URL}")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _require_live_server(request):
+    """Request live_server for the live-API modules only"""
+    if request.module in LIVE_API_MODULES:
+        request.getfixturevalue("live_server")
+
+
+@pytest.fixture(scope="session")
+def complaint_id(live_server):
+    """Submit the test complaint once and share its ID with every test"""
+    complaint_id = test_api._submit_complaint()
+    if complaint_id is None:
+        pytest.fail("Test complaint could not be submitted")
+    return complaint_id
+
@@ -5,6 +5,7 @@ import os
 from dotenv import load_dotenv
 from groq import Groq
 import json
+import orjson
 
 load_dotenv()
 
@@ -120,7 +121,7 @@ try:
     )
     
     result_text = response.choices[0].message.content
-    result = json.loads(result_text)
+    result = orjson.loads(result_text)
     
     print(f"\n   ✅ AI CLASSIFICATION RESULT:")
     print(f"      Category: {result.get('category')}")
@@ -136,7 +137,7 @@ try:
     print(f"\n   Full JSON Response:")
     print(f"   {json.dumps(result, indent=2)}")
 
-except json.JSONDecodeError as e:
+except (orjson.JSONDecodeError, ValueError) as e:
     print(f"   ❌ JSON parsing failed: {e}")
     print(f"   Raw response: {result_text}")
 except Exception as e:
@@ -12,12 +12,28 @@ Features:
 """
 
 import requests
-import json
+from requests.adapters import HTTPAdapter
+import orjson
 from datetime import datetime
-import os
+import functools
+import sys
+import time
 
 BASE_URL = "http://localhost:8000/api"
 
+# Shared keep-alive session (one pooled connection reused across menu actions)
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0))
+SESSION.headers["Connection"] = "keep-alive"
+
+# (connect, read) timeouts so a dead backend fails fast instead of hanging.
+# Complaint submission waits on LLM analysis, so it gets a longer read window.
+TIMEOUT = (1.0, 5.0)
+SUBMIT_TIMEOUT = (1.0, 30.0)
+
+# Request bodies are pre-serialized with orjson and sent as raw bytes
+JSON_HEADERS = {"Content-Type": "application/json"}
+
 # Colors
 GREEN = '\033[92m'
 RED = '\033[91m'
@@ -28,6 +44,30 @@ MAGENTA = '\033[95m'
 RESET = '\033[0m'
 BOLD = '\033[1m'
 
+# Color lookup tables
+PRIORITY_COLORS = {
+    'low': GREEN,
+    'medium': YELLOW,
+    'high': MAGENTA,
+    'critical': RED
+}
+
+MAIN_MENU_ITEMS = {
+    "1": "📝 Submit Complaint",
+    "2": "📋 View My Complaints",
+    "3": "📰 View Public Feed",
+    "4": "🔍 View Complaint Details",
+    "5": "🗳️  Vote on Complaint",
+    "6": "📊 Get Vote Statistics",
+    "7": "⚙️  Update Complaint Status",
+    "8": "📈 View Overall Statistics",
+    "9": "🔎 Search Complaints",
+    "10": "💚 Health Check",
+    "0": "❌ Exit"
+}
+
+STATUS_CHOICES = {"1": "raised", "2": "opened", "3": "reviewed", "4": "closed"}
+
 # Test data storage
 test_data = {
     "students": [],
@@ -36,23 +76,33 @@ test_data = {
     "last_roll_number": None
 }
 
+# ANSI clear + cursor home (no subprocess spawn)
+CLEAR_SCREEN = '\033[2J\033[H'
+
 def clear_screen():
     """Clear terminal screen"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    sys.stdout.write(CLEAR_SCREEN)
+    sys.stdout.flush()
+
+def format_header(text):
+    """Build styled header text"""
+    return f"\n{BLUE}{'='*80}{RESET}\n{BLUE}{BOLD}{text:^80}{RESET}\n{BLUE}{'='*80}{RESET}\n"
 
 def print_header(text):
     """Print styled header"""
-    print(f"\n{BLUE}{'='*80}{RESET}")
-    print(f"{BLUE}{BOLD}{text:^80}{RESET}")
-    print(f"{BLUE}{'='*80}{RESET}\n")
+    print(format_header(text))
+
+def format_menu(title, options):
+    """Build menu text with options"""
+    lines = [f"\n{CYAN}{BOLD}{title}{RESET}", f"{CYAN}{'─'*80}{RESET}"]
+    for key, value in options.items():
+        lines.append(f"  {YELLOW}{key}{RESET}. {value}")
+    lines.append(f"{CYAN}{'─'*80}{RESET}")
+    return "\n".join(lines)
 
 def print_menu(title, options):
     """Print menu with options"""
-    print(f"\n{CYAN}{BOLD}{title}{RESET}")
-    print(f"{CYAN}{'─'*80}{RESET}")
-    for key, value in options.items():
-        print(f"  {YELLOW}{key}{RESET}. {value}")
-    print(f"{CYAN}{'─'*80}{RESET}")
+    print(format_menu(title, options))
 
 def get_input(prompt, default=None):
     """Get user input with optional default"""
@@ -61,27 +111,84 @@ def get_input(prompt, default=None):
         return user_input if user_input else default
     return input(f"{prompt}: ").strip()
 
+def _json(response):
+    """Parse a response body straight from bytes"""
+    return orjson.loads(response.content)
+
+def write_lines(parts):
+    """Write a block of lines to stdout in one call"""
+    sys.stdout.write("\n".join(parts))
+    sys.stdout.write("\n")
+    sys.stdout.flush()
+
 def print_response(response):
     """Print API response"""
-    print(f"\n{BOLD}Response:{RESET}")
-    print(f"Status Code: {response.status_code}")
+    parts = [f"\n{BOLD}Response:{RESET}", f"Status Code: {response.status_code}"]
     
     try:
-        data = response.json()
-        print(f"\n{json.dumps(data, indent=2)}")
+        data = _json(response)
+        parts.append(f"\n{orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()}")
         return data
     except:
-        print(response.text)
+        parts.append(response.text)
         return None
+    finally:
+        write_lines(parts)
 
 def pause():
     """Pause and wait for user"""
     input(f"\n{YELLOW}Press Enter to continue...{RESET}")
 
+# ============================================
+# API HELPERS
+# ============================================
+
+# Short-lived memo for idempotent GETs (/health, /stats)
+CACHE_TTL = 1.0  # seconds
+_get_cache = {}
+
+def api_get(path, params=None, ttl=0):
+    """GET an endpoint through the shared session, memoized for `ttl` seconds"""
+    if ttl:
+        key = (path, tuple(sorted(params.items())) if params else ())
+        now = time.monotonic()
+        cached = _get_cache.get(key)
+        if cached and now - cached[0] < ttl:
+            return cached[1]
+    
+    response = SESSION.get(f"{BASE_URL}{path}", params=params, timeout=TIMEOUT)
+    
+    if ttl:
+        _get_cache[key] = (now, response)
+    return response
+
+def api_post(path, payload, timeout=TIMEOUT):
+    """POST a pre-encoded JSON payload through the shared session"""
+    return SESSION.post(
+        f"{BASE_URL}{path}",
+        data=orjson.dumps(payload),
+        headers=JSON_HEADERS,
+        timeout=timeout
+    )
+
+def api_handler(error_label="Error"):
+    """Wrap a menu handler with the shared error report and pause"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper():
+            try:
+                func()
+            except Exception as e:
+                print(f"{RED}❌ {error_label}: {e}{RESET}")
+            pause()
+        return wrapper
+    return decorator
+
 # ============================================
 # 1. SUBMIT COMPLAINT
 # ============================================
 
+@api_handler()
 def submit_complaint():
     """Submit a new complaint"""
     print_header("📝 SUBMIT COMPLAINT")
@@ -114,40 +221,31 @@ def submit_complaint():
     
     print(f"\n{YELLOW}Submitting complaint...{RESET}")
     
-    try:
-        response = requests.post(
-            f"{BASE_URL}/complaints",
-            json=payload,
-            headers={"Content-Type": "application/json"}
-        )
-        
-        data = print_response(response)
-        
-        if response.status_code == 201 and data:
-            # Save for later use
-            test_data["last_complaint_id"] = data.get("complaint_id")
-            test_data["last_roll_number"] = roll
-            test_data["complaints"].append({
-                "id": data.get("complaint_id"),
-                "title": title,
-                "roll": roll
-            })
-            
-            print(f"\n{GREEN}✅ Complaint submitted successfully!{RESET}")
-            print(f"   Complaint ID: {CYAN}{data.get('complaint_id')}{RESET}")
-            print(f"   Category: {data.get('category')}")
-            print(f"   Priority: {data.get('priority')}")
-            print(f"   Assigned to: {data.get('assigned_to')}")
+    response = api_post("/complaints", payload, timeout=SUBMIT_TIMEOUT)
     
-    except Exception as e:
-        print(f"{RED}❌ Error: {e}{RESET}")
+    data = print_response(response)
     
-    pause()
+    if response.status_code == 201 and data:
+        # Save for later use
+        test_data["last_complaint_id"] = data.get("complaint_id")
+        test_data["last_roll_number"] = roll
+        test_data["complaints"].append({
+            "id": data.get("complaint_id"),
+            "title": title,
+            "roll": roll
+        })
+        
+        print(f"\n{GREEN}✅ Complaint submitted successfully!{RESET}")
+        print(f"   Complaint ID: {CYAN}{data.get('complaint_id')}{RESET}")
+        print(f"   Category: {data.get('category')}")
+        print(f"   Priority: {data.get('priority')}")
+        print(f"   Assigned to: {data.get('assigned_to')}")
 
 # ============================================
 # 2. VIEW MY COMPLAINTS
 # ============================================
 
+@api_handler()
 def view_my_complaints():
     """View complaints for a specific student"""
     print_header("📋 VIEW MY COMPLAINTS")
@@ -157,34 +255,26 @@ def view_my_complaints():
     
     print(f"\n{YELLOW}Fetching complaints...{RESET}")
     
-    try:
-        response = requests.get(
-            f"{BASE_URL}/complaints/my",
-            params={"roll_number": roll, "limit": int(limit)}
-        )
-        
-        data = print_response(response)
-        
-        if response.status_code == 200 and data:
-            complaints = data.get("complaints", [])
-            print(f"\n{GREEN}Found {len(complaints)} complaint(s){RESET}")
-            
-            for i, c in enumerate(complaints, 1):
-                print(f"\n{BOLD}[{i}] {c['title']}{RESET}")
-                print(f"    Status: {c['status'].upper()}")
-                print(f"    Priority: {c['priority']}")
-                print(f"    Category: {c.get('category', 'N/A')}")
-                print(f"    Votes: ↑{c['upvotes']} ↓{c['downvotes']}")
+    response = api_get("/complaints/my", params={"roll_number": roll, "limit": int(limit)})
     
-    except Exception as e:
-        print(f"{RED}❌ Error: {e}{RESET}")
+    data = print_response(response)
     
-    pause()
+    if response.status_code == 200 and data:
+        complaints = data.get("complaints", [])
+        print(f"\n{GREEN}Found {len(complaints)} complaint(s){RESET}")
+        
+        for i, c in enumerate(complaints, 1):
+            print(f"\n{BOLD}[{i}] {c['title']}{RESET}")
+            print(f"    Status: {c['status'].upper()}")
+            print(f"    Priority: {c['priority']}")
+            print(f"    Category: {c.get('category', 'N/A')}")
+            print(f"    Votes: ↑{c['upvotes']} ↓{c['downvotes']}")
 
 # ============================================
 # 3. VIEW PUBLIC FEED
 # ============================================
 
+@api_handler()
 def view_public_feed():
     """View public complaints feed"""
     print_header("📰 PUBLIC COMPLAINTS FEED")
@@ -201,35 +291,30 @@ def view_public_feed():
     
     print(f"\n{YELLOW}Fetching public feed...{RESET}")
     
-    try:
-        response = requests.get(f"{BASE_URL}/complaints/public", params=params)
+    response = api_get("/complaints/public", params=params)
+    
+    data = print_response(response)
+    
+    if response.status_code == 200 and data:
+        complaints = data.get("complaints", [])
+        print(f"\n{GREEN}Found {len(complaints)} public complaint(s){RESET}")
         
-        data = print_response(response)
+        print(f"\n{BOLD}{'#':<4} {'Title':<40} {'Status':<10} {'Priority':<10} {'Votes':<10}{RESET}")
+        print(f"{CYAN}{'-'*80}{RESET}")
         
-        if response.status_code == 200 and data:
-            complaints = data.get("complaints", [])
-            print(f"\n{GREEN}Found {len(complaints)} public complaint(s){RESET}")
-            
-            print(f"\n{BOLD}{'#':<4} {'Title':<40} {'Status':<10} {'Priority':<10} {'Votes':<10}{RESET}")
-            print(f"{CYAN}{'-'*80}{RESET}")
+        for i, c in enumerate(complaints, 1):
+            title = c['title'][:38]
+            status = c['status'][:8]
+            priority = c['priority'][:8]
+            votes = f"↑{c['upvotes']} ↓{c['downvotes']}"
             
-            for i, c in enumerate(complaints, 1):
-                title = c['title'][:38]
-                status = c['status'][:8]
-                priority = c['priority'][:8]
-                votes = f"↑{c['upvotes']} ↓{c['downvotes']}"
-                
-                print(f"{i:<4} {title:<40} {status:<10} {priority:<10} {votes:<10}")
-    
-    except Exception as e:
-        print(f"{RED}❌ Error: {e}{RESET}")
-    
-    pause()
+            print(f"{i:<4} {title:<40} {status:<10} {priority:<10} {votes:<10}")
 
 # ============================================
 # 4. VIEW COMPLAINT DETAILS
 # ============================================
 
+@api_handler()
 def view_complaint_details():
     """View full details of a complaint"""
     print_header("🔍 COMPLAINT DETAILS")
@@ -244,45 +329,42 @@ def view_complaint_details():
     
     if not complaint_id:
         print(f"{RED}No complaint ID provided{RESET}")
-        pause()
         return
     
     print(f"\n{YELLOW}Fetching complaint details...{RESET}")
     
-    try:
-        response = requests.get(f"{BASE_URL}/complaints/{complaint_id}")
+    response = api_get(f"/complaints/{complaint_id}")
+    
+    data = print_response(response)
+    
+    if response.status_code == 200 and data:
+        parts = []
+        parts.append(f"\n{BOLD}COMPLAINT DETAILS:{RESET}")
+        parts.append(f"  Title: {data['title']}")
+        parts.append(f"  Description: {data['description'][:100]}...")
+        parts.append(f"  Status: {data['status'].upper()}")
+        parts.append(f"  Priority: {data['priority'].upper()}")
+        parts.append(f"  Category: {data.get('category', 'N/A')}")
+        parts.append(f"  Student: {data['student']['name']} ({data['student']['roll_number']})")
+        parts.append(f"  Department: {data['student']['department']}")
+        parts.append(f"  Votes: ↑{data['upvotes']} ↓{data['downvotes']} (Net: {data['net_votes']})")
+        parts.append(f"  Assigned to: {data.get('assigned_authority', 'N/A')}")
         
-        data = print_response(response)
+        if data.get('llm_analysis'):
+            llm = data['llm_analysis']
+            parts.append(f"\n{BOLD}AI ANALYSIS:{RESET}")
+            parts.append(f"  Summary: {llm.get('summary', 'N/A')}")
+            parts.append(f"  Urgency Score: {llm.get('urgency_score', 'N/A')}/100")
+            parts.append(f"  Impact Level: {llm.get('impact_level', 'N/A')}")
+            parts.append(f"  Sentiment: {llm.get('sentiment', 'N/A')}")
         
-        if response.status_code == 200 and data:
-            print(f"\n{BOLD}COMPLAINT DETAILS:{RESET}")
-            print(f"  Title: {data['title']}")
-            print(f"  Description: {data['description'][:100]}...")
-            print(f"  Status: {data['status'].upper()}")
-            print(f"  Priority: {data['priority'].upper()}")
-            print(f"  Category: {data.get('category', 'N/A')}")
-            print(f"  Student: {data['student']['name']} ({data['student']['roll_number']})")
-            print(f"  Department: {data['student']['department']}")
-            print(f"  Votes: ↑{data['upvotes']} ↓{data['downvotes']} (Net: {data['net_votes']})")
-            print(f"  Assigned to: {data.get('assigned_authority', 'N/A')}")
-            
-            if data.get('llm_analysis'):
-                llm = data['llm_analysis']
-                print(f"\n{BOLD}AI ANALYSIS:{RESET}")
-                print(f"  Summary: {llm.get('summary', 'N/A')}")
-                print(f"  Urgency Score: {llm.get('urgency_score', 'N/A')}/100")
-                print(f"  Impact Level: {llm.get('impact_level', 'N/A')}")
-                print(f"  Sentiment: {llm.get('sentiment', 'N/A')}")
-    
-    except Exception as e:
-        print(f"{RED}❌ Error: {e}{RESET}")
-    
-    pause()
+        write_lines(parts)
 
 # ============================================
 # 5. VOTE ON COMPLAINT
 # ============================================
 
+@api_handler()
 def vote_on_complaint():
     """Vote on a complaint"""
     print_header("🗳️  VOTE ON COMPLAINT")
@@ -305,35 +387,26 @@ def vote_on_complaint():
     
     print(f"\n{YELLOW}Submitting vote...{RESET}")
     
-    try:
-        response = requests.post(
-            f"{BASE_URL}/vote",
-            json=payload,
-            headers={"Content-Type": "application/json"}
-        )
-        
-        data = print_response(response)
-        
-        if response.status_code == 200 and data:
-            print(f"\n{GREEN}✅ Vote recorded!{RESET}")
-            print(f"   Action: {data.get('action')}")
-            print(f"   Message: {data.get('message')}")
-            print(f"   Current Votes: ↑{data.get('upvotes')} ↓{data.get('downvotes')}")
-            print(f"   Net Votes: {data.get('net_votes')}")
-            
-            if data.get('priority_updated'):
-                print(f"\n{MAGENTA}📊 Priority auto-updated:{RESET}")
-                print(f"   {data.get('old_priority')} → {data.get('new_priority')}")
+    response = api_post("/vote", payload)
     
-    except Exception as e:
-        print(f"{RED}❌ Error: {e}{RESET}")
+    data = print_response(response)
     
-    pause()
+    if response.status_code == 200 and data:
+        print(f"\n{GREEN}✅ Vote recorded!{RESET}")
+        print(f"   Action: {data.get('action')}")
+        print(f"   Message: {data.get('message')}")
+        print(f"   Current Votes: ↑{data.get('upvotes')} ↓{data.get('downvotes')}")
+        print(f"   Net Votes: {data.get('net_votes')}")
+        
+        if data.get('priority_updated'):
+            print(f"\n{MAGENTA}📊 Priority auto-updated:{RESET}")
+            print(f"   {data.get('old_priority')} → {data.get('new_priority')}")
 
 # ============================================
 # 6. GET VOTE STATISTICS
 # ============================================
 
+@api_handler()
 def get_vote_stats():
     """Get vote statistics for a complaint"""
     print_header("📊 VOTE STATISTICS")
@@ -342,27 +415,22 @@ def get_vote_stats():
     
     print(f"\n{YELLOW}Fetching vote statistics...{RESET}")
     
-    try:
-        response = requests.get(f"{BASE_URL}/votes/{complaint_id}")
-        
-        data = print_response(response)
-        
-        if response.status_code == 200 and data:
-            print(f"\n{BOLD}VOTE STATISTICS:{RESET}")
-            print(f"  Upvotes: {GREEN}{data.get('upvotes')}{RESET}")
-            print(f"  Downvotes: {RED}{data.get('downvotes')}{RESET}")
-            print(f"  Total Votes: {data.get('total')}")
-            print(f"  Net Votes: {data.get('net_votes')}")
+    response = api_get(f"/votes/{complaint_id}")
     
-    except Exception as e:
-        print(f"{RED}❌ Error: {e}{RESET}")
+    data = print_response(response)
     
-    pause()
+    if response.status_code == 200 and data:
+        print(f"\n{BOLD}VOTE STATISTICS:{RESET}")
+        print(f"  Upvotes: {GREEN}{data.get('upvotes')}{RESET}")
+        print(f"  Downvotes: {RED}{data.get('downvotes')}{RESET}")
+        print(f"  Total Votes: {data.get('total')}")
+        print(f"  Net Votes: {data.get('net_votes')}")
 
 # ============================================
 # 7. UPDATE COMPLAINT STATUS
 # ============================================
 
+@api_handler()
 def update_status():
     """Update complaint status"""
     print_header("⚙️  UPDATE COMPLAINT STATUS")
@@ -376,8 +444,7 @@ def update_status():
     print("  4. closed")
     status_choice = get_input("Choose", "2")
     
-    status_map = {"1": "raised", "2": "opened", "3": "reviewed", "4": "closed"}
-    new_status = status_map.get(status_choice, "opened")
+    new_status = STATUS_CHOICES.get(status_choice, "opened")
     
     authority_roll = get_input("Authority Roll/ID", "ADMIN001")
     reason = get_input("Reason (optional)", "Status updated by authority")
@@ -391,99 +458,78 @@ def update_status():
     
     print(f"\n{YELLOW}Updating status...{RESET}")
     
-    try:
-        response = requests.post(
-            f"{BASE_URL}/status/update",
-            json=payload,
-            headers={"Content-Type": "application/json"}
-        )
-        
-        data = print_response(response)
-        
-        if response.status_code == 200 and data:
-            print(f"\n{GREEN}✅ Status updated!{RESET}")
-            print(f"   Old Status: {data.get('old_status')}")
-            print(f"   New Status: {data.get('new_status')}")
+    response = api_post("/status/update", payload)
     
-    except Exception as e:
-        print(f"{RED}❌ Error: {e}{RESET}")
+    data = print_response(response)
     
-    pause()
+    if response.status_code == 200 and data:
+        print(f"\n{GREEN}✅ Status updated!{RESET}")
+        print(f"   Old Status: {data.get('old_status')}")
+        print(f"   New Status: {data.get('new_status')}")
 
 # ============================================
 # 8. VIEW OVERALL STATISTICS
 # ============================================
 
+@api_handler()
 def view_overall_stats():
     """View system-wide statistics"""
     print_header("📈 OVERALL SYSTEM STATISTICS")
     
     print(f"{YELLOW}Fetching statistics...{RESET}")
     
-    try:
-        response = requests.get(f"{BASE_URL}/stats")
-        
-        data = print_response(response)
-        
-        if response.status_code == 200 and data:
-            print(f"\n{BOLD}SYSTEM OVERVIEW:{RESET}")
-            print(f"  Total Students: {data.get('total_students', 0)}")
-            print(f"  Total Complaints: {data.get('total_complaints', 0)}")
-            print(f"  Total Votes: {data.get('total_votes', 0)}")
-            
-            status_breakdown = data.get('complaints_by_status', {})
-            if status_breakdown:
-                print(f"\n{BOLD}Complaints by Status:{RESET}")
-                for status, count in status_breakdown.items():
-                    print(f"  {status.upper()}: {count}")
-            
-            priority_breakdown = data.get('complaints_by_priority', {})
-            if priority_breakdown:
-                print(f"\n{BOLD}Complaints by Priority:{RESET}")
-                for priority, count in priority_breakdown.items():
-                    color = {
-                        'low': GREEN,
-                        'medium': YELLOW,
-                        'high': MAGENTA,
-                        'critical': RED
-                    }.get(priority, RESET)
-                    print(f"  {color}{priority.upper()}: {count}{RESET}")
+    response = api_get("/stats", ttl=CACHE_TTL)
     
-    except Exception as e:
-        print(f"{RED}❌ Error: {e}{RESET}")
+    data = print_response(response)
     
-    pause()
+    if response.status_code == 200 and data:
+        parts = []
+        parts.append(f"\n{BOLD}SYSTEM OVERVIEW:{RESET}")
+        parts.append(f"  Total Students: {data.get('total_students', 0)}")
+        parts.append(f"  Total Complaints: {data.get('total_complaints', 0)}")
+        parts.append(f"  Total Votes: {data.get('total_votes', 0)}")
+        
+        status_breakdown = data.get('complaints_by_status', {})
+        if status_breakdown:
+            parts.append(f"\n{BOLD}Complaints by Status:{RESET}")
+            for status, count in status_breakdown.items():
+                parts.append(f"  {status.upper()}: {count}")
+        
+        priority_breakdown = data.get('complaints_by_priority', {})
+        if priority_breakdown:
+            parts.append(f"\n{BOLD}Complaints by Priority:{RESET}")
+            for priority, count in priority_breakdown.items():
+                color = PRIORITY_COLORS.get(priority, RESET)
+                parts.append(f"  {color}{priority.upper()}: {count}{RESET}")
+        
+        write_lines(parts)
 
 # ============================================
 # 9. HEALTH CHECK
 # ============================================
 
+@api_handler(error_label="API is down")
 def health_check():
     """Check API health"""
     print_header("💚 HEALTH CHECK")
     
     print(f"{YELLOW}Checking API health...{RESET}")
     
-    try:
-        response = requests.get(f"{BASE_URL}/health")
-        
-        data = print_response(response)
-        
-        if response.status_code == 200 and data:
-            print(f"\n{GREEN}✅ API is healthy!{RESET}")
-            print(f"  Service: {data.get('service')}")
-            print(f"  Version: {data.get('version')}")
-            print(f"  Status: {data.get('status')}")
+    response = api_get("/health", ttl=CACHE_TTL)
     
-    except Exception as e:
-        print(f"{RED}❌ API is down: {e}{RESET}")
+    data = print_response(response)
     
-    pause()
+    if response.status_code == 200 and data:
+        print(f"\n{GREEN}✅ API is healthy!{RESET}")
+        print(f"  Service: {data.get('service')}")
+        print(f"  Version: {data.get('version')}")
+        print(f"  Status: {data.get('status')}")
 
 # ============================================
 # 10. SEARCH COMPLAINTS
 # ============================================
 
+@api_handler()
 def search_complaints():
     """Search complaints by keyword"""
     print_header("🔎 SEARCH COMPLAINTS")
@@ -493,85 +539,70 @@ def search_complaints():
     
     if not query:
         print(f"{RED}No search query provided{RESET}")
-        pause()
         return
     
     print(f"\n{YELLOW}Searching...{RESET}")
     
-    try:
-        response = requests.get(
-            f"{BASE_URL}/search",
-            params={"query": query, "limit": int(limit)}
-        )
-        
-        data = print_response(response)
-        
-        if response.status_code == 200 and data:
-            complaints = data.get("complaints", [])
-            print(f"\n{GREEN}Found {len(complaints)} result(s){RESET}")
-            
-            for i, c in enumerate(complaints, 1):
-                print(f"\n{BOLD}[{i}] {c['title']}{RESET}")
-                print(f"    {c['description'][:80]}...")
+    # Only title and description are displayed, so request just those
+    response = api_get(
+        "/search",
+        params={"query": query, "limit": int(limit), "fields": "title,description"}
+    )
     
-    except Exception as e:
-        print(f"{RED}❌ Error: {e}{RESET}")
+    data = print_response(response)
     
-    pause()
+    if response.status_code == 200 and data:
+        complaints = data.get("complaints", [])
+        print(f"\n{GREEN}Found {len(complaints)} result(s){RESET}")
+        
+        for i, c in enumerate(complaints, 1):
+            print(f"\n{BOLD}[{i}] {c['title']}{RESET}")
+            print(f"    {c['description'][:80]}...")
 
 # ============================================
 # MAIN MENU
 # ============================================
 
+# Static parts of the menu screen, rendered once
+MENU_HEADER = (
+    CLEAR_SCREEN
+    + format_header("🎓 CAMPUSVOICE INTERACTIVE API TESTER")
+    + f"\n{CYAN}Server: {BASE_URL}{RESET}\n"
+)
+MENU_BODY = format_menu("MAIN MENU", MAIN_MENU_ITEMS) + "\n"
+
+MENU_HANDLERS = {
+    "1": submit_complaint,
+    "2": view_my_complaints,
+    "3": view_public_feed,
+    "4": view_complaint_details,
+    "5": vote_on_complaint,
+    "6": get_vote_stats,
+    "7": update_status,
+    "8": view_overall_stats,
+    "9": search_complaints,
+    "10": health_check
+}
+
 def main_menu():
     """Display main menu"""
     while True:
-        clear_screen()
-        print_header("🎓 CAMPUSVOICE INTERACTIVE API TESTER")
-        
-        print(f"{CYAN}Server: {BASE_URL}{RESET}")
+        frame = [MENU_HEADER]
         if test_data.get("last_complaint_id"):
-            print(f"{CYAN}Last Complaint: {test_data['last_complaint_id'][:16]}...{RESET}")
-        
-        print_menu("MAIN MENU", {
-            "1": "📝 Submit Complaint",
-            "2": "📋 View My Complaints",
-            "3": "📰 View Public Feed",
-            "4": "🔍 View Complaint Details",
-            "5": "🗳️  Vote on Complaint",
-            "6": "📊 Get Vote Statistics",
-            "7": "⚙️  Update Complaint Status",
-            "8": "📈 View Overall Statistics",
-            "9": "🔎 Search Complaints",
-            "10": "💚 Health Check",
-            "0": "❌ Exit"
-        })
+            frame.append(f"{CYAN}Last Complaint: {test_data['last_complaint_id'][:16]}...{RESET}\n")
+        frame.append(MENU_BODY)
+        sys.stdout.write("".join(frame))
+        sys.stdout.flush()
         
         choice = get_input("\nSelect option", "1")
         
-        if choice == "1":
-            submit_complaint()
-        elif choice == "2":
-            view_my_complaints()
-        elif choice == "3":
-            view_public_feed()
-        elif choice == "4":
-            view_complaint_details()
-        elif choice == "5":
-            vote_on_complaint()
-        elif choice == "6":
-            get_vote_stats()
-        elif choice == "7":
-            update_status()
-        elif choice == "8":
-            view_overall_stats()
-        elif choice == "9":
-            search_complaints()
-        elif choice == "10":
-            health_check()
-        elif choice == "0":
+        if choice == "0":
             print(f"\n{GREEN}Goodbye!{RESET}\n")
             break
+        
+        handler = MENU_HANDLERS.get(choice)
+        if handler:
+            handler()
         else:
             print(f"{RED}Invalid option{RESET}")
             pause()
@@ -3,15 +3,23 @@ Student Complaint Monitor
 Continuously monitors complaint status and displays updates
 """
 
-import requests
-import json
+import asyncio
+from array import array
+import httpx
+import orjson
 import time
 from datetime import datetime
-import os
 import sys
 
 BASE_URL = "http://localhost:8000/api"
 
+# Bound every request: fail fast on connect, allow a few seconds to read
+TIMEOUT = httpx.Timeout(5.0, connect=1.0)
+
+# Start the next fetch this many RTTs before the redraw (never less than the floor)
+PREFETCH_RTT_FACTOR = 2
+PREFETCH_MIN_LEAD = 0.25  # seconds
+
 # Colors
 GREEN = '\033[92m'
 RED = '\033[91m'
@@ -21,15 +29,51 @@ CYAN = '\033[96m'
 RESET = '\033[0m'
 BOLD = '\033[1m'
 
+# Color lookup tables
+STATUS_COLORS = {
+    'raised': YELLOW,
+    'opened': BLUE,
+    'reviewed': CYAN,
+    'closed': GREEN
+}
+
+PRIORITY_COLORS = {
+    'low': GREEN,
+    'medium': YELLOW,
+    'high': CYAN,
+    'critical': RED
+}
+
+# Precomputed table header and vote-cell prefix
+TABLE_HEADER = (
+    f"{BOLD}{CYAN}{'Title':<35} {'Status':<12} {'Priority':<10} {'Votes':<12}{RESET}",
+    f"{CYAN}{'-'*75}{RESET}"
+)
+VOTES_PREFIX = " " + GREEN
+
+# ANSI control sequences
+CLEAR_SCREEN = '\033[2J\033[H'
+CLEAR_BELOW = '\033[J'
+CLEAR_LINE = '\033[K'
+
 def clear_screen():
     """Clear terminal screen"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    sys.stdout.write(CLEAR_SCREEN)
+    sys.stdout.flush()
+
+def header_lines(text):
+    """Build styled header lines"""
+    return [
+        "",
+        f"{BLUE}{'='*70}{RESET}",
+        f"{BLUE}{BOLD}{text:^70}{RESET}",
+        f"{BLUE}{'='*70}{RESET}",
+        ""
+    ]
 
 def print_header(text):
     """Print styled header"""
-    print(f"\n{BLUE}{'='*70}{RESET}")
-    print(f"{BLUE}{BOLD}{text:^70}{RESET}")
-    print(f"{BLUE}{'='*70}{RESET}\n")
+    print("\n".join(header_lines(text)))
 
 class StudentMonitor:
     """Monitor student complaints in real-time"""
@@ -37,8 +81,15 @@ class StudentMonitor:
     def __init__(self):
         self.roll_number = None
         self.student_name = None
-        self.last_status = {}
+        # Last seen state, stored as parallel arrays indexed by row
+        self._idx = {}  # complaint_id -> row
+        self._status = []
+        self._up = array('i')
+        self._down = array('i')
+        self._frame = []  # lines currently on screen
         self.refresh_interval = 5  # seconds
+        self.client = None  # httpx.AsyncClient, opened in run()
+        self._last_rtt = 1.0  # seconds, refreshed by every fetch
     
     def setup(self):
         """Setup student details"""
@@ -65,26 +116,47 @@ class StudentMonitor:
         time.sleep(1)
         return True
     
-    def get_my_complaints(self):
+    async def get_my_complaints(self):
         """Fetch student's complaints"""
         try:
-            response = requests.get(
+            response = await self.client.get(
                 f"{BASE_URL}/complaints/my",
                 params={"roll_number": self.roll_number}
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 return data.get('complaints', [])
             else:
                 return []
+        except httpx.TimeoutException:
+            return None  # skip this tick
         except Exception as e:
             print(f"{RED}❌ Error fetching complaints: {e}{RESET}")
             return []
     
+    async def get_overall_stats(self):
+        """Fetch system-wide statistics"""
+        try:
+            response = await self.client.get(f"{BASE_URL}/stats")
+            
+            if response.status_code == 200:
+                return orjson.loads(response.content)
+            return {}
+        except Exception:
+            return {}
+    
+    async def fetch_snapshot(self):
+        """Fetch complaints and system stats concurrently"""
+        started = time.perf_counter()
+        snapshot = await asyncio.gather(self.get_my_complaints(), self.get_overall_stats())
+        self._last_rtt = time.perf_counter() - started
+        return snapshot
+    
     def detect_changes(self, complaints):
         """Detect status changes in complaints"""
         changes = []
+        idx = self._idx
         
         for complaint in complaints:
             complaint_id = complaint.get('complaint_id')
@@ -92,49 +164,52 @@ class StudentMonitor:
             current_upvotes = complaint.get('upvotes', 0)
             current_downvotes = complaint.get('downvotes', 0)
             
-            if complaint_id in self.last_status:
-                old_data = self.last_status[complaint_id]
-                
-                # Check status change
-                if old_data['status'] != current_status:
-                    changes.append({
-                        'type': 'status',
-                        'complaint_id': complaint_id,
-                        'title': complaint.get('title'),
-                        'old_status': old_data['status'],
-                        'new_status': current_status
-                    })
-                
-                # Check vote changes
-                if (old_data['upvotes'] != current_upvotes or 
-                    old_data['downvotes'] != current_downvotes):
-                    changes.append({
-                        'type': 'votes',
-                        'complaint_id': complaint_id,
-                        'title': complaint.get('title'),
-                        'old_upvotes': old_data['upvotes'],
-                        'new_upvotes': current_upvotes,
-                        'old_downvotes': old_data['downvotes'],
-                        'new_downvotes': current_downvotes
-                    })
+            i = idx.get(complaint_id)
+            if i is None:
+                # First sighting - start tracking
+                idx[complaint_id] = len(self._status)
+                self._status.append(current_status)
+                self._up.append(current_upvotes)
+                self._down.append(current_downvotes)
+                continue
+            
+            old_status = self._status[i]
+            old_upvotes = self._up[i]
+            old_downvotes = self._down[i]
             
-            # Update last status
-            self.last_status[complaint_id] = {
-                'status': current_status,
-                'upvotes': current_upvotes,
-                'downvotes': current_downvotes
-            }
+            # Check status change
+            if old_status != current_status:
+                changes.append({
+                    'type': 'status',
+                    'complaint_id': complaint_id,
+                    'title': complaint.get('title'),
+                    'old_status': old_status,
+                    'new_status': current_status
+                })
+                self._status[i] = current_status
+            
+            # Check vote changes
+            if old_upvotes != current_upvotes or old_downvotes != current_downvotes:
+                changes.append({
+                    'type': 'votes',
+                    'complaint_id': complaint_id,
+                    'title': complaint.get('title'),
+                    'old_upvotes': old_upvotes,
+                    'new_upvotes': current_upvotes,
+                    'old_downvotes': old_downvotes,
+                    'new_downvotes': current_downvotes
+                })
+                self._up[i] = current_upvotes
+                self._down[i] = current_downvotes
         
         return changes
     
     def display_complaints(self, complaints):
-        """Display complaints table"""
+        """Build complaints table lines"""
         if not complaints:
-            print(f"{YELLOW}⚠️  No complaints found for {self.roll_number}{RESET}")
-            return
+            return [f"{YELLOW}⚠️  No complaints found for {self.roll_number}{RESET}"]
         
-        print(f"{BOLD}{CYAN}{'Title':<35} {'Status':<12} {'Priority':<10} {'Votes':<12}{RESET}")
-        print(f"{CYAN}{'-'*75}{RESET}")
+        lines = list(TABLE_HEADER)
         
         for complaint in complaints:
             title = complaint.get('title', 'N/A')[:33]
@@ -143,98 +218,143 @@ class StudentMonitor:
             upvotes = complaint.get('upvotes', 0)
             downvotes = complaint.get('downvotes', 0)
             
-            # Color code status
-            status_color = {
-                'raised': YELLOW,
-                'opened': BLUE,
-                'reviewed': CYAN,
-                'closed': GREEN
-            }.get(status, RESET)
-            
-            # Color code priority
-            priority_color = {
-                'low': GREEN,
-                'medium': YELLOW,
-                'high': CYAN,
-                'critical': RED
-            }.get(priority, RESET)
+            votes = "↑%s ↓%s" % (upvotes, downvotes)
             
-            votes = f"↑{upvotes} ↓{downvotes}"
-            
-            print(f"{title:<35} {status_color}{status:<12}{RESET} {priority_color}{priority:<10}{RESET} {GREEN}{votes:<12}{RESET}")
+            # Padded with str.ljust (no format-spec parsing), color coded per cell
+            lines.append("".join((
+                title.ljust(35), " ",
+                STATUS_COLORS.get(status, RESET), status.ljust(12), RESET, " ",
+                PRIORITY_COLORS.get(priority, RESET), priority.ljust(10), RESET,
+                VOTES_PREFIX, votes.ljust(12), RESET
+            )))
+        
+        return lines
     
     def show_notification(self, changes):
-        """Show notification for changes"""
+        """Build notification lines for changes"""
         if not changes:
-            return
+            return []
         
-        print(f"\n{BOLD}{CYAN}{'🔔 UPDATES DETECTED!'}{RESET}")
-        print(f"{CYAN}{'─'*70}{RESET}")
+        lines = [
+            "",
+            f"{BOLD}{CYAN}{'🔔 UPDATES DETECTED!'}{RESET}",
+            f"{CYAN}{'─'*70}{RESET}"
+        ]
         
         for change in changes:
             if change['type'] == 'status':
-                print(f"{YELLOW}📊 Status Changed:{RESET}")
-                print(f"   Complaint: {change['title'][:50]}")
-                print(f"   {change['old_status'].upper()} → {GREEN}{change['new_status'].upper()}{RESET}")
+                lines.append(f"{YELLOW}📊 Status Changed:{RESET}")
+                lines.append(f"   Complaint: {change['title'][:50]}")
+                lines.append(f"   {change['old_status'].upper()} → {GREEN}{change['new_status'].upper()}{RESET}")
             
             elif change['type'] == 'votes':
-                print(f"{GREEN}🗳️  Vote Update:{RESET}")
-                print(f"   Complaint: {change['title'][:50]}")
+                lines.append(f"{GREEN}🗳️  Vote Update:{RESET}")
+                lines.append(f"   Complaint: {change['title'][:50]}")
                 upvote_change = change['new_upvotes'] - change['old_upvotes']
                 downvote_change = change['new_downvotes'] - change['old_downvotes']
                 
                 if upvote_change > 0:
-                    print(f"   {GREEN}+{upvote_change} upvote(s){RESET}")
+                    lines.append(f"   {GREEN}+{upvote_change} upvote(s){RESET}")
                 if downvote_change > 0:
-                    print(f"   {RED}+{downvote_change} downvote(s){RESET}")
-                print(f"   Total: ↑{change['new_upvotes']} ↓{change['new_downvotes']}")
+                    lines.append(f"   {RED}+{downvote_change} downvote(s){RESET}")
+                lines.append(f"   Total: ↑{change['new_upvotes']} ↓{change['new_downvotes']}")
+        
+        lines.append(f"{CYAN}{'─'*70}{RESET}")
+        return lines
+    
+    def render(self, lines, footer=""):
+        """Redraw only the screen lines that changed since the last frame"""
+        previous = self._frame
+        out = []
+        
+        for row, line in enumerate(lines, 1):
+            if row > len(previous) or previous[row - 1] != line:
+                out.append(f"\033[{row};1H{CLEAR_LINE}{line}")
+        
+        # Park the cursor below the frame and wipe any leftover lines
+        out.append(f"\033[{len(lines) + 1};1H{CLEAR_BELOW}{footer}")
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
+        self._frame = lines
+    
+    def draw_frame(self, complaints, stats, notify):
+        """Build and render one monitor frame"""
+        # Header
+        lines = header_lines(f"📱 STUDENT MONITOR - {self.student_name}")
+        lines.append(f"{CYAN}Roll Number: {self.roll_number}{RESET}")
+        lines.append(f"{CYAN}Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}{RESET}")
+        lines.append(f"{CYAN}Auto-refresh: Every {self.refresh_interval}s{RESET}")
+        lines.append(f"{CYAN}Press Ctrl+C to stop{RESET}")
+        lines.append("")
+        
+        if stats:
+            lines.append(f"{CYAN}System: {stats.get('total_complaints', 0)} complaints, "
+                         f"{stats.get('total_votes', 0)} votes{RESET}")
+            lines.append("")
+        
+        # Detect changes
+        changes = self.detect_changes(complaints)
+        
+        # Show notifications
+        if notify and changes:  # Skip first iteration
+            lines.extend(self.show_notification(changes))
         
-        print(f"{CYAN}{'─'*70}{RESET}")
+        # Display current complaints
+        lines.append("")
+        lines.append(f"{BOLD}📋 YOUR COMPLAINTS ({len(complaints)} total){RESET}")
+        lines.append("")
+        lines.extend(self.display_complaints(complaints))
+        lines.append("")
+        
+        # Progress indicator goes out in the same write as the frame
+        self.render(lines, footer=f"{YELLOW}Next refresh in: {RESET}{self.refresh_interval}s")
     
-    def run(self):
+    async def run(self):
         """Main monitoring loop"""
         if not self.setup():
             return
         
         iteration = 0
+        limits = httpx.Limits(max_connections=4, max_keepalive_connections=4, keepalive_expiry=60)
         
-        try:
+        # http2=True multiplexes the concurrent polls over one connection when
+        # the backend negotiates HTTP/2; the pool still covers HTTP/1.1
+        async with httpx.AsyncClient(http2=True, limits=limits, timeout=TIMEOUT) as client:
+            self.client = client
+            next_fetch = asyncio.create_task(self.fetch_snapshot())
+            clear_screen()
+            
             while True:
-                clear_screen()
-                
-                # Header
-                print_header(f"📱 STUDENT MONITOR - {self.student_name}")
-                print(f"{CYAN}Roll Number: {self.roll_number}{RESET}")
-                print(f"{CYAN}Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}{RESET}")
-                print(f"{CYAN}Auto-refresh: Every {self.refresh_interval}s{RESET}")
-                print(f"{CYAN}Press Ctrl+C to stop{RESET}\n")
-                
-                # Fetch complaints
-                complaints = self.get_my_complaints()
+                # Fetch complaints + stats (prefetched during the previous countdown)
+                complaints, stats = await next_fetch
                 
-                # Detect changes
-                changes = self.detect_changes(complaints)
+                # A timed-out fetch returns None: keep the last frame on screen
+                if complaints is not None:
+                    self.draw_frame(complaints, stats, notify=iteration > 0)
+                    iteration += 1
                 
-                # Show notifications
-                if iteration > 0 and changes:  # Skip first iteration
-                    self.show_notification(changes)
-                
-                # Display current complaints
-                print(f"\n{BOLD}📋 YOUR COMPLAINTS ({len(complaints)} total){RESET}\n")
-                self.display_complaints(complaints)
-                
-                # Progress indicator
-                print(f"\n{YELLOW}Next refresh in: {RESET}", end='', flush=True)
-                for i in range(self.refresh_interval, 0, -1):
-                    print(f"{i}s ", end='', flush=True)
-                    time.sleep(1)
-                
-                iteration += 1
-        
-        except KeyboardInterrupt:
-            print(f"\n\n{GREEN}✅ Monitoring stopped{RESET}")
+                # One timed wait per tick; the next request is issued early
+                # enough (based on the last measured RTT) that its latency
+                # overlaps the tail of the wait
+                lead = min(
+                    self.refresh_interval,
+                    max(PREFETCH_MIN_LEAD, PREFETCH_RTT_FACTOR * self._last_rtt)
+                )
+                await asyncio.sleep(self.refresh_interval - lead)
+                next_fetch = asyncio.create_task(self.fetch_snapshot())
+                await asyncio.sleep(lead)
 
 
 if __name__ == "__main__":
+    # uvloop's faster event loop when available (ships with uvicorn[standard])
+    try:
+        import uvloop
+        run_async = uvloop.run
+    except ImportError:
+        run_async = asyncio.run
+    
     monitor = StudentMonitor()
-    monitor.run()
+    try:
+        run_async(monitor.run())
+    except KeyboardInterrupt:
+        print(f"\n\n{GREEN}✅ Monitoring stopped{RESET}")
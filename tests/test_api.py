@@ -1,17 +1,48 @@
 """
 Complete API Test Suite for CampusVoice Backend
 Tests all 7 endpoints + database operations
+
+Run: python test_api.py        (sequential script with summary)
+     pytest tests/test_api.py  (see conftest.py)
 """
 
+import asyncio
+import functools
+import httpx
 import requests
-import json
-import time
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+import orjson
+import sys
 from datetime import datetime
 
 # Configuration
 BASE_URL = "http://localhost:8000"
 API_URL = f"{BASE_URL}/api"
 
+# Transient connection drops and gateway errors are retried with backoff.
+# Only GETs are retried after the request was sent: votes toggle, so a
+# replayed POST could undo itself.
+RETRY = Retry(
+    total=3,
+    backoff_factor=0.1,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset(["GET"])
+)
+
+# (connect, read) timeouts in seconds; submission waits on the LLM
+TIMEOUT = (2.0, 5.0)
+SUBMIT_TIMEOUT = (2.0, 30.0)
+
+# One pooled keep-alive session shared by every test
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=RETRY))
+SESSION.headers.update({"Content-Type": "application/json"})
+
+# Read-only checks that do not depend on each other are fetched concurrently
+PREFETCH_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=16)
+PREFETCH_TIMEOUT = 10.0
+
 # Test data
 TEST_STUDENT = {
     "name": "Test Student",
@@ -24,6 +55,10 @@ TEST_STUDENT = {
     "image_url": None
 }
 
+# (url, params) for the read-only checks that take query parameters
+MY_COMPLAINTS_GET = (f"{API_URL}/complaints/my", {"roll_number": TEST_STUDENT["register_number"]})
+PUBLIC_FEED_GET = (f"{API_URL}/complaints/public", {"limit": 10})
+
 # Colors for output
 GREEN = '\033[92m'
 RED = '\033[91m'
@@ -31,29 +66,91 @@ YELLOW = '\033[93m'
 BLUE = '\033[94m'
 RESET = '\033[0m'
 
+# Output templates, built once at import; only the text varies per call
+_HEADER_TPL = f"\n{BLUE}{'='*60}{RESET}\n{BLUE}{{text}}{RESET}\n{BLUE}{'='*60}{RESET}\n"
+_SUCCESS_TPL = f"{GREEN}✅ {{text}}{RESET}\n"
+_ERROR_TPL = f"{RED}❌ {{text}}{RESET}\n"
+_INFO_TPL = f"{YELLOW}ℹ️  {{text}}{RESET}\n"
+
 def print_header(text):
     """Print section header"""
-    print(f"\n{BLUE}{'='*60}{RESET}")
-    print(f"{BLUE}{text}{RESET}")
-    print(f"{BLUE}{'='*60}{RESET}")
+    sys.stdout.write(_HEADER_TPL.format(text=text))
 
 def print_success(text):
     """Print success message"""
-    print(f"{GREEN}✅ {text}{RESET}")
+    sys.stdout.write(_SUCCESS_TPL.format(text=text))
 
 def print_error(text):
     """Print error message"""
-    print(f"{RED}❌ {text}{RESET}")
+    sys.stdout.write(_ERROR_TPL.format(text=text))
 
 def print_info(text):
     """Print info message"""
-    print(f"{YELLOW}ℹ️  {text}{RESET}")
+    sys.stdout.write(_INFO_TPL.format(text=text))
+
+async def _fetch_all(gets):
+    """
+    Issue independent GETs concurrently over one pooled client
+    
+    Args:
+        gets: List of (url, params) pairs
+    
+    Returns:
+        Response (or the exception raised) per GET, in input order
+    """
+    async with httpx.AsyncClient(limits=PREFETCH_LIMITS, timeout=PREFETCH_TIMEOUT) as client:
+        return await asyncio.gather(
+            *(client.get(url, params=params) for url, params in gets),
+            return_exceptions=True
+        )
+
+def prefetch(*gets):
+    """Run _fetch_all from synchronous code"""
+    return asyncio.run(_fetch_all(list(gets)))
+
+def _get(response, url, params=None):
+    """Use a prefetched response (re-raising its error), or GET url now"""
+    if response is None:
+        return SESSION.get(url, params=params, timeout=TIMEOUT)
+    if isinstance(response, Exception):
+        raise response
+    return response
+
+def _safe_call(test):
+    """
+    Report a transport failure (connection, timeout, retries exhausted)
+    as a failed assertion with a readable message
+    
+    Any other exception is a bug in the test or the API and propagates.
+    """
+    @functools.wraps(test)
+    def wrapper(*args, **kwargs):
+        try:
+            return test(*args, **kwargs)
+        except (requests.RequestException, httpx.HTTPError) as e:
+            label = test.__name__.removeprefix("test_").replace("_", " ")
+            raise AssertionError(f"{label.capitalize()} error: {e}") from e
+    return wrapper
+
+def _run(test, *args):
+    """
+    Run one test for the script summary
+    
+    Returns:
+        bool: True if it passed; a failed assertion is printed, not raised
+    """
+    try:
+        test(*args)
+    except AssertionError as e:
+        print_error(str(e) or f"{test.__name__} failed")
+        return False
+    return True
 
 def print_response(response):
     """Print formatted response"""
     print(f"\nStatus Code: {response.status_code}")
     try:
-        print(json.dumps(response.json(), indent=2))
+        print(orjson.dumps(orjson.loads(response.content), option=orjson.OPT_INDENT_2).decode())
     except:
         print(response.text)
 
@@ -61,369 +158,344 @@ def print_response(response):
 # ============================================
 # TEST 1: HEALTH CHECK
 # ============================================
-def test_health_check():
+@_safe_call
+def test_health_check(response=None):
     print_header("TEST 1: HEALTH CHECK")
     
-    try:
-        response = requests.get(f"{API_URL}/health")
-        print_response(response)
-        
-        if response.status_code == 200:
-            print_success("Health check passed")
-            return True
-        else:
-            print_error("Health check failed")
-            return False
-    except Exception as e:
-        print_error(f"Health check error: {e}")
-        return False
+    response = _get(response, f"{API_URL}/health")
+    print_response(response)
+    
+    assert response.status_code == 200, "Health check failed"
+    print_success("Health check passed")
 
 
 # ============================================
 # TEST 2: DATABASE HEALTH
 # ============================================
-def test_database_health():
+@_safe_call
+def test_database_health(response=None):
     print_header("TEST 2: DATABASE HEALTH")
     
-    try:
-        response = requests.get(f"{BASE_URL}/health/database")
-        print_response(response)
-        
-        if response.status_code == 200:
-            data = response.json()
-            if data.get("status") == "healthy":
-                print_success("Database connection healthy")
-                return True
-            else:
-                print_error("Database connection unhealthy")
-                return False
-        else:
-            print_error("Database health check failed")
-            return False
-    except Exception as e:
-        print_error(f"Database health error: {e}")
-        return False
+    response = _get(response, f"{BASE_URL}/health/database")
+    print_response(response)
+    
+    assert response.status_code == 200, "Database health check failed"
+    data = orjson.loads(response.content)
+    assert data.get("status") == "healthy", "Database connection unhealthy"
+    print_success("Database connection healthy")
 
 
 # ============================================
 # TEST 3: SUBMIT COMPLAINT
 # ============================================
-def test_submit_complaint():
+def _submit_complaint():
+    """
+    Submit the test complaint (runs the LLM once per suite run)
+    
+    Returns:
+        str: Complaint ID, or None if submission failed
+    """
     print_header("TEST 3: SUBMIT COMPLAINT")
     
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{API_URL}/complaints",
             json=TEST_STUDENT,
-            headers={"Content-Type": "application/json"}
+            timeout=SUBMIT_TIMEOUT
         )
-        print_response(response)
-        
-        if response.status_code == 201:
-            data = response.json()
-            complaint_id = data.get("complaint_id")
-            print_success(f"Complaint submitted successfully")
-            print_info(f"Complaint ID: {complaint_id}")
-            print_info(f"Priority: {data.get('priority')}")
-            print_info(f"Category: {data.get('category')}")
-            print_info(f"Assigned to: {data.get('assigned_to')}")
-            return complaint_id
-        else:
-            print_error("Failed to submit complaint")
-            return None
-    except Exception as e:
+    except requests.RequestException as e:
         print_error(f"Submit complaint error: {e}")
         return None
+    print_response(response)
+    
+    if response.status_code == 201:
+        data = orjson.loads(response.content)
+        complaint_id = data.get("complaint_id")
+        print_success(f"Complaint submitted successfully")
+        print_info(f"Complaint ID: {complaint_id}")
+        print_info(f"Priority: {data.get('priority')}")
+        print_info(f"Category: {data.get('category')}")
+        print_info(f"Assigned to: {data.get('assigned_to')}")
+        return complaint_id
+    else:
+        print_error("Failed to submit complaint")
+        return None
+
+def test_submit_complaint(complaint_id):
+    """Pass if the shared test complaint was submitted by _submit_complaint"""
+    assert complaint_id is not None, "Test complaint was not submitted"
 
 
 # ============================================
 # TEST 4: GET COMPLAINT DETAILS
 # ============================================
-def test_get_complaint_details(complaint_id):
+@_safe_call
+def test_get_complaint_details(complaint_id, response=None):
     print_header("TEST 4: GET COMPLAINT DETAILS")
     
-    if not complaint_id:
-        print_error("No complaint ID provided")
-        return False
+    assert complaint_id, "No complaint ID provided"
     
-    try:
-        response = requests.get(f"{API_URL}/complaints/{complaint_id}")
-        print_response(response)
-        
-        if response.status_code == 200:
-            data = response.json()
-            print_success("Complaint details retrieved")
-            print_info(f"Title: {data.get('title')}")
-            print_info(f"Status: {data.get('status')}")
-            print_info(f"Upvotes: {data.get('upvotes')}")
-            print_info(f"Downvotes: {data.get('downvotes')}")
-            return True
-        else:
-            print_error("Failed to get complaint details")
-            return False
-    except Exception as e:
-        print_error(f"Get complaint error: {e}")
-        return False
+    response = _get(response, f"{API_URL}/complaints/{complaint_id}")
+    print_response(response)
+    
+    assert response.status_code == 200, "Failed to get complaint details"
+    data = orjson.loads(response.content)
+    print_success("Complaint details retrieved")
+    print_info(f"Title: {data.get('title')}")
+    print_info(f"Status: {data.get('status')}")
+    print_info(f"Upvotes: {data.get('upvotes')}")
+    print_info(f"Downvotes: {data.get('downvotes')}")
 
 
 # ============================================
 # TEST 5: GET MY COMPLAINTS
 # ============================================
-def test_get_my_complaints():
+@_safe_call
+def test_get_my_complaints(response=None):
     print_header("TEST 5: GET MY COMPLAINTS")
     
-    try:
-        response = requests.get(
-            f"{API_URL}/complaints/my",
-            params={"roll_number": TEST_STUDENT["register_number"]}
-        )
-        print_response(response)
-        
-        if response.status_code == 200:
-            data = response.json()
-            count = data.get("count", 0)
-            print_success(f"Retrieved {count} complaint(s)")
-            return True
-        else:
-            print_error("Failed to get my complaints")
-            return False
-    except Exception as e:
-        print_error(f"Get my complaints error: {e}")
-        return False
+    response = _get(response, *MY_COMPLAINTS_GET)
+    print_response(response)
+    
+    assert response.status_code == 200, "Failed to get my complaints"
+    data = orjson.loads(response.content)
+    count = data.get("count", 0)
+    print_success(f"Retrieved {count} complaint(s)")
 
 
 # ============================================
 # TEST 6: GET PUBLIC FEED
 # ============================================
-def test_get_public_feed():
+@_safe_call
+def test_get_public_feed(response=None):
     print_header("TEST 6: GET PUBLIC FEED")
     
-    try:
-        response = requests.get(
-            f"{API_URL}/complaints/public",
-            params={"limit": 10}
-        )
-        print_response(response)
-        
-        if response.status_code == 200:
-            data = response.json()
-            count = data.get("count", 0)
-            print_success(f"Retrieved {count} public complaint(s)")
-            return True
-        else:
-            print_error("Failed to get public feed")
-            return False
-    except Exception as e:
-        print_error(f"Get public feed error: {e}")
-        return False
+    response = _get(response, *PUBLIC_FEED_GET)
+    print_response(response)
+    
+    assert response.status_code == 200, "Failed to get public feed"
+    data = orjson.loads(response.content)
+    count = data.get("count", 0)
+    print_success(f"Retrieved {count} public complaint(s)")
 
 
 # ============================================
 # TEST 7: UPVOTE COMPLAINT
 # ============================================
+@_safe_call
 def test_upvote_complaint(complaint_id):
     print_header("TEST 7: UPVOTE COMPLAINT")
     
-    if not complaint_id:
-        print_error("No complaint ID provided")
-        return False
+    assert complaint_id, "No complaint ID provided"
     
-    try:
-        vote_data = {
-            "complaint_id": complaint_id,
-            "roll_number": "22CS888",  # Different student
-            "vote_type": "upvote"
-        }
-        
-        response = requests.post(
-            f"{API_URL}/vote",
-            json=vote_data,
-            headers={"Content-Type": "application/json"}
-        )
-        print_response(response)
-        
-        if response.status_code == 200:
-            data = response.json()
-            print_success("Upvote successful")
-            print_info(f"Action: {data.get('action')}")
-            print_info(f"Upvotes: {data.get('upvotes')}")
-            print_info(f"Downvotes: {data.get('downvotes')}")
-            return True
-        else:
-            print_error("Failed to upvote")
-            return False
-    except Exception as e:
-        print_error(f"Upvote error: {e}")
-        return False
+    vote_data = {
+        "complaint_id": complaint_id,
+        "roll_number": "22CS888",  # Different student
+        "vote_type": "upvote"
+    }
+    
+    response = SESSION.post(
+        f"{API_URL}/vote",
+        json=vote_data,
+        timeout=TIMEOUT
+    )
+    print_response(response)
+    
+    assert response.status_code == 200, "Failed to upvote"
+    data = orjson.loads(response.content)
+    print_success("Upvote successful")
+    print_info(f"Action: {data.get('action')}")
+    print_info(f"Upvotes: {data.get('upvotes')}")
+    print_info(f"Downvotes: {data.get('downvotes')}")
 
 
 # ============================================
 # TEST 8: DOWNVOTE COMPLAINT
 # ============================================
+@_safe_call
 def test_downvote_complaint(complaint_id):
     print_header("TEST 8: DOWNVOTE COMPLAINT")
     
-    if not complaint_id:
-        print_error("No complaint ID provided")
-        return False
+    assert complaint_id, "No complaint ID provided"
     
-    try:
-        vote_data = {
-            "complaint_id": complaint_id,
-            "roll_number": "22CS777",  # Different student
-            "vote_type": "downvote"
-        }
-        
-        response = requests.post(
-            f"{API_URL}/vote",
-            json=vote_data,
-            headers={"Content-Type": "application/json"}
-        )
-        print_response(response)
-        
-        if response.status_code == 200:
-            data = response.json()
-            print_success("Downvote successful")
-            print_info(f"Action: {data.get('action')}")
-            print_info(f"Upvotes: {data.get('upvotes')}")
-            print_info(f"Downvotes: {data.get('downvotes')}")
-            return True
-        else:
-            print_error("Failed to downvote")
-            return False
-    except Exception as e:
-        print_error(f"Downvote error: {e}")
-        return False
+    vote_data = {
+        "complaint_id": complaint_id,
+        "roll_number": "22CS777",  # Different student
+        "vote_type": "downvote"
+    }
+    
+    response = SESSION.post(
+        f"{API_URL}/vote",
+        json=vote_data,
+        timeout=TIMEOUT
+    )
+    print_response(response)
+    
+    assert response.status_code == 200, "Failed to downvote"
+    data = orjson.loads(response.content)
+    print_success("Downvote successful")
+    print_info(f"Action: {data.get('action')}")
+    print_info(f"Upvotes: {data.get('upvotes')}")
+    print_info(f"Downvotes: {data.get('downvotes')}")
 
 
 # ============================================
 # TEST 9: DUPLICATE VOTE PREVENTION
 # ============================================
+@_safe_call
 def test_duplicate_vote_prevention(complaint_id):
     print_header("TEST 9: DUPLICATE VOTE PREVENTION")
     
-    if not complaint_id:
-        print_error("No complaint ID provided")
-        return False
+    assert complaint_id, "No complaint ID provided"
     
-    try:
-        vote_data = {
-            "complaint_id": complaint_id,
-            "roll_number": "22CS888",  # Same student as Test 7
-            "vote_type": "upvote"
-        }
-        
-        print_info("Voting again with same student (should toggle off)...")
-        response = requests.post(
-            f"{API_URL}/vote",
-            json=vote_data,
-            headers={"Content-Type": "application/json"}
-        )
-        print_response(response)
-        
-        if response.status_code == 200:
-            data = response.json()
-            action = data.get('action')
-            
-            if action == "deleted":
-                print_success("Duplicate vote prevention works! Vote was toggled off")
-                return True
-            elif action == "created":
-                print_success("Vote created (student hadn't voted before)")
-                return True
-            else:
-                print_info(f"Vote action: {action}")
-                return True
-        else:
-            print_error("Duplicate vote test failed")
-            return False
-    except Exception as e:
-        print_error(f"Duplicate vote test error: {e}")
-        return False
+    vote_data = {
+        "complaint_id": complaint_id,
+        "roll_number": "22CS888",  # Same student as Test 7
+        "vote_type": "upvote"
+    }
+    
+    print_info("Voting again with same student (should toggle off)...")
+    response = SESSION.post(
+        f"{API_URL}/vote",
+        json=vote_data,
+        timeout=TIMEOUT
+    )
+    print_response(response)
+    
+    assert response.status_code == 200, "Duplicate vote test failed"
+    data = orjson.loads(response.content)
+    action = data.get('action')
+    
+    if action == "deleted":
+        print_success("Duplicate vote prevention works! Vote was toggled off")
+    elif action == "created":
+        print_success("Vote created (student hadn't voted before)")
+    else:
+        print_info(f"Vote action: {action}")
+
+
+# ============================================
+# TEST 9B: BATCH VOTE WITH A REPEATED ROLL NUMBER
+# ============================================
+@_safe_call
+def test_batch_vote_repeated_roll_number(complaint_id):
+    print_header("TEST 9B: BATCH VOTE WITH A REPEATED ROLL NUMBER")
+    
+    assert complaint_id, "No complaint ID provided"
+    
+    # 22CS666 votes up twice (toggles back to no vote); 22CS555 votes down,
+    # then changes to up. Net result: one new upvote, nothing deleted.
+    batch_data = {
+        "complaint_id": complaint_id,
+        "votes": [
+            {"roll_number": "22CS666", "vote_type": "upvote"},
+            {"roll_number": "22CS555", "vote_type": "downvote"},
+            {"roll_number": "22CS666", "vote_type": "upvote"},
+            {"roll_number": "22CS555", "vote_type": "upvote"}
+        ]
+    }
+    
+    response = SESSION.post(
+        f"{API_URL}/vote/batch",
+        json=batch_data,
+        timeout=TIMEOUT
+    )
+    print_response(response)
+    
+    assert response.status_code == 200, "Batch with a repeated roll number was rejected"
+    
+    data = orjson.loads(response.content)
+    counts = (data.get("created"), data.get("updated"), data.get("deleted"))
+    assert counts == (1, 0, 0), f"Expected (created, updated, deleted) = (1, 0, 0), got {counts}"
+    print_success("Repeated roll numbers collapse to one net vote each")
 
 
 # ============================================
 # TEST 10: VOTE STATISTICS
 # ============================================
-def test_vote_statistics(complaint_id):
+@_safe_call
+def test_vote_statistics(complaint_id, response=None):
     print_header("TEST 10: VOTE STATISTICS")
     
-    if not complaint_id:
-        print_error("No complaint ID provided")
-        return False
+    assert complaint_id, "No complaint ID provided"
     
-    try:
-        response = requests.get(f"{API_URL}/votes/{complaint_id}")
-        print_response(response)
-        
-        if response.status_code == 200:
-            data = response.json()
-            print_success("Vote statistics retrieved")
-            print_info(f"Upvotes: {data.get('upvotes')}")
-            print_info(f"Downvotes: {data.get('downvotes')}")
-            print_info(f"Total: {data.get('total')}")
-            print_info(f"Net votes: {data.get('net_votes')}")
-            return True
-        else:
-            print_error("Failed to get vote statistics")
-            return False
-    except Exception as e:
-        print_error(f"Vote statistics error: {e}")
-        return False
+    response = _get(response, f"{API_URL}/votes/{complaint_id}")
+    print_response(response)
+    
+    assert response.status_code == 200, "Failed to get vote statistics"
+    data = orjson.loads(response.content)
+    print_success("Vote statistics retrieved")
+    print_info(f"Upvotes: {data.get('upvotes')}")
+    print_info(f"Downvotes: {data.get('downvotes')}")
+    print_info(f"Total: {data.get('total')}")
+    print_info(f"Net votes: {data.get('net_votes')}")
 
 
 # ============================================
 # TEST 11: WEBSOCKET STATS
 # ============================================
-def test_websocket_stats():
+@_safe_call
+def test_websocket_stats(response=None):
     print_header("TEST 11: WEBSOCKET STATISTICS")
     
-    try:
-        response = requests.get(f"{API_URL}/ws/stats")
-        print_response(response)
-        
-        if response.status_code == 200:
-            data = response.json()
-            print_success("WebSocket statistics retrieved")
-            print_info(f"Active connections: {data.get('total_active_connections')}")
-            print_info(f"Active complaints: {data.get('active_complaints')}")
-            return True
-        else:
-            print_error("Failed to get WebSocket statistics")
-            return False
-    except Exception as e:
-        print_error(f"WebSocket stats error: {e}")
-        return False
+    response = _get(response, f"{API_URL}/ws/stats")
+    print_response(response)
+    
+    assert response.status_code == 200, "Failed to get WebSocket statistics"
+    data = orjson.loads(response.content)
+    print_success("WebSocket statistics retrieved")
+    print_info(f"Active connections: {data.get('total_active_connections')}")
+    print_info(f"Active complaints: {data.get('active_complaints')}")
 
 
 # ============================================
 # TEST 12: OVERALL STATISTICS
 # ============================================
-def test_overall_statistics():
+@_safe_call
+def test_overall_statistics(response=None):
     print_header("TEST 12: OVERALL STATISTICS")
     
-    try:
-        response = requests.get(f"{API_URL}/stats")
-        print_response(response)
-        
-        if response.status_code == 200:
-            data = response.json()
-            print_success("Overall statistics retrieved")
-            print_info(f"Total students: {data.get('total_students')}")
-            print_info(f"Total complaints: {data.get('total_complaints')}")
-            print_info(f"Total votes: {data.get('total_votes')}")
-            return True
-        else:
-            print_error("Failed to get overall statistics")
-            return False
-    except Exception as e:
-        print_error(f"Overall statistics error: {e}")
-        return False
+    response = _get(response, f"{API_URL}/stats")
+    print_response(response)
+    
+    assert response.status_code == 200, "Failed to get overall statistics"
+    data = orjson.loads(response.content)
+    print_success("Overall statistics retrieved")
+    print_info(f"Total students: {data.get('total_students')}")
+    print_info(f"Total complaints: {data.get('total_complaints')}")
+    print_info(f"Total votes: {data.get('total_votes')}")
 
 
 # ============================================
 # MAIN TEST RUNNER
 # ============================================
+# Every test in summary order; bit i of a result mask is TESTS[i]
+TESTS = (
+    "health_check",
+    "database_health",
+    "submit_complaint",
+    "get_complaint_details",
+    "get_my_complaints",
+    "get_public_feed",
+    "upvote",
+    "downvote",
+    "duplicate_vote",
+    "batch_vote_repeat",
+    "vote_stats",
+    "websocket_stats",
+    "overall_stats"
+)
+_TEST_BITS = {name: 1 << i for i, name in enumerate(TESTS)}
+ALL_TESTS_MASK = (1 << len(TESTS)) - 1
+NEEDS_COMPLAINT_MASK = sum(_TEST_BITS[name] for name in (
+    "get_complaint_details", "get_my_complaints", "get_public_feed",
+    "upvote", "downvote", "duplicate_vote", "batch_vote_repeat", "vote_stats"
+))
+
+def _bit(test_name, passed):
+    """The test's mask bit if it passed, else 0"""
+    return _TEST_BITS[test_name] if passed else 0
+
 def run_all_tests():
     """Run all tests in sequence"""
     print(f"\n{BLUE}{'='*60}{RESET}")
@@ -431,71 +503,77 @@ def run_all_tests():
     print(f"{BLUE}{'='*60}{RESET}")
     print(f"{YELLOW}Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}{RESET}")
     
-    results = {}
+    passed = 0
     complaint_id = None
     
-    # Run tests
-    results['health_check'] = test_health_check()
-    time.sleep(0.5)
-    
-    results['database_health'] = test_database_health()
-    time.sleep(0.5)
+    # Run tests; independent reads are fetched together, then reported in order
+    health, database = prefetch(
+        (f"{API_URL}/health", None),
+        (f"{BASE_URL}/health/database", None)
+    )
+    passed |= _bit("health_check", _run(test_health_check, health))
+    passed |= _bit("database_health", _run(test_database_health, database))
     
-    complaint_id = test_submit_complaint()
-    results['submit_complaint'] = complaint_id is not None
-    time.sleep(1)
+    complaint_id = _submit_complaint()
+    passed |= _bit("submit_complaint", _run(test_submit_complaint, complaint_id))
     
     if complaint_id:
-        results['get_complaint_details'] = test_get_complaint_details(complaint_id)
-        time.sleep(0.5)
-        
-        results['get_my_complaints'] = test_get_my_complaints()
-        time.sleep(0.5)
-        
-        results['get_public_feed'] = test_get_public_feed()
-        time.sleep(0.5)
-        
-        results['upvote'] = test_upvote_complaint(complaint_id)
-        time.sleep(0.5)
-        
-        results['downvote'] = test_downvote_complaint(complaint_id)
-        time.sleep(0.5)
-        
-        results['duplicate_vote'] = test_duplicate_vote_prevention(complaint_id)
-        time.sleep(0.5)
+        details, mine, feed = prefetch(
+            (f"{API_URL}/complaints/{complaint_id}", None),
+            MY_COMPLAINTS_GET,
+            PUBLIC_FEED_GET
+        )
+        passed |= _bit("get_complaint_details", _run(test_get_complaint_details, complaint_id, details))
+        passed |= _bit("get_my_complaints", _run(test_get_my_complaints, mine))
+        passed |= _bit("get_public_feed", _run(test_get_public_feed, feed))
         
-        results['vote_stats'] = test_vote_statistics(complaint_id)
-        time.sleep(0.5)
+        # Votes are writes whose order matters
+        passed |= _bit("upvote", _run(test_upvote_complaint, complaint_id))
+        passed |= _bit("downvote", _run(test_downvote_complaint, complaint_id))
+        passed |= _bit("duplicate_vote", _run(test_duplicate_vote_prevention, complaint_id))
+        passed |= _bit("batch_vote_repeat", _run(test_batch_vote_repeated_roll_number, complaint_id))
+    
+    # Statistics are read after every write above has landed
+    stat_gets = [(f"{API_URL}/ws/stats", None), (f"{API_URL}/stats", None)]
+    if complaint_id:
+        stat_gets.append((f"{API_URL}/votes/{complaint_id}", None))
+    ws_stats, overall, *votes = prefetch(*stat_gets)
+    
+    if complaint_id:
+        passed |= _bit("vote_stats", _run(test_vote_statistics, complaint_id, votes[0]))
     
-    results['websocket_stats'] = test_websocket_stats()
-    time.sleep(0.5)
+    passed |= _bit("websocket_stats", _run(test_websocket_stats, ws_stats))
+    passed |= _bit("overall_stats", _run(test_overall_statistics, overall))
     
-    results['overall_stats'] = test_overall_statistics()
+    # Tests that need a complaint are skipped when submission failed
+    ran = ALL_TESTS_MASK if complaint_id else ALL_TESTS_MASK & ~NEEDS_COMPLAINT_MASK
     
     # Print summary
     print_header("TEST SUMMARY")
     
-    passed = sum(1 for v in results.values() if v)
-    total = len(results)
+    passed_count = bin(passed).count("1")
+    total = bin(ran).count("1")
     
-    for test_name, result in results.items():
-        if result:
+    for i, test_name in enumerate(TESTS):
+        if not (ran >> i) & 1:
+            continue
+        if (passed >> i) & 1:
             print_success(f"{test_name}: PASSED")
         else:
             print_error(f"{test_name}: FAILED")
     
     print(f"\n{BLUE}{'='*60}{RESET}")
-    if passed == total:
-        print(f"{GREEN}✅ ALL TESTS PASSED: {passed}/{total}{RESET}")
+    if passed_count == total:
+        print(f"{GREEN}✅ ALL TESTS PASSED: {passed_count}/{total}{RESET}")
     else:
-        print(f"{YELLOW}⚠️  SOME TESTS FAILED: {passed}/{total} passed{RESET}")
+        print(f"{YELLOW}⚠️  SOME TESTS FAILED: {passed_count}/{total} passed{RESET}")
     print(f"{BLUE}{'='*60}{RESET}")
     
     if complaint_id:
         print(f"\n{YELLOW}📝 Test Complaint ID: {complaint_id}{RESET}")
         print(f"{YELLOW}🔗 View at: {BASE_URL}/docs{RESET}")
     
-    return passed == total
+    return passed_count == total
 
 
 if __name__ == "__main__":
@@ -15,15 +15,94 @@ Tests all scenarios:
 Run: python test_comprehensive.py
 """
 
-import requests
-import json
+import asyncio
+import contextlib
+import functools
+import httpx
+import orjson
 import time
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Tuple
+import io
 import sys
+from types import MappingProxyType
 
 BASE_URL = "http://localhost:8000/api"
 
+# One keep-alive client shared by every scenario. HTTP/2 is used when the
+# server negotiates it (TLS + ALPN); plain http:// stays on HTTP/1.1.
+# Submissions wait on the LLM, hence the long read timeout. Failed
+# connects are retried; sent requests are not (a replayed vote toggles).
+CLIENT = httpx.Client(
+    transport=httpx.HTTPTransport(
+        http2=True,
+        retries=2,
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=32)
+    ),
+    timeout=httpx.Timeout(30.0, connect=2.0),
+    headers={"Content-Type": "application/json"}
+)
+
+# Seconds; a vote batch may trigger a priority recalculation
+VOTE_TIMEOUT = 30.0
+
+# Short-lived GET cache so back-to-back reads of the same URL cost one request
+RESPONSE_CACHE_TTL = 2.0  # seconds
+_response_cache: Dict[str, Tuple[float, object]] = {}
+
+# Independent detail reads are fetched concurrently over one pooled client
+FETCH_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=16)
+FETCH_TIMEOUT = 10.0
+
+def cached_get(url, ttl=RESPONSE_CACHE_TTL):
+    """GET url through CLIENT, reusing a response fetched within ttl seconds"""
+    hit = _response_cache.get(url)
+    if hit and time.monotonic() - hit[0] < ttl:
+        return hit[1]
+    
+    response = CLIENT.get(url)
+    if response.status_code == 200:
+        _response_cache[url] = (time.monotonic(), response)
+    return response
+
+async def _fetch_all(urls):
+    """GET every url concurrently; returns the response or raised exception per url"""
+    async with httpx.AsyncClient(http2=True, limits=FETCH_LIMITS, timeout=FETCH_TIMEOUT) as client:
+        return await asyncio.gather(*(client.get(url) for url in urls), return_exceptions=True)
+
+def cached_get_all(urls, ttl=RESPONSE_CACHE_TTL):
+    """
+    Concurrent cached_get for many urls
+    
+    Returns:
+        Response (or the exception raised) per url, in input order
+    """
+    now = time.monotonic()
+    results = {}
+    for url in urls:
+        hit = _response_cache.get(url)
+        if hit and now - hit[0] < ttl:
+            results[url] = hit[1]
+    
+    missing = [url for url in dict.fromkeys(urls) if url not in results]
+    if missing:
+        fetched_at = time.monotonic()
+        for url, response in zip(missing, asyncio.run(_fetch_all(missing))):
+            results[url] = response
+            if not isinstance(response, Exception) and response.status_code == 200:
+                _response_cache[url] = (fetched_at, response)
+    
+    return [results[url] for url in urls]
+
+def _json(response):
+    """Parse a response body with orjson instead of stdlib json"""
+    return orjson.loads(response.content)
+
+def post_invalidating(url, **kwargs):
+    """POST through CLIENT and drop cached GETs, which the write may have changed"""
+    _response_cache.clear()
+    return CLIENT.post(url, **kwargs)
+
 # Colors
 GREEN = '\033[92m'
 RED = '\033[91m'
@@ -34,6 +113,105 @@ MAGENTA = '\033[95m'
 RESET = '\033[0m'
 BOLD = '\033[1m'
 
+# 5 different students with different complaints (read-only, shared by every run)
+_STUDENT_FIXTURES = (
+    MappingProxyType({
+        "name": "Arun Kumar",
+        "register_number": "22CS045",
+        "department": "CSE",
+        "stay_type": "Hostel",
+        "visibility": "Public",
+        "title": "Library AC not working",
+        "description": "The air conditioning in the main library has been broken for 3 days. Students are unable to study in the hot weather. This affects hundreds of students daily.",
+        "image_url": None
+    }),
+    MappingProxyType({
+        "name": "Priya Sharma",
+        "register_number": "22EC012",
+        "department": "ECE",
+        "stay_type": "Day Scholar",
+        "visibility": "Public",
+        "title": "Mess food quality very poor",
+        "description": "The food quality in mess has deteriorated significantly. Rice is undercooked, curry is watery, and vegetables are not fresh. Multiple students have complained about stomach issues.",
+        "image_url": None
+    }),
+    MappingProxyType({
+        "name": "Rahul Verma",
+        "register_number": "22ME028",
+        "department": "MECH",
+        "stay_type": "Hostel",
+        "visibility": "Public",
+        "title": "Hostel wifi extremely slow",
+        "description": "Hostel block B wifi speed is less than 1 Mbps. Cannot attend online classes or download study materials. Issue persists for 2 weeks.",
+        "image_url": None
+    }),
+    MappingProxyType({
+        "name": "Sneha Reddy",
+        "register_number": "22IT019",
+        "department": "IT",
+        "stay_type": "Day Scholar",
+        "visibility": "Public",
+        "title": "Bus timing inconvenient",
+        "description": "College bus leaves at 6:30 AM which is too early. Many day scholars miss classes because of this. Request to change timing to 7:00 AM.",
+        "image_url": None
+    }),
+    MappingProxyType({
+        "name": "Karthik Menon",
+        "register_number": "22CS067",
+        "department": "CSE",
+        "stay_type": "Hostel",
+        "visibility": "Public",
+        "title": "Library books missing",
+        "description": "Several important reference books for Data Structures course are missing from library. Students need these for exam preparation.",
+        "image_url": None
+    })
+)
+
+# Voting pattern per complaint, as (upvotes, downvotes)
+_VOTING_PATTERNS = (
+    (15, 2),   # Library AC: high priority issue
+    (20, 1),   # Mess food: critical issue
+    (8, 3),    # Hostel wifi: medium issue
+    (5, 8),    # Bus timing: controversial
+    (12, 0)    # Library books: clear need
+)
+
+# Each fixture's submission body, serialised once at import
+_STUDENT_BODIES = tuple(orjson.dumps(dict(student)) for student in _STUDENT_FIXTURES)
+
+# Each pattern's votes as a pre-serialised JSON array, built once at import
+_VOTE_BATCH_JSON = tuple(
+    orjson.dumps(
+        [{"roll_number": f"22XX{idx:02d}{vote_num:03d}", "vote_type": "upvote"} for vote_num in range(upvotes)]
+        + [{"roll_number": f"22YY{idx:02d}{vote_num:03d}", "vote_type": "downvote"} for vote_num in range(downvotes)]
+    )
+    for idx, (upvotes, downvotes) in enumerate(_VOTING_PATTERNS)
+)
+
+# Status change made by each authority
+_STATUS_UPDATES = (
+    MappingProxyType({"complaint_idx": 0, "authority_idx": 0, "new_status": "opened", "reason": "Forwarded to maintenance team for immediate attention"}),
+    MappingProxyType({"complaint_idx": 1, "authority_idx": 1, "new_status": "reviewed", "reason": "Mess committee inspected kitchen. Taking corrective action"}),
+    MappingProxyType({"complaint_idx": 2, "authority_idx": 2, "new_status": "opened", "reason": "IT team notified to check hostel network infrastructure"}),
+    MappingProxyType({"complaint_idx": 3, "authority_idx": 3, "new_status": "reviewed", "reason": "Transport timing reviewed. Will consider in next schedule update"}),
+    MappingProxyType({"complaint_idx": 4, "authority_idx": 4, "new_status": "closed", "reason": "Missing books have been procured and added to library"})
+)
+
+# Public feed table layout, built once at import
+_FEED_ROW = "{:<40} {:<12} {:<10} {:<10}"
+_FEED_TABLE_HEAD = (
+    f"\n{BOLD}Public Feed:{RESET}\n"
+    f"{CYAN}{_FEED_ROW.format('Title', 'Status', 'Priority', 'Votes')}{RESET}\n"
+    f"{CYAN}{'-'*80}{RESET}"
+)
+
+_PRIORITY_COLORS = {
+    'low': GREEN,
+    'medium': YELLOW,
+    'high': MAGENTA,
+    'critical': RED
+}
+
 # Test data storage
 test_data = {
     "students": [],
@@ -42,17 +220,21 @@ test_data = {
     "votes": []
 }
 
+# Rules for headers and sections, built once
+_HEADER_RULE = f"{BLUE}{'='*80}{RESET}"
+_SECTION_RULE = f"{CYAN}{'─'*80}{RESET}"
+
+def _emit(*lines):
+    """Write several lines with one stdout write instead of a print per line"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
 def print_header(text):
     """Print styled header"""
-    print(f"\n{BLUE}{'='*80}{RESET}")
-    print(f"{BLUE}{BOLD}{text:^80}{RESET}")
-    print(f"{BLUE}{'='*80}{RESET}\n")
+    _emit("", _HEADER_RULE, f"{BLUE}{BOLD}{text:^80}{RESET}", _HEADER_RULE, "")
 
 def print_section(text):
     """Print section header"""
-    print(f"\n{CYAN}{'─'*80}{RESET}")
-    print(f"{CYAN}{BOLD}{text}{RESET}")
-    print(f"{CYAN}{'─'*80}{RESET}")
+    _emit("", _SECTION_RULE, f"{CYAN}{BOLD}{text}{RESET}", _SECTION_RULE)
 
 def print_success(text):
     """Print success message"""
@@ -70,83 +252,46 @@ def print_test(number, total, text):
     """Print test number"""
     print(f"\n{MAGENTA}{BOLD}[TEST {number}/{total}] {text}{RESET}")
 
+def buffered_output(scenario):
+    """
+    Collect everything a scenario prints and emit it with one write
+    
+    Keeps stdout syscalls out of the request loops when output is piped (CI)
+    """
+    @functools.wraps(scenario)
+    def wrapper(*args, **kwargs):
+        buf = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(buf):
+                return scenario(*args, **kwargs)
+        finally:
+            sys.stdout.write(buf.getvalue())
+            sys.stdout.flush()
+    return wrapper
+
 
 # ============================================
 # SCENARIO 1: STUDENTS SUBMIT COMPLAINTS
 # ============================================
 
+@buffered_output
 def scenario_1_students_submit_complaints():
     """Multiple students submit different types of complaints"""
     print_header("SCENARIO 1: STUDENTS SUBMIT COMPLAINTS")
     
-    # Define 5 different students with different complaints
-    students = [
-        {
-            "name": "Arun Kumar",
-            "register_number": "22CS045",
-            "department": "CSE",
-            "stay_type": "Hostel",
-            "visibility": "Public",
-            "title": "Library AC not working",
-            "description": "The air conditioning in the main library has been broken for 3 days. Students are unable to study in the hot weather. This affects hundreds of students daily.",
-            "image_url": None
-        },
-        {
-            "name": "Priya Sharma",
-            "register_number": "22EC012",
-            "department": "ECE",
-            "stay_type": "Day Scholar",
-            "visibility": "Public",
-            "title": "Mess food quality very poor",
-            "description": "The food quality in mess has deteriorated significantly. Rice is undercooked, curry is watery, and vegetables are not fresh. Multiple students have complained about stomach issues.",
-            "image_url": None
-        },
-        {
-            "name": "Rahul Verma",
-            "register_number": "22ME028",
-            "department": "MECH",
-            "stay_type": "Hostel",
-            "visibility": "Public",
-            "title": "Hostel wifi extremely slow",
-            "description": "Hostel block B wifi speed is less than 1 Mbps. Cannot attend online classes or download study materials. Issue persists for 2 weeks.",
-            "image_url": None
-        },
-        {
-            "name": "Sneha Reddy",
-            "register_number": "22IT019",
-            "department": "IT",
-            "stay_type": "Day Scholar",
-            "visibility": "Public",
-            "title": "Bus timing inconvenient",
-            "description": "College bus leaves at 6:30 AM which is too early. Many day scholars miss classes because of this. Request to change timing to 7:00 AM.",
-            "image_url": None
-        },
-        {
-            "name": "Karthik Menon",
-            "register_number": "22CS067",
-            "department": "CSE",
-            "stay_type": "Hostel",
-            "visibility": "Public",
-            "title": "Library books missing",
-            "description": "Several important reference books for Data Structures course are missing from library. Students need these for exam preparation.",
-            "image_url": None
-        }
-    ]
-    
-    print_info(f"Submitting {len(students)} complaints from different students...")
+    print_info(f"Submitting {len(_STUDENT_FIXTURES)} complaints from different students...")
     
-    for idx, student in enumerate(students, 1):
-        print_test(idx, len(students), f"Student: {student['name']} - {student['title']}")
+    for idx, (student, body) in enumerate(zip(_STUDENT_FIXTURES, _STUDENT_BODIES), 1):
+        print_test(idx, len(_STUDENT_FIXTURES), f"Student: {student['name']} - {student['title']}")
         
         try:
-            response = requests.post(
+            response = post_invalidating(
                 f"{BASE_URL}/complaints",
-                json=student,
-                headers={"Content-Type": "application/json"}
+                content=body
             )
             
             if response.status_code == 201:
-                data = response.json()
+                data = _json(response)
                 
                 # Store student and complaint data
                 test_data["students"].append({
@@ -178,8 +323,6 @@ def scenario_1_students_submit_complaints():
         
         except Exception as e:
             print_error(f"Error: {e}")
-        
-        time.sleep(0.5)
     
     print_section("SUMMARY")
     print(f"Total complaints submitted: {GREEN}{len(test_data['complaints'])}{RESET}")
@@ -201,6 +344,7 @@ def scenario_1_students_submit_complaints():
 # SCENARIO 2: STUDENTS VIEW THEIR COMPLAINTS
 # ============================================
 
+@buffered_output
 def scenario_2_students_view_own_complaints():
     """Each student views their own submitted complaints"""
     print_header("SCENARIO 2: STUDENTS VIEW THEIR OWN COMPLAINTS")
@@ -213,13 +357,13 @@ def scenario_2_students_view_own_complaints():
         print_test(idx, len(test_data["students"]), f"Viewing complaints for {student['name']}")
         
         try:
-            response = requests.get(
+            response = CLIENT.get(
                 f"{BASE_URL}/complaints/my",
                 params={"roll_number": student["roll_number"]}
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = _json(response)
                 count = data.get("count", 0)
                 
                 print_success(f"Found {count} complaint(s)")
@@ -231,8 +375,6 @@ def scenario_2_students_view_own_complaints():
         
         except Exception as e:
             print_error(f"Error: {e}")
-        
-        time.sleep(0.3)
     
     return True
 
@@ -241,30 +383,30 @@ def scenario_2_students_view_own_complaints():
 # SCENARIO 3: STUDENTS VIEW PUBLIC FEED
 # ============================================
 
+@buffered_output
 def scenario_3_view_public_feed():
     """Students view public complaints feed"""
     print_header("SCENARIO 3: STUDENTS VIEW PUBLIC FEED")
     
     try:
-        response = requests.get(f"{BASE_URL}/complaints/public?limit=10")
+        response = CLIENT.get(f"{BASE_URL}/complaints/public?limit=10")
         
         if response.status_code == 200:
-            data = response.json()
+            data = _json(response)
             complaints = data.get("complaints", [])
             
             print_success(f"Retrieved {len(complaints)} public complaints")
             
-            print(f"\n{BOLD}Public Feed:{RESET}")
-            print(f"{CYAN}{'Title':<40} {'Status':<12} {'Priority':<10} {'Votes':<10}{RESET}")
-            print(f"{CYAN}{'-'*80}{RESET}")
-            
-            for c in complaints:
-                title = c['title'][:38]
-                status = c['status']
-                priority = c['priority']
-                votes = f"↑{c['upvotes']} ↓{c['downvotes']}"
-                
-                print(f"{title:<40} {status:<12} {priority:<10} {votes:<10}")
+            # Build the whole table, then print it in one call
+            lines = [_FEED_TABLE_HEAD]
+            lines.extend(
+                _FEED_ROW.format(
+                    c['title'][:38], c['status'], c['priority'],
+                    f"↑{c['upvotes']} ↓{c['downvotes']}"
+                )
+                for c in complaints
+            )
+            print("\n".join(lines))
             
             return True
         else:
@@ -280,6 +422,7 @@ def scenario_3_view_public_feed():
 # SCENARIO 4: STUDENTS VOTE ON COMPLAINTS
 # ============================================
 
+@buffered_output
 def scenario_4_students_vote():
     """Students vote on various complaints"""
     print_header("SCENARIO 4: STUDENTS VOTE ON COMPLAINTS")
@@ -288,82 +431,39 @@ def scenario_4_students_vote():
         print_error("No complaints found. Run scenario 1 first.")
         return False
     
-    # Create voting patterns
-    # - Library AC: 15 upvotes, 2 downvotes (high priority issue)
-    # - Mess food: 20 upvotes, 1 downvote (critical issue)
-    # - Hostel wifi: 8 upvotes, 3 downvotes (medium issue)
-    # - Bus timing: 5 upvotes, 8 downvotes (controversial)
-    # - Library books: 12 upvotes, 0 downvotes (clear need)
-    
-    voting_patterns = [
-        {"upvotes": 15, "downvotes": 2},   # Library AC
-        {"upvotes": 20, "downvotes": 1},   # Mess food
-        {"upvotes": 8, "downvotes": 3},    # Hostel wifi
-        {"upvotes": 5, "downvotes": 8},    # Bus timing
-        {"upvotes": 12, "downvotes": 0}    # Library books
-    ]
+    complaints = test_data["complaints"][:len(_VOTE_BATCH_JSON)]
     
-    for idx, complaint in enumerate(test_data["complaints"]):
-        if idx >= len(voting_patterns):
-            break
-        
-        pattern = voting_patterns[idx]
+    for idx, (complaint, votes_json) in enumerate(zip(complaints, _VOTE_BATCH_JSON)):
         complaint_id = complaint["complaint_id"]
         
         print_test(idx + 1, len(test_data["complaints"]), 
                   f"Voting on: {complaint['title'][:50]}")
         
-        # Simulate upvotes
-        for vote_num in range(pattern["upvotes"]):
-            voter_roll = f"22XX{idx:02d}{vote_num:03d}"
-            
-            try:
-                response = requests.post(
-                    f"{BASE_URL}/vote",
-                    json={
-                        "complaint_id": complaint_id,
-                        "roll_number": voter_roll,
-                        "vote_type": "upvote"
-                    }
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    # Check if priority was updated
-                    if data.get("priority_updated"):
-                        print(f"   📊 Priority updated: {data['old_priority']} → {GREEN}{data['new_priority']}{RESET}")
-            
-            except Exception as e:
-                print_error(f"Upvote error: {e}")
-        
-        # Simulate downvotes
-        for vote_num in range(pattern["downvotes"]):
-            voter_roll = f"22YY{idx:02d}{vote_num:03d}"
-            
-            try:
-                response = requests.post(
-                    f"{BASE_URL}/vote",
-                    json={
-                        "complaint_id": complaint_id,
-                        "roll_number": voter_roll,
-                        "vote_type": "downvote"
-                    }
-                )
-            
-            except Exception as e:
-                print_error(f"Downvote error: {e}")
+        # Every vote for this complaint goes out in one batch request;
+        # only the complaint id is serialised per call
+        body = b'{"complaint_id":' + orjson.dumps(complaint_id) + b',"votes":' + votes_json + b'}'
         
-        # Get final vote stats
         try:
-            response = requests.get(f"{BASE_URL}/votes/{complaint_id}")
+            response = post_invalidating(
+                f"{BASE_URL}/vote/batch",
+                content=body,
+                timeout=VOTE_TIMEOUT
+            )
+            
             if response.status_code == 200:
-                stats = response.json()
-                print_success(f"Voting complete: ↑{stats['upvotes']} ↓{stats['downvotes']} (Net: {stats['net_votes']})")
-        except:
-            pass
+                data = _json(response)
+                
+                # Check if priority was updated
+                if data.get("priority_updated"):
+                    print(f"   📊 Priority updated: {data['old_priority']} → {GREEN}{data['new_priority']}{RESET}")
+                
+                print_success(f"Voting complete: ↑{data['upvotes']} ↓{data['downvotes']} (Net: {data['net_votes']})")
+            else:
+                print_error(f"Failed to vote: {response.status_code}")
+                print(response.text)
         
-        time.sleep(0.5)
+        except Exception as e:
+            print_error(f"Vote error: {e}")
     
     return True
 
@@ -372,6 +472,7 @@ def scenario_4_students_vote():
 # SCENARIO 5: AUTHORITIES VIEW ASSIGNED COMPLAINTS
 # ============================================
 
+@buffered_output
 def scenario_5_authorities_view_complaints():
     """Different authorities view their assigned complaints"""
     print_header("SCENARIO 5: AUTHORITIES VIEW ASSIGNED COMPLAINTS")
@@ -391,12 +492,12 @@ def scenario_5_authorities_view_complaints():
         print_test(idx, len(authorities), f"{authority['name']} viewing assigned complaints")
         
         try:
-            response = requests.get(
+            response = CLIENT.get(
                 f"{BASE_URL}/authority/{authority['type']}/complaints"
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = _json(response)
                 complaints = data.get("complaints", [])
                 
                 print_success(f"Found {len(complaints)} assigned complaint(s)")
@@ -408,8 +509,6 @@ def scenario_5_authorities_view_complaints():
         
         except Exception as e:
             print_error(f"Error: {e}")
-        
-        time.sleep(0.5)
     
     return True
 
@@ -418,6 +517,7 @@ def scenario_5_authorities_view_complaints():
 # SCENARIO 6: AUTHORITIES CHANGE STATUS
 # ============================================
 
+@buffered_output
 def scenario_6_authorities_change_status():
     """Authorities update complaint statuses"""
     print_header("SCENARIO 6: AUTHORITIES CHANGE COMPLAINT STATUS")
@@ -426,35 +526,26 @@ def scenario_6_authorities_change_status():
         print_error("Need complaints and authorities. Run scenarios 1 and 5 first.")
         return False
     
-    # Define status changes
-    status_updates = [
-        {"complaint_idx": 0, "authority_idx": 0, "new_status": "opened", "reason": "Forwarded to maintenance team for immediate attention"},
-        {"complaint_idx": 1, "authority_idx": 1, "new_status": "reviewed", "reason": "Mess committee inspected kitchen. Taking corrective action"},
-        {"complaint_idx": 2, "authority_idx": 2, "new_status": "opened", "reason": "IT team notified to check hostel network infrastructure"},
-        {"complaint_idx": 3, "authority_idx": 3, "new_status": "reviewed", "reason": "Transport timing reviewed. Will consider in next schedule update"},
-        {"complaint_idx": 4, "authority_idx": 4, "new_status": "closed", "reason": "Missing books have been procured and added to library"}
-    ]
-    
-    for idx, update in enumerate(status_updates, 1):
+    for idx, update in enumerate(_STATUS_UPDATES, 1):
         complaint = test_data["complaints"][update["complaint_idx"]]
         authority = test_data["authorities"][update["authority_idx"]]
         
-        print_test(idx, len(status_updates), 
+        print_test(idx, len(_STATUS_UPDATES), 
                   f"{authority['name']} updating: {complaint['title'][:45]}")
         
         try:
-            response = requests.post(
+            response = post_invalidating(
                 f"{BASE_URL}/status/update",
-                json={
+                content=orjson.dumps({
                     "complaint_id": complaint["complaint_id"],
                     "new_status": update["new_status"],
                     "updated_by_roll": authority["id"],
                     "reason": update["reason"]
-                }
+                })
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = _json(response)
                 
                 print_success(f"Status updated: {data['old_status'].upper()} → {data['new_status'].upper()}")
                 print(f"   Reason: {update['reason']}")
@@ -467,8 +558,6 @@ def scenario_6_authorities_change_status():
         
         except Exception as e:
             print_error(f"Error: {e}")
-        
-        time.sleep(0.5)
     
     return True
 
@@ -477,6 +566,7 @@ def scenario_6_authorities_change_status():
 # SCENARIO 7: ADMIN VIEWS ALL DETAILS
 # ============================================
 
+@buffered_output
 def scenario_7_admin_view_system():
     """Admin views comprehensive system statistics"""
     print_header("SCENARIO 7: ADMIN VIEWS SYSTEM DETAILS")
@@ -484,35 +574,37 @@ def scenario_7_admin_view_system():
     print_section("Overall Statistics")
     
     try:
-        response = requests.get(f"{BASE_URL}/stats")
+        response = cached_get(f"{BASE_URL}/stats")
         
         if response.status_code == 200:
-            stats = response.json()
+            stats = _json(response)
             
-            print(f"\n{BOLD}System Overview:{RESET}")
-            print(f"  Total Students: {GREEN}{stats.get('total_students', 0)}{RESET}")
-            print(f"  Total Complaints: {GREEN}{stats.get('total_complaints', 0)}{RESET}")
-            print(f"  Total Votes: {GREEN}{stats.get('total_votes', 0)}{RESET}")
+            parts = [
+                f"\n{BOLD}System Overview:{RESET}",
+                f"  Total Students: {GREEN}{stats.get('total_students', 0)}{RESET}",
+                f"  Total Complaints: {GREEN}{stats.get('total_complaints', 0)}{RESET}",
+                f"  Total Votes: {GREEN}{stats.get('total_votes', 0)}{RESET}"
+            ]
             
             # Complaints by status
             status_breakdown = stats.get('complaints_by_status', {})
             if status_breakdown:
-                print(f"\n{BOLD}Complaints by Status:{RESET}")
-                for status, count in status_breakdown.items():
-                    print(f"  • {status.upper()}: {count}")
+                parts.append(f"\n{BOLD}Complaints by Status:{RESET}")
+                parts.extend(
+                    f"  • {status.upper()}: {count}"
+                    for status, count in status_breakdown.items()
+                )
             
             # Complaints by priority
             priority_breakdown = stats.get('complaints_by_priority', {})
             if priority_breakdown:
-                print(f"\n{BOLD}Complaints by Priority:{RESET}")
-                for priority, count in priority_breakdown.items():
-                    color = {
-                        'low': GREEN,
-                        'medium': YELLOW,
-                        'high': MAGENTA,
-                        'critical': RED
-                    }.get(priority, RESET)
-                    print(f"  • {color}{priority.upper()}: {count}{RESET}")
+                parts.append(f"\n{BOLD}Complaints by Priority:{RESET}")
+                parts.extend(
+                    f"  • {_PRIORITY_COLORS.get(priority, RESET)}{priority.upper()}: {count}{RESET}"
+                    for priority, count in priority_breakdown.items()
+                )
+            
+            print("\n".join(parts))
         
         else:
             print_error(f"Failed to fetch stats: {response.status_code}")
@@ -522,26 +614,36 @@ def scenario_7_admin_view_system():
     
     print_section("Detailed Complaint View")
     
-    # View each complaint in detail
-    for idx, complaint in enumerate(test_data["complaints"], 1):
+    # Fetch every complaint's details at once, then view each in order
+    responses = cached_get_all([
+        f"{BASE_URL}/complaints/{complaint['complaint_id']}"
+        for complaint in test_data["complaints"]
+    ])
+    
+    for idx, (complaint, response) in enumerate(zip(test_data["complaints"], responses), 1):
         print(f"\n{BOLD}[{idx}] {complaint['title']}{RESET}")
         
         try:
-            response = requests.get(f"{BASE_URL}/complaints/{complaint['complaint_id']}")
+            if isinstance(response, Exception):
+                raise response
             
             if response.status_code == 200:
-                data = response.json()
+                data = _json(response)
                 
-                print(f"  Student: {data['student']['name']} ({data['student']['roll_number']})")
-                print(f"  Status: {data['status'].upper()}")
-                print(f"  Priority: {data['priority'].upper()}")
-                print(f"  Votes: ↑{data['upvotes']} ↓{data['downvotes']} (Net: {data['net_votes']})")
-                print(f"  Assigned to: {data['assigned_authority']}")
-                print(f"  Category: {data['category']}")
+                parts = [
+                    f"  Student: {data['student']['name']} ({data['student']['roll_number']})",
+                    f"  Status: {data['status'].upper()}",
+                    f"  Priority: {data['priority'].upper()}",
+                    f"  Votes: ↑{data['upvotes']} ↓{data['downvotes']} (Net: {data['net_votes']})",
+                    f"  Assigned to: {data['assigned_authority']}",
+                    f"  Category: {data['category']}"
+                ]
                 
                 llm = data.get('llm_analysis')
                 if llm:
-                    print(f"  AI Summary: {llm.get('summary', 'N/A')}")
+                    parts.append(f"  AI Summary: {llm.get('summary', 'N/A')}")
+                
+                print("\n".join(parts))
         
         except Exception as e:
             print_error(f"Error fetching details: {e}")
@@ -553,37 +655,53 @@ def scenario_7_admin_view_system():
 # SCENARIO 8: VERIFY PRIORITY CHANGES
 # ============================================
 
+@buffered_output
 def scenario_8_verify_priority_changes():
     """Verify that priorities changed based on votes"""
     print_header("SCENARIO 8: VERIFY PRIORITY CHANGES FROM VOTING")
     
     print_info("Checking if priorities were automatically updated based on votes...")
     
+    if not test_data["complaints"]:
+        print_info("No complaints to check")
+        return True
+    
+    # One batch read for every complaint instead of a GET per complaint
+    ids = ",".join(complaint["complaint_id"] for complaint in test_data["complaints"])
+    try:
+        response = cached_get(f"{BASE_URL}/complaints?ids={ids}")
+        if response.status_code != 200:
+            print_error(f"Failed to fetch complaints: {response.status_code}")
+            return False
+        by_id = {data["complaint_id"]: data for data in _json(response)["complaints"]}
+    except Exception as e:
+        print_error(f"Error: {e}")
+        return False
+    
     for idx, complaint in enumerate(test_data["complaints"], 1):
-        print(f"\n{BOLD}[{idx}] {complaint['title']}{RESET}")
+        heading = f"\n{BOLD}[{idx}] {complaint['title']}{RESET}"
         
-        try:
-            response = requests.get(f"{BASE_URL}/complaints/{complaint['complaint_id']}")
-            
-            if response.status_code == 200:
-                data = response.json()
-                
-                original_priority = complaint.get("priority", "unknown")
-                current_priority = data.get("priority", "unknown")
-                upvotes = data.get("upvotes", 0)
-                downvotes = data.get("downvotes", 0)
-                
-                print(f"  Original Priority: {original_priority}")
-                print(f"  Current Priority: {current_priority}")
-                print(f"  Votes: ↑{upvotes} ↓{downvotes}")
-                
-                if original_priority != current_priority:
-                    print_success(f"Priority changed: {original_priority} → {current_priority}")
-                else:
-                    print_info(f"Priority unchanged (still {current_priority})")
+        data = by_id.get(complaint["complaint_id"])
+        if data is None:
+            _emit(heading, f"{RED}❌ Complaint {complaint['complaint_id']} not found{RESET}")
+            continue
         
-        except Exception as e:
-            print_error(f"Error: {e}")
+        original_priority = complaint.get("priority", "unknown")
+        current_priority = data.get("priority", "unknown")
+        
+        if original_priority != current_priority:
+            verdict = f"{GREEN}✅ Priority changed: {original_priority} → {current_priority}{RESET}"
+        else:
+            verdict = f"{YELLOW}ℹ️  Priority unchanged (still {current_priority}){RESET}"
+        
+        # One write per complaint
+        _emit(
+            heading,
+            f"  Original Priority: {original_priority}",
+            f"  Current Priority: {current_priority}",
+            f"  Votes: ↑{data.get('upvotes', 0)} ↓{data.get('downvotes', 0)}",
+            verdict
+        )
     
     return True
 
@@ -600,30 +718,16 @@ def run_comprehensive_tests():
     
     results = {}
     
-    # Run scenarios
+    # Run scenarios back to back; every call returns only after its responses arrive
     print_section("Starting Test Scenarios...")
     
     results['scenario_1'] = scenario_1_students_submit_complaints()
-    time.sleep(1)
-    
     results['scenario_2'] = scenario_2_students_view_own_complaints()
-    time.sleep(1)
-    
     results['scenario_3'] = scenario_3_view_public_feed()
-    time.sleep(1)
-    
     results['scenario_4'] = scenario_4_students_vote()
-    time.sleep(1)
-    
     results['scenario_5'] = scenario_5_authorities_view_complaints()
-    time.sleep(1)
-    
     results['scenario_6'] = scenario_6_authorities_change_status()
-    time.sleep(1)
-    
     results['scenario_7'] = scenario_7_admin_view_system()
-    time.sleep(1)
-    
     results['scenario_8'] = scenario_8_verify_priority_changes()
     
     # Print final summary
@@ -7,14 +7,44 @@ End-to-End Test Script
 5. Student checks if status reflected
 """
 
-import requests
-import json
+import httpx
+import orjson
 import time
 from datetime import datetime
 import sys
 
 BASE_URL = "http://localhost:8000/api"
 
+# One keep-alive client shared by every step. HTTP/2 is used when the
+# server negotiates it (TLS + ALPN); plain http:// stays on HTTP/1.1.
+# Connection failures are retried by the transport.
+CLIENT = httpx.Client(
+    transport=httpx.HTTPTransport(
+        http2=True,
+        retries=2,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
+    ),
+    headers={"Content-Type": "application/json"}
+)
+
+# Read timeout for every call, with a shorter connect timeout, so a hung
+# socket cannot stall the test
+TIMEOUT = httpx.Timeout(10.0, connect=3.0)
+
+# Status change propagation is polled rather than waited out
+STATUS_POLL_TIMEOUT = 2.0   # seconds
+STATUS_POLL_INTERVAL = 0.1  # seconds
+
+# Back-to-back steps (e.g. stdin piped in CI) reuse the last complaint read
+COMPLAINT_CACHE_TTL = 0.5  # seconds
+
+# Fields every E2E complaint submits unchanged
+_COMPLAINT_TEMPLATE = {
+    "stay_type": "Hostel",
+    "visibility": "Public",
+    "image_url": None
+}
+
 # Colors
 GREEN = '\033[92m'
 RED = '\033[91m'
@@ -25,17 +55,36 @@ MAGENTA = '\033[95m'
 RESET = '\033[0m'
 BOLD = '\033[1m'
 
+# Status display strings, built once at import
+STATUSES = ('raised', 'opened', 'reviewed', 'closed')
+_STATUS_COLORS = {'raised': YELLOW, 'opened': BLUE, 'reviewed': CYAN, 'closed': GREEN}
+_COLORIZED_STATUS = {s: f"{c}{s.upper()}{RESET}" for s, c in _STATUS_COLORS.items()}
+
+# Per status: (option line when it is the current status, option line otherwise)
+_STATUS_OPTIONS = {
+    s: (f"[✓] {YELLOW}{s.upper()}{RESET}", f"[ ] {GREEN}{s.upper()}{RESET}")
+    for s in STATUSES
+}
+
+def _json(response):
+    """Parse a response body with orjson instead of stdlib json"""
+    return orjson.loads(response.content)
+
+# Rules for headers and sections, built once
+_HEADER_RULE = f"{BLUE}{'='*70}{RESET}"
+_SECTION_RULE = f"{CYAN}{'─'*70}{RESET}"
+
+def _emit(*lines):
+    """Write several lines with one stdout write instead of a print per line"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
 def print_header(text):
     """Print styled header"""
-    print(f"\n{BLUE}{'='*70}{RESET}")
-    print(f"{BLUE}{BOLD}{text:^70}{RESET}")
-    print(f"{BLUE}{'='*70}{RESET}\n")
+    _emit("", _HEADER_RULE, f"{BLUE}{BOLD}{text:^70}{RESET}", _HEADER_RULE, "")
 
 def print_section(text):
     """Print section header"""
-    print(f"\n{CYAN}{'─'*70}{RESET}")
-    print(f"{CYAN}{BOLD}{text}{RESET}")
-    print(f"{CYAN}{'─'*70}{RESET}")
+    _emit("", _SECTION_RULE, f"{CYAN}{BOLD}{text}{RESET}", _SECTION_RULE)
 
 def print_success(text):
     """Print success message"""
@@ -61,6 +110,9 @@ def pause(message="Press Enter to continue..."):
 class EndToEndTest:
     """Complete end-to-end workflow test"""
     
+    # Whether the server exposes POST /status/update; probed once per process
+    _status_endpoint_available = None
+    
     def __init__(self):
         self.student_name = None
         self.student_roll = None
@@ -68,6 +120,8 @@ class EndToEndTest:
         self.authority_roll = None
         self.complaint_id = None
         self.complaint_data = None
+        self._last_complaint = None
+        self._last_complaint_ts = 0.0
     
     def setup_student(self):
         """Setup student details"""
@@ -94,50 +148,53 @@ class EndToEndTest:
         # Get complaint details
         print(f"\n{CYAN}Enter complaint details:{RESET}")
         
+        # One timestamp for both defaults; the title takes its HH:MM:SS part
+        submitted_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
         title = input(f"{YELLOW}Title (or Enter for default): {RESET}").strip()
         if not title:
-            title = f"Test Complaint - {datetime.now().strftime('%H:%M:%S')}"
+            title = f"Test Complaint - {submitted_at[11:]}"
         
         description = input(f"{YELLOW}Description (or Enter for default): {RESET}").strip()
         if not description:
-            description = f"This is an automated end-to-end test complaint submitted at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}. Testing the complete workflow from submission to status update."
+            description = f"This is an automated end-to-end test complaint submitted at {submitted_at}. Testing the complete workflow from submission to status update."
         
         department = input(f"{YELLOW}Department (default: CSE): {RESET}").strip() or "CSE"
         
         # Prepare complaint data
         complaint_data = {
+            **_COMPLAINT_TEMPLATE,
             "name": self.student_name,
             "register_number": self.student_roll,
             "department": department,
-            "stay_type": "Hostel",
-            "visibility": "Public",
             "title": title,
-            "description": description,
-            "image_url": None
+            "description": description
         }
         
         print_info("Submitting complaint...")
         
         try:
-            response = requests.post(
+            response = CLIENT.post(
                 f"{BASE_URL}/complaints",
-                json=complaint_data,
-                headers={"Content-Type": "application/json"}
+                content=orjson.dumps(complaint_data),
+                timeout=TIMEOUT
             )
             
             if response.status_code == 201:
-                data = response.json()
+                data = _json(response)
                 self.complaint_id = data.get("complaint_id")
                 
-                print_success("Complaint submitted successfully!")
-                print(f"\n{BOLD}Complaint Details:{RESET}")
-                print(f"  ID: {CYAN}{self.complaint_id}{RESET}")
-                print(f"  Title: {data.get('title')}")
-                print(f"  Priority: {data.get('priority').upper()}")
-                print(f"  Category: {data.get('category')}")
-                print(f"  Status: {YELLOW}{data.get('status', 'raised').upper()}{RESET}")
-                print(f"  Assigned to: {data.get('assigned_to')}")
-                print(f"  Authority Email: {data.get('authority_email')}")
+                _emit(
+                    f"{GREEN}✅ Complaint submitted successfully!{RESET}",
+                    f"\n{BOLD}Complaint Details:{RESET}",
+                    f"  ID: {CYAN}{self.complaint_id}{RESET}",
+                    f"  Title: {data.get('title')}",
+                    f"  Priority: {data.get('priority').upper()}",
+                    f"  Category: {data.get('category')}",
+                    f"  Status: {YELLOW}{data.get('status', 'raised').upper()}{RESET}",
+                    f"  Assigned to: {data.get('assigned_to')}",
+                    f"  Authority Email: {data.get('authority_email')}"
+                )
                 
                 # Store initial data
                 self.complaint_data = {
@@ -157,29 +214,27 @@ class EndToEndTest:
             print_error(f"Error submitting complaint: {e}")
             return False
     
-    def student_check_complaint(self, show_full_details=False):
-        """Student checks their complaint"""
+    def student_check_complaint(self, show_full_details=False, quiet=False, force=False):
+        """Student checks their complaint (force=True skips the short-lived cache)"""
         if not self.complaint_id:
             print_error("No complaint ID available")
             return None
         
+        now = time.monotonic()
+        if not force and self._last_complaint and now - self._last_complaint_ts < COMPLAINT_CACHE_TTL:
+            if not quiet:
+                self._show_complaint(self._last_complaint, show_full_details)
+            return self._last_complaint
+        
         try:
-            response = requests.get(f"{BASE_URL}/complaints/{self.complaint_id}")
+            response = CLIENT.get(f"{BASE_URL}/complaints/{self.complaint_id}", timeout=TIMEOUT)
             
             if response.status_code == 200:
-                complaint = response.json()
+                complaint = _json(response)
+                self._last_complaint, self._last_complaint_ts = complaint, time.monotonic()
                 
-                if show_full_details:
-                    print(f"\n{BOLD}Full Complaint Details:{RESET}")
-                    print(json.dumps(complaint, indent=2))
-                else:
-                    print(f"\n{BOLD}Complaint Status:{RESET}")
-                    print(f"  ID: {complaint.get('complaint_id')}")
-                    print(f"  Title: {complaint.get('title')}")
-                    print(f"  Status: {self._colorize_status(complaint.get('status'))}")
-                    print(f"  Priority: {complaint.get('priority').upper()}")
-                    print(f"  Upvotes: {GREEN}{complaint.get('upvotes')}{RESET}")
-                    print(f"  Downvotes: {RED}{complaint.get('downvotes')}{RESET}")
+                if not quiet:
+                    self._show_complaint(complaint, show_full_details)
                 
                 return complaint
             else:
@@ -190,6 +245,20 @@ class EndToEndTest:
             print_error(f"Error fetching complaint: {e}")
             return None
     
+    def _show_complaint(self, complaint, show_full_details=False):
+        """Print a fetched complaint"""
+        if show_full_details:
+            print(f"\n{BOLD}Full Complaint Details:{RESET}")
+            print(orjson.dumps(complaint, option=orjson.OPT_INDENT_2).decode())
+        else:
+            print(f"\n{BOLD}Complaint Status:{RESET}")
+            print(f"  ID: {complaint.get('complaint_id')}")
+            print(f"  Title: {complaint.get('title')}")
+            print(f"  Status: {self._colorize_status(complaint.get('status'))}")
+            print(f"  Priority: {complaint.get('priority').upper()}")
+            print(f"  Upvotes: {GREEN}{complaint.get('upvotes')}{RESET}")
+            print(f"  Downvotes: {RED}{complaint.get('downvotes')}{RESET}")
+    
     def authority_view_complaint(self):
         """Authority views the complaint"""
         print_step(2, "AUTHORITY VIEWS COMPLAINT")
@@ -237,12 +306,11 @@ class EndToEndTest:
         print(f"\n{BOLD}Current Status:{RESET} {self._colorize_status(current_status)}")
         
         # Show available status options
-        statuses = ['raised', 'opened', 'reviewed', 'closed']
+        statuses = STATUSES
         print(f"\n{BOLD}Available Statuses:{RESET}")
         for idx, status in enumerate(statuses, 1):
-            color = GREEN if status != current_status else YELLOW
-            marker = "✓" if status == current_status else " "
-            print(f"  {idx}. [{marker}] {color}{status.upper()}{RESET}")
+            current, other = _STATUS_OPTIONS[status]
+            print(f"  {idx}. {current if status == current_status else other}")
         
         # Get new status
         choice = input(f"\n{YELLOW}Select new status (1-{len(statuses)}): {RESET}").strip()
@@ -288,22 +356,25 @@ class EndToEndTest:
                 "reason": reason
             }
             
-            # Try to call the endpoint (may not exist yet)
-            try:
-                response = requests.post(
-                    f"{BASE_URL}/status/update",
-                    json=update_data,
-                    headers={"Content-Type": "application/json"}
-                )
-                
-                if response.status_code == 200:
-                    print_success("Status updated via API!")
-                    return True
-                else:
-                    print_info(f"API endpoint returned: {response.status_code}")
-                    print_info("Simulating manual update...")
-            except:
-                print_info("Status update endpoint not available yet")
+            # Only call the endpoint if the server has it
+            if self._status_endpoint_is_available():
+                try:
+                    response = CLIENT.post(
+                        f"{BASE_URL}/status/update",
+                        content=orjson.dumps(update_data),
+                        timeout=TIMEOUT
+                    )
+                    
+                    if response.status_code == 200:
+                        print_success("Status updated via API!")
+                        return True
+                    else:
+                        print_info(f"API endpoint returned: {response.status_code}")
+                        print_info("Simulating manual update...")
+                except httpx.HTTPError as e:
+                    print_error(f"Status update request failed: {e}")
+            else:
+                print_info("Status update endpoint not available; skipping network call")
                 print_info("You'll need to manually update in database or Swagger UI")
             
             # Instruction for manual update
@@ -328,18 +399,24 @@ class EndToEndTest:
         
         print_info(f"Student ({self.student_name}) is checking complaint status...")
         
-        # Wait a moment
+        # Poll until the new status shows up, bounded by STATUS_POLL_TIMEOUT
         print_info("Waiting for changes to propagate...")
-        time.sleep(2)
-        
-        # Fetch current complaint
-        complaint = self.student_check_complaint(show_full_details=False)
+        expected_status = self.complaint_data.get('new_status')
+        deadline = time.monotonic() + STATUS_POLL_TIMEOUT
+        while True:
+            complaint = self.student_check_complaint(quiet=True, force=True)
+            if not complaint or complaint.get('status') == expected_status:
+                break
+            if time.monotonic() >= deadline:
+                break
+            time.sleep(STATUS_POLL_INTERVAL)
         
         if not complaint:
             return False
         
+        self._show_complaint(complaint)
+        
         current_status = complaint.get('status')
-        expected_status = self.complaint_data.get('new_status')
         old_status = self.complaint_data.get('old_status')
         
         print(f"\n{BOLD}Verification Results:{RESET}")
@@ -359,16 +436,25 @@ class EndToEndTest:
             print(f"{RED}3. There was an error in the update process{RESET}")
             return False
     
+    @classmethod
+    def _status_endpoint_is_available(cls):
+        """Probe /status/update once and remember the answer"""
+        if cls._status_endpoint_available is None:
+            try:
+                # An existing POST route answers OPTIONS with 405, a missing one with 404
+                probe = CLIENT.options(f"{BASE_URL}/status/update", timeout=1.0)
+                cls._status_endpoint_available = probe.status_code != 404 and probe.status_code < 500
+            except httpx.HTTPError:
+                cls._status_endpoint_available = False
+        
+        return cls._status_endpoint_available
+    
     def _colorize_status(self, status):
         """Return colorized status string"""
-        color_map = {
-            'raised': YELLOW,
-            'opened': BLUE,
-            'reviewed': CYAN,
-            'closed': GREEN
-        }
-        color = color_map.get(status, RESET)
-        return f"{color}{status.upper()}{RESET}"
+        colorized = _COLORIZED_STATUS.get(status)
+        if colorized is None:
+            colorized = f"{RESET}{status.upper()}{RESET}" if status else ""
+        return colorized
     
     def run_test(self):
         """Run complete end-to-end test"""
@@ -2,11 +2,50 @@
 Quick test to verify Groq API is working - UPDATED FOR 2026
 """
 import os
+import hashlib
+import json
+import diskcache
+import httpx
 from dotenv import load_dotenv
 from groq import Groq
 
 load_dotenv()
 
+# Opt-in response cache for tight dev loops (GROQ_TEST_CACHE=1). Off by
+# default, since a cached answer does not prove the API is reachable.
+# Kept in a private (0700) per-user directory: diskcache unpickles entries.
+USE_CACHE = os.getenv("GROQ_TEST_CACHE", "0") == "1"
+CACHE_DIR = os.getenv("GROQ_TEST_CACHE_DIR") or os.path.join(
+    os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "campusvoice", "groq_test"
+)
+_cache = None
+
+def get_cache():
+    """Open the response cache on first use (None when caching is off)"""
+    global _cache
+    if USE_CACHE and _cache is None:
+        os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+        os.chmod(CACHE_DIR, 0o700)
+        _cache = diskcache.Cache(CACHE_DIR)
+    return _cache
+
+def cached_call(client, **kwargs):
+    """Return the completion text for kwargs, reusing a cached answer when enabled"""
+    cache = get_cache()
+    key = None
+    if cache is not None:
+        key = hashlib.sha256(json.dumps(kwargs, sort_keys=True, default=str).encode()).hexdigest()
+        hit = cache.get(key)
+        if hit is not None:
+            print("   (cached response)")
+            return hit
+    
+    content = client.chat.completions.create(**kwargs).choices[0].message.content
+    if key is not None:
+        cache.set(key, content)
+    return content
+
 api_key = os.getenv("GROQ_API_KEY")
 
 print(f"API Key found: {bool(api_key)}")
@@ -20,12 +59,19 @@ if not api_key:
 MODEL = "llama-3.3-70b-versatile"
 
 try:
-    client = Groq(api_key=api_key)
+    # Both probes share one keep-alive HTTP/2 connection
+    http_client = httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=10),
+        timeout=30
+    )
+    client = Groq(api_key=api_key, http_client=http_client)
     
     print(f"\n✅ Testing Groq API with model: {MODEL}...")
     
     # Test 1: Simple response
-    response = client.chat.completions.create(
+    content = cached_call(
+        client,
         messages=[
             {
                 "role": "user",
@@ -37,12 +83,13 @@ try:
         max_tokens=50
     )
     
-    print(f"✅ API Response: {response.choices[0].message.content}")
+    print(f"✅ API Response: {content}")
     
     # Test 2: JSON response (for complaint analysis)
     print("\n✅ Testing JSON structured output...")
     
-    response = client.chat.completions.create(
+    content = cached_call(
+        client,
         messages=[
             {
                 "role": "system",
@@ -59,8 +106,7 @@ try:
         response_format={"type": "json_object"}
     )
     
-    import json
-    result = json.loads(response.choices[0].message.content)
+    result = json.loads(content)
     print(f"✅ JSON Response: {json.dumps(result, indent=2)}")
     print("\n✅ Groq API is working correctly!")
     
@@ -0,0 +1,80 @@
+"""
+LLM Analysis Routing Isolation Test
+No backend or Groq API key needed - the Groq client is replaced by a fake
+
+Complaints that differ in a single word ("Library AC..." vs "Hostel AC...")
+must each get their own analysis; a cached answer for one must never hand
+the other its category or authority.
+
+Run: pytest tests/test_llm_routing.py
+"""
+
+import asyncio
+import os
+import sys
+import uuid
+from types import SimpleNamespace
+
+import orjson
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import llm_service
+from services.llm_service import LLMService
+
+LIBRARY_TITLE = "Library AC not working"
+HOSTEL_TITLE = "Hostel AC not working"
+DESCRIPTION = (
+    "The air conditioning unit has not been working for the past week. The room "
+    "gets extremely hot in the afternoon and nobody can study or sit there for long."
+)
+
+# Compact answers (as the analysis prompt requests) the fake model gives per title
+ANSWERS = {
+    LIBRARY_TITLE: {
+        "p": "medium", "c": "infrastructure", "s": "negative", "u": 60, "i": "group",
+        "sm": "Library AC broken", "k": ["AC not working"], "a": "Maintenance Officer"
+    },
+    HOSTEL_TITLE: {
+        "p": "medium", "c": "hostel", "s": "negative", "u": 60, "i": "group",
+        "sm": "Hostel AC broken", "k": ["AC not working"], "a": "Hostel Warden"
+    }
+}
+
+
+class FakeGroq:
+    """Stands in for AsyncGroq: answers by complaint title and counts calls"""
+
+    def __init__(self):
+        self.calls = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, messages, **kwargs):
+        self.calls += 1
+        prompt = messages[-1]["content"]
+        title = next(t for t in ANSWERS if f"Complaint Title: {t}\n" in prompt)
+        content = orjson.dumps(ANSWERS[title]).decode()
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def test_single_word_difference_does_not_share_routing(tmp_path, monkeypatch):
+    # Fresh disk cache, and a model name unique to this run, so no earlier
+    # answer can be served
+    monkeypatch.setattr(llm_service, "LLM_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(llm_service, "_llm_cache", None)
+    service = LLMService(model=f"routing-test-{uuid.uuid4().hex}")
+    service.client = fake = FakeGroq()
+
+    async def analyze_in_order():
+        # Sequential on purpose: the library answer is cached before the hostel lookup
+        library = await service.analyze_complaint(LIBRARY_TITLE, DESCRIPTION)
+        hostel = await service.analyze_complaint(HOSTEL_TITLE, DESCRIPTION)
+        return library, hostel
+
+    library, hostel = asyncio.run(analyze_in_order())
+
+    assert fake.calls == 2, "hostel complaint was answered from the library complaint's cache entry"
+    assert library["category"] == "infrastructure"
+    assert library["suggested_authority"] == "Maintenance Officer"
+    assert hostel["category"] == "hostel"
+    assert hostel["suggested_authority"] == "Hostel Warden"
@@ -3,50 +3,135 @@ Load Testing Script
 Create multiple complaints and votes to test performance
 """
 
-import requests
-import concurrent.futures
+import asyncio
+import gc
+import httpx
+import orjson
 import time
 from datetime import datetime
 
 BASE_URL = "http://localhost:8000/api"
 
-def create_complaint(student_num):
+# Workers per phase, matching the old thread pools. Complaint
+# creation waits on the LLM, so it gets fewer workers than voting.
+COMPLAINT_CONCURRENCY = 10
+VOTE_CONCURRENCY = 20
+
+# One event loop and one keep-alive pool for every request; HTTP/2 when
+# the server negotiates it
+LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=50)
+TIMEOUT = httpx.Timeout(30.0, connect=2.0, pool=None)  # queued requests wait for a free slot
+CONNECT_RETRIES = 2  # only failed connects; a sent vote is never replayed
+
+# Bodies are serialised and parsed with orjson rather than stdlib json
+HEADERS = {"Content-Type": "application/json"}
+
+def _json(response):
+    """Parse a response body with orjson"""
+    return orjson.loads(response.content)
+
+# Fields shared by every load test complaint
+_COMPLAINT_TEMPLATE = {
+    "department": "CSE",
+    "stay_type": "Hostel",
+    "visibility": "Public",
+    "image_url": None
+}
+
+async def create_complaint(client, student_num):
     """Create a test complaint"""
     data = {
+        **_COMPLAINT_TEMPLATE,
         "name": f"Student {student_num}",
         "register_number": f"22CS{student_num:03d}",
-        "department": "CSE",
-        "stay_type": "Hostel",
-        "visibility": "Public",
         "title": f"Test Complaint #{student_num}",
-        "description": f"This is test complaint number {student_num} for load testing",
-        "image_url": None
+        "description": f"This is test complaint number {student_num} for load testing"
     }
     
     try:
-        response = requests.post(f"{BASE_URL}/complaints", json=data)
+        response = await client.post(f"{BASE_URL}/complaints", content=orjson.dumps(data))
         if response.status_code == 201:
-            return response.json().get("complaint_id")
+            return _json(response).get("complaint_id")
         return None
     except Exception as e:
         print(f"Error creating complaint: {e}")
         return None
 
-def vote_on_complaint(complaint_id, voter_num, vote_type="upvote"):
-    """Vote on a complaint"""
-    data = {
+def _vote_body_parts(complaint_id, vote_type="upvote"):
+    """
+    Serialise a complaint's vote body once, split around the roll number
+    
+    Returns:
+        (prefix, suffix) bytes; prefix + b"22CS001" + suffix is the full body
+    """
+    body = orjson.dumps({
         "complaint_id": complaint_id,
-        "roll_number": f"22CS{voter_num:03d}",
+        "roll_number": "__ROLL__",
         "vote_type": vote_type
-    }
+    })
+    prefix, suffix = body.split(b"__ROLL__", 1)
+    return prefix, suffix
+
+async def vote_on_complaint(client, body_parts, voter_num):
+    """Vote on a complaint (body_parts from _vote_body_parts)"""
+    prefix, suffix = body_parts
     
     try:
-        response = requests.post(f"{BASE_URL}/vote", json=data)
+        response = await client.post(
+            f"{BASE_URL}/vote",
+            content=b"%s22CS%03d%s" % (prefix, voter_num, suffix)
+        )
         return response.status_code == 200
     except Exception as e:
         print(f"Error voting: {e}")
         return False
 
+async def _map(func, client, args, concurrency):
+    """
+    Await func(client, *a) for every a in args on a fixed number of workers
+    
+    The asyncio counterpart of executor.map: `concurrency` workers pull from
+    one shared iterator, so there is no task or semaphore wait per call.
+    Results come back in completion order.
+    """
+    args = iter(args)
+    results = []
+    
+    async def worker():
+        for a in args:
+            results.append(await func(client, *a))
+    
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return results
+
+async def _run_load(num_complaints, num_votes_per_complaint):
+    """Create complaints, then vote on them; returns (complaint_ids, vote_count)"""
+    transport = httpx.AsyncHTTPTransport(http2=True, retries=CONNECT_RETRIES, limits=LIMITS)
+    async with httpx.AsyncClient(transport=transport, timeout=TIMEOUT, headers=HEADERS) as client:
+        # Create complaints concurrently
+        created = await _map(
+            create_complaint, client,
+            ((i,) for i in range(1, num_complaints + 1)),
+            COMPLAINT_CONCURRENCY
+        )
+        complaint_ids = [complaint_id for complaint_id in created if complaint_id]
+        
+        print(f"✅ Created {len(complaint_ids)} complaints")
+        
+        # Each complaint's vote body is encoded once; every (body, voter_num)
+        # pair is built in one pass
+        body_parts = [_vote_body_parts(complaint_id) for complaint_id in complaint_ids]
+        vote_jobs = [
+            (parts, (i * num_votes_per_complaint) + voter + 1000)
+            for i, parts in enumerate(body_parts)
+            for voter in range(num_votes_per_complaint)
+        ]
+        
+        # Vote on complaints concurrently
+        votes = await _map(vote_on_complaint, client, vote_jobs, VOTE_CONCURRENCY)
+    
+    return complaint_ids, sum(votes)
+
 def load_test(num_complaints=10, num_votes_per_complaint=5):
     """Run load test"""
     print(f"\n{'='*60}")
@@ -56,35 +141,20 @@ def load_test(num_complaints=10, num_votes_per_complaint=5):
     print(f"Adding {num_votes_per_complaint} votes per complaint...")
     print(f"Total operations: {num_complaints + (num_complaints * num_votes_per_complaint)}")
     
-    start_time = time.time()
-    
-    # Create complaints in parallel
-    complaint_ids = []
-    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-        futures = [executor.submit(create_complaint, i) for i in range(1, num_complaints + 1)]
-        for future in concurrent.futures.as_completed(futures):
-            complaint_id = future.result()
-            if complaint_id:
-                complaint_ids.append(complaint_id)
-    
-    print(f"✅ Created {len(complaint_ids)} complaints")
-    
-    # Vote on complaints in parallel
-    vote_count = 0
-    with concurrent.futures.ThreadPoolExecutor(max_workers=20) as executor:
-        futures = []
-        for i, complaint_id in enumerate(complaint_ids):
-            for voter in range(num_votes_per_complaint):
-                voter_num = (i * num_votes_per_complaint) + voter + 1000
-                futures.append(
-                    executor.submit(vote_on_complaint, complaint_id, voter_num)
-                )
+    # No cyclic GC pauses during the timed phases; collect once afterwards
+    gc.disable()
+    try:
+        start_time = time.time()
+        
+        complaint_ids, vote_count = asyncio.run(
+            _run_load(num_complaints, num_votes_per_complaint)
+        )
         
-        for future in concurrent.futures.as_completed(futures):
-            if future.result():
-                vote_count += 1
+        end_time = time.time()
+    finally:
+        gc.enable()
+        gc.collect()
     
-    end_time = time.time()
     duration = end_time - start_time
     
     print(f"✅ Added {vote_count} votes")
@@ -5,8 +5,9 @@ Handles live vote broadcasting to connected clients
 
 from typing import Dict, Set, Optional
 from fastapi import WebSocket, WebSocketDisconnect
-import json
+import orjson
 import asyncio
+import time
 from datetime import datetime
 import logging
 
@@ -14,6 +15,61 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Naive datetimes are UTC here; orjson writes them as ISO 8601 with a Z
+_ENCODE_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+
+def _encode(message: dict) -> str:
+    """
+    Encode a WebSocket message as JSON text (datetimes serialised natively)
+    
+    A broadcast's payload is encoded once and the same string is sent to
+    every client, instead of send_json encoding it once per client.
+    """
+    return orjson.dumps(message, option=_ENCODE_OPTIONS).decode()
+
+
+# Broadcast timestamps are shared for this long, so a burst of messages
+# reuses one datetime instead of allocating one per message
+TIMESTAMP_RESOLUTION = 0.2  # seconds
+_timestamp_cache = {"at": float("-inf"), "value": None}
+
+
+def _broadcast_timestamp() -> datetime:
+    """Current UTC time, refreshed at most every TIMESTAMP_RESOLUTION seconds"""
+    now = time.monotonic()
+    if now - _timestamp_cache["at"] >= TIMESTAMP_RESOLUTION:
+        _timestamp_cache["at"] = now
+        _timestamp_cache["value"] = datetime.utcnow()
+    return _timestamp_cache["value"]
+
+
+# Messages a client may fall behind by before it is dropped
+OUTBOX_SIZE = 256
+
+
+# ============================================
+# CONNECTION METADATA
+# ============================================
+
+class ConnMeta:
+    """Per-connection metadata (fixed slots instead of a dict per client)"""
+    
+    __slots__ = ("complaint_id", "connected_at", "client_info")
+    
+    def __init__(self, complaint_id: str, connected_at: datetime, client_info: dict):
+        self.complaint_id = complaint_id
+        self.connected_at = connected_at
+        self.client_info = client_info
+    
+    def as_dict(self) -> dict:
+        """Metadata in the shape the stats endpoints return"""
+        return {
+            "complaint_id": self.complaint_id,
+            "connected_at": self.connected_at.isoformat(),
+            "client_info": self.client_info
+        }
+
 
 # ============================================
 # CONNECTION MANAGER CLASS
@@ -28,25 +84,46 @@ class ConnectionManager:
     - Auto-cleanup on disconnect
     - Broadcast to all connected clients
     - Real-time vote updates (<100ms)
+    - Per-client outbox + writer task, so a slow client cannot stall others
+    
+    Each client gets an integer connection ID at connect time. Everything
+    is keyed by it: broadcasts only touch the ID sets and outboxes, while
+    sockets and metadata are looked up on connect/disconnect.
     """
     
     def __init__(self):
-        # Dictionary: complaint_id -> set of WebSocket connections
-        self.active_connections: Dict[str, Set[WebSocket]] = {}
+        # Next connection ID to hand out
+        self._next_id = 0
+        
+        # Dictionary: complaint_id -> set of connection IDs
+        self.active_connections: Dict[str, Set[int]] = {}
+        
+        # Connection ID -> WebSocket connection
+        self.sockets: Dict[int, WebSocket] = {}
         
         # Track connection metadata
-        self.connection_metadata: Dict[WebSocket, dict] = {}
+        self.connection_metadata: Dict[int, ConnMeta] = {}
+        
+        # Per-client outbound queue of encoded messages, and the task draining it
+        self.outboxes: Dict[int, asyncio.Queue] = {}
+        self.writers: Dict[int, asyncio.Task] = {}
+        
+        # Close handshakes of dropped clients still in flight (kept referenced)
+        self._closing: Set[asyncio.Task] = set()
         
         # Connection counters
         self.total_connections = 0
         self.total_disconnections = 0
+        
+        # Currently connected clients, kept up to date on connect/disconnect
+        self._active_count = 0
     
     
     # ========================================
     # CONNECTION MANAGEMENT
     # ========================================
     
-    async def connect(self, websocket: WebSocket, complaint_id: str, client_info: Optional[dict] = None):
+    async def connect(self, websocket: WebSocket, complaint_id: str, client_info: Optional[dict] = None) -> int:
         """
         Connect a client to a complaint's vote feed
         
@@ -54,85 +131,261 @@ class ConnectionManager:
             websocket: WebSocket connection
             complaint_id: Complaint ID to subscribe to
             client_info: Optional client metadata (roll_number, etc.)
+            
+        Returns:
+            int: Connection ID to pass to disconnect/send_personal_message
         """
         # Accept the WebSocket connection
         await websocket.accept()
         
-        # Initialize set for this complaint if not exists
-        if complaint_id not in self.active_connections:
-            self.active_connections[complaint_id] = set()
+        conn_id = self._next_id
+        self._next_id += 1
+        connected_at = datetime.utcnow()
+        self.sockets[conn_id] = websocket
         
-        # Add connection to the set
-        self.active_connections[complaint_id].add(websocket)
+        # Add connection to this complaint's set (created if not exists)
+        self.active_connections.setdefault(complaint_id, set()).add(conn_id)
+        self._active_count += 1
         
         # Store metadata
-        self.connection_metadata[websocket] = {
-            "complaint_id": complaint_id,
-            "connected_at": datetime.utcnow().isoformat(),
-            "client_info": client_info or {}
-        }
+        self.connection_metadata[conn_id] = ConnMeta(complaint_id, connected_at, client_info or {})
+        
+        # Start this client's writer; every send goes through its outbox
+        outbox = asyncio.Queue(maxsize=OUTBOX_SIZE)
+        self.outboxes[conn_id] = outbox
+        self.writers[conn_id] = asyncio.create_task(
+            self._writer_loop(conn_id, websocket, complaint_id, outbox)
+        )
         
         # Update counter
         self.total_connections += 1
         
         # Log connection
-        logger.info(f"✅ Client connected to complaint {complaint_id}. Total active: {self.get_connection_count(complaint_id)}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("✅ Client connected to complaint %s. Total active: %d", complaint_id, self.get_connection_count(complaint_id))
         
         # Send welcome message
         await self.send_personal_message(
-            websocket,
+            conn_id,
             {
                 "type": "connection",
                 "message": "Connected to vote feed",
                 "complaint_id": complaint_id,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": connected_at
             }
         )
+        
+        return conn_id
     
     
-    async def disconnect(self, websocket: WebSocket, complaint_id: str):
+    async def disconnect(self, conn_id: int, complaint_id: str):
         """
         Disconnect a client from a complaint's vote feed
         
         Args:
-            websocket: WebSocket connection
+            conn_id: Connection ID returned by connect
             complaint_id: Complaint ID to unsubscribe from
         """
+        # Already dropped (e.g. by a broadcast, or by its writer on a send
+        # error); the endpoint's own disconnect must not count it again
+        if conn_id not in self.sockets:
+            return
+        
         # Remove from active connections
-        if complaint_id in self.active_connections:
-            self.active_connections[complaint_id].discard(websocket)
+        connections = self.active_connections.get(complaint_id)
+        if connections is not None:
+            if conn_id in connections:
+                connections.remove(conn_id)
+                self._active_count -= 1
             
             # Remove empty sets
-            if not self.active_connections[complaint_id]:
+            if not connections:
                 del self.active_connections[complaint_id]
         
-        # Remove metadata
-        if websocket in self.connection_metadata:
-            del self.connection_metadata[websocket]
+        # Remove socket and metadata
+        self.sockets.pop(conn_id, None)
+        self.connection_metadata.pop(conn_id, None)
+        
+        # Stop the writer (unless it is the one disconnecting) and drop its outbox
+        self.outboxes.pop(conn_id, None)
+        writer = self.writers.pop(conn_id, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
         
         # Update counter
         self.total_disconnections += 1
         
         # Log disconnection
-        logger.info(f"❌ Client disconnected from complaint {complaint_id}. Remaining: {self.get_connection_count(complaint_id)}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("❌ Client disconnected from complaint %s. Remaining: %d", complaint_id, self.get_connection_count(complaint_id))
+    
+    
+    def _drop_clients(self, complaint_id: str, conn_ids: Set[int]):
+        """
+        Disconnect several clients of one complaint in a single pass
+        
+        Args:
+            complaint_id: Complaint ID the clients are subscribed to
+            conn_ids: Connection IDs to drop
+        """
+        connections = self.active_connections.get(complaint_id)
+        if connections is not None:
+            remaining_before = len(connections)
+            connections.difference_update(conn_ids)
+            self._active_count -= remaining_before - len(connections)
+            if not connections:
+                del self.active_connections[complaint_id]
+        
+        for conn_id in conn_ids:
+            # Close in the background so the broadcast never waits on a slow peer
+            websocket = self.sockets.get(conn_id)
+            if websocket is not None:
+                closing = asyncio.create_task(self._close_dropped(websocket))
+                self._closing.add(closing)
+                closing.add_done_callback(self._closing.discard)
+            
+            self.sockets.pop(conn_id, None)
+            self.connection_metadata.pop(conn_id, None)
+            self.outboxes.pop(conn_id, None)
+            writer = self.writers.pop(conn_id, None)
+            if writer is not None:
+                writer.cancel()
+        
+        self.total_disconnections += len(conn_ids)
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("❌ Dropped %d clients from complaint %s. Remaining: %d", len(conn_ids), complaint_id, self.get_connection_count(complaint_id))
+    
+    
+    def _drop_slow_clients(self, conn_ids: Set[int]):
+        """
+        Drop clients whose outbox was full, whatever complaint they watch
+        
+        Args:
+            conn_ids: Connection IDs that could not take a message; any no
+                longer connected are ignored
+        """
+        by_complaint: Dict[str, Set[int]] = {}
+        for conn_id in conn_ids:
+            meta = self.connection_metadata.get(conn_id)
+            if meta is not None and conn_id in self.outboxes:
+                by_complaint.setdefault(meta.complaint_id, set()).add(conn_id)
+        
+        for complaint_id, dropped in by_complaint.items():
+            self._drop_clients(complaint_id, dropped)
+    
+    
+    async def _close_dropped(self, websocket: WebSocket):
+        """
+        Close a dropped client's socket, so the peer reconnects and the
+        endpoint's receive loop ends instead of lingering as a zombie
+        """
+        try:
+            await websocket.close(code=1011, reason="Client fell behind")
+        except Exception as e:
+            logger.error("Error closing dropped client: %s", e)
     
     
     # ========================================
     # MESSAGE SENDING
     # ========================================
     
-    async def send_personal_message(self, websocket: WebSocket, message: dict):
+    async def _writer_loop(self, conn_id: int, websocket: WebSocket, complaint_id: str, outbox: asyncio.Queue):
         """
-        Send message to a specific client
+        Drain a client's outbox onto its socket until the client goes away
+        
+        Every message goes out as its own text frame; a burst already queued
+        (e.g. rapid votes) is written back-to-back without other clients
+        waiting on this socket.
         
         Args:
-            websocket: Target WebSocket connection
-            message: Message dictionary to send
+            conn_id: Connection ID
+            websocket: WebSocket connection
+            complaint_id: Complaint ID the client is subscribed to
+            outbox: The client's queue of encoded messages
         """
         try:
-            await websocket.send_json(message)
+            while True:
+                await websocket.send_text(await outbox.get())
+        except asyncio.CancelledError:
+            raise
+        except WebSocketDisconnect:
+            logger.warning("Client disconnected during send")
+            await self.disconnect(conn_id, complaint_id)
         except Exception as e:
-            logger.error(f"Error sending personal message: {e}")
+            logger.error("Error sending to client: %s", e)
+            await self.disconnect(conn_id, complaint_id)
+    
+    
+    def _enqueue(self, conn_id: int, payload: str) -> bool:
+        """
+        Queue an encoded message for a client without waiting on its socket
+        
+        Returns:
+            bool: False if the client is not connected or its outbox is full
+        """
+        outbox = self.outboxes.get(conn_id)
+        if outbox is None:
+            return False
+        
+        try:
+            outbox.put_nowait(payload)
+        except asyncio.QueueFull:
+            logger.warning("Outbox full, dropping slow client")
+            return False
+        return True
+    
+    
+    async def send_personal_message(self, conn_id: int, message: dict):
+        """
+        Send message to a specific client
+        
+        Args:
+            conn_id: Target connection ID
+            message: Message dictionary to send
+        """
+        if not self._enqueue(conn_id, _encode(message)):
+            logger.error("Error sending personal message: client not connected or outbox full")
+            self._drop_slow_clients({conn_id})
+    
+    
+    async def _send_to_all(self, conn_ids, payload: str) -> Set[int]:
+        """
+        Queue one encoded message for many clients
+        
+        Args:
+            conn_ids: Snapshot (tuple) of target connection IDs
+            payload: Message encoded once for every client (see _encode)
+            
+        Returns:
+            Set[int]: Clients that could not take the message (outbox full)
+        """
+        return {conn_id for conn_id in conn_ids if not self._enqueue(conn_id, payload)}
+    
+    
+    async def broadcast_raw(self, complaint_id: str, payload: str) -> int:
+        """
+        Broadcast an already-encoded message to all clients watching a complaint
+        
+        Args:
+            complaint_id: Complaint ID
+            payload: Complete message, encoded with _encode
+            
+        Returns:
+            int: Number of clients still watching after the broadcast
+        """
+        # Snapshot once; failed clients are removed from the live set afterwards
+        targets = tuple(self.active_connections.get(complaint_id, ()))
+        if not targets:
+            return 0
+        
+        disconnected_clients = await self._send_to_all(targets, payload)
+        
+        # Clean up disconnected clients
+        if disconnected_clients:
+            self._drop_clients(complaint_id, disconnected_clients)
+        
+        return self.get_connection_count(complaint_id)
     
     
     async def broadcast_vote_update(self, complaint_id: str, vote_data: dict):
@@ -153,7 +406,7 @@ class ConnectionManager:
             }
         """
         if complaint_id not in self.active_connections:
-            logger.warning(f"No active connections for complaint {complaint_id}")
+            logger.warning("No active connections for complaint %s", complaint_id)
             return
         
         # Prepare broadcast message
@@ -161,29 +414,13 @@ class ConnectionManager:
             "type": "vote_update",
             "complaint_id": complaint_id,
             **vote_data,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _broadcast_timestamp()
         }
         
-        # Track disconnected clients
-        disconnected_clients = set()
-        
-        # Send to all connected clients
-        for websocket in self.active_connections[complaint_id]:
-            try:
-                await websocket.send_json(broadcast_message)
-                logger.debug(f"📤 Broadcasted to client on complaint {complaint_id}")
-            except WebSocketDisconnect:
-                disconnected_clients.add(websocket)
-                logger.warning(f"Client disconnected during broadcast")
-            except Exception as e:
-                disconnected_clients.add(websocket)
-                logger.error(f"Error broadcasting to client: {e}")
+        # Encode once and queue for every watching client
+        watching = await self.broadcast_raw(complaint_id, _encode(broadcast_message))
         
-        # Clean up disconnected clients
-        for websocket in disconnected_clients:
-            await self.disconnect(websocket, complaint_id)
-        
-        logger.info(f"✅ Broadcast to {len(self.active_connections[complaint_id])} clients for complaint {complaint_id}")
+        logger.info("✅ Broadcast to %d clients for complaint %s", watching, complaint_id)
     
     
     async def broadcast_status_update(self, complaint_id: str, status_data: dict):
@@ -209,22 +446,12 @@ class ConnectionManager:
             "type": "status_update",
             "complaint_id": complaint_id,
             **status_data,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _broadcast_timestamp()
         }
         
-        disconnected_clients = set()
-        
-        for websocket in self.active_connections[complaint_id]:
-            try:
-                await websocket.send_json(broadcast_message)
-            except Exception as e:
-                disconnected_clients.add(websocket)
-                logger.error(f"Error broadcasting status: {e}")
+        watching = await self.broadcast_raw(complaint_id, _encode(broadcast_message))
         
-        for websocket in disconnected_clients:
-            await self.disconnect(websocket, complaint_id)
-        
-        logger.info(f"✅ Status broadcast to {len(self.active_connections[complaint_id])} clients")
+        logger.info("✅ Status broadcast to %d clients", watching)
     
     
     async def broadcast_to_all(self, message: dict):
@@ -237,20 +464,18 @@ class ConnectionManager:
         broadcast_message = {
             "type": "global_broadcast",
             **message,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _broadcast_timestamp()
         }
         
-        total_sent = 0
+        targets = tuple(self.outboxes)
+        failed_clients = await self._send_to_all(targets, _encode(broadcast_message))
+        total_sent = len(targets) - len(failed_clients)
         
-        for complaint_id, connections in self.active_connections.items():
-            for websocket in connections:
-                try:
-                    await websocket.send_json(broadcast_message)
-                    total_sent += 1
-                except Exception as e:
-                    logger.error(f"Error in global broadcast: {e}")
+        # Clean up clients that fell behind, per complaint they watch
+        if failed_clients:
+            self._drop_slow_clients(failed_clients)
         
-        logger.info(f"✅ Global broadcast sent to {total_sent} clients")
+        logger.info("✅ Global broadcast sent to %d clients", total_sent)
     
     
     # ========================================
@@ -267,9 +492,7 @@ class ConnectionManager:
         Returns:
             int: Number of active connections
         """
-        if complaint_id not in self.active_connections:
-            return 0
-        return len(self.active_connections[complaint_id])
+        return len(self.active_connections.get(complaint_id, ()))
     
     
     def get_total_connections(self) -> int:
@@ -279,10 +502,7 @@ class ConnectionManager:
         Returns:
             int: Total active connections across all complaints
         """
-        total = 0
-        for connections in self.active_connections.values():
-            total += len(connections)
-        return total
+        return self._active_count
     
     
     def get_stats(self) -> dict:
@@ -292,16 +512,19 @@ class ConnectionManager:
         Returns:
             dict: Statistics dictionary
         """
+        # One pass for the per-complaint counts; the total is kept incrementally
+        connections_per_complaint = {
+            complaint_id: len(connections)
+            for complaint_id, connections in self.active_connections.items()
+        }
+        
         return {
-            "active_complaints": len(self.active_connections),
-            "total_active_connections": self.get_total_connections(),
+            "active_complaints": len(connections_per_complaint),
+            "total_active_connections": self._active_count,
             "total_connections_ever": self.total_connections,
             "total_disconnections": self.total_disconnections,
-            "complaints_being_watched": list(self.active_connections.keys()),
-            "connections_per_complaint": {
-                complaint_id: len(connections)
-                for complaint_id, connections in self.active_connections.items()
-            }
+            "complaints_being_watched": list(connections_per_complaint),
+            "connections_per_complaint": connections_per_complaint
         }
     
     
@@ -315,13 +538,11 @@ class ConnectionManager:
         Returns:
             list: List of client metadata
         """
-        if complaint_id not in self.active_connections:
-            return []
-        
         watchers = []
-        for websocket in self.active_connections[complaint_id]:
-            if websocket in self.connection_metadata:
-                watchers.append(self.connection_metadata[websocket])
+        for conn_id in self.active_connections.get(complaint_id, ()):
+            meta = self.connection_metadata.get(conn_id)
+            if meta is not None:
+                watchers.append(meta.as_dict())
         
         return watchers
     
@@ -336,43 +557,27 @@ class ConnectionManager:
         """
         logger.info("🛑 Disconnecting all WebSocket clients...")
         
-        for complaint_id, connections in list(self.active_connections.items()):
-            for websocket in list(connections):
-                try:
-                    await websocket.close(code=1000, reason="Server shutdown")
-                except Exception as e:
-                    logger.error(f"Error closing connection: {e}")
+        for writer in self.writers.values():
+            writer.cancel()
+        
+        # Close every socket at once rather than one handshake after another
+        sockets = tuple(self.sockets.values())
+        results = await asyncio.gather(
+            *(websocket.close(code=1000, reason="Server shutdown") for websocket in sockets),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Error closing connection: %s", result)
         
         self.active_connections.clear()
+        self.sockets.clear()
         self.connection_metadata.clear()
+        self._active_count = 0
+        self.outboxes.clear()
+        self.writers.clear()
         
         logger.info("✅ All WebSocket connections closed")
-    
-    
-    async def cleanup_stale_connections(self):
-        """
-        Remove stale/dead connections (run periodically)
-        """
-        logger.info("🧹 Cleaning up stale connections...")
-        
-        stale_count = 0
-        
-        for complaint_id, connections in list(self.active_connections.items()):
-            disconnected = set()
-            
-            for websocket in list(connections):
-                try:
-                    # Send ping to check if alive
-                    await websocket.send_json({"type": "ping"})
-                except Exception:
-                    disconnected.add(websocket)
-                    stale_count += 1
-            
-            # Remove stale connections
-            for websocket in disconnected:
-                await self.disconnect(websocket, complaint_id)
-        
-        logger.info(f"✅ Cleaned up {stale_count} stale connections")
 
 
 # ============================================
@@ -387,28 +592,55 @@ manager = ConnectionManager()
 # HELPER FUNCTIONS
 # ============================================
 
-async def send_vote_update(complaint_id: str, upvotes: int, downvotes: int, action: str):
+async def send_vote_update(
+    complaint_id: str,
+    upvotes: int,
+    downvotes: int,
+    action: str,
+    vote_type: Optional[str] = None,
+    priority_updated: bool = False,
+    new_priority: Optional[str] = None
+):
     """
     Convenient function to send vote updates
     
+    Builds the whole message in one literal and encodes it once; nothing is
+    built when no client is watching the complaint.
+    
     Args:
         complaint_id: Complaint ID
         upvotes: Current upvote count
         downvotes: Current downvote count
-        action: Action performed (upvote_added, downvote_added, vote_removed, vote_changed)
+        action: Action performed (upvote_added, downvote_added, vote_removed, vote_changed, batch)
+        vote_type: Vote that triggered the update (None for batches)
+        priority_updated: Whether the vote changed the complaint's priority
+        new_priority: New priority (when priority_updated)
     """
-    await manager.broadcast_vote_update(
-        complaint_id=complaint_id,
-        vote_data={
-            "upvotes": upvotes,
-            "downvotes": downvotes,
-            "total_votes": upvotes + downvotes,
-            "action": action
-        }
-    )
+    if not manager.get_connection_count(complaint_id):
+        return
+    
+    await manager.broadcast_raw(complaint_id, _encode({
+        "type": "vote_update",
+        "complaint_id": complaint_id,
+        "upvotes": upvotes,
+        "downvotes": downvotes,
+        "total_votes": upvotes + downvotes,
+        "action": action,
+        "vote_type": vote_type,
+        "priority_updated": priority_updated,
+        "new_priority": new_priority,
+        "timestamp": _broadcast_timestamp()
+    }))
 
 
-async def send_status_update(complaint_id: str, old_status: str, new_status: str, updated_by: str = None, reason: str = None):
+async def send_status_update(
+    complaint_id: str,
+    old_status: str,
+    new_status: str,
+    updated_by: str = None,
+    reason: str = None,
+    updated_by_roll: Optional[str] = None
+):
     """
     Convenient function to send status updates
     
@@ -418,30 +650,21 @@ async def send_status_update(complaint_id: str, old_status: str, new_status: str
         new_status: New status
         updated_by: Who updated it
         reason: Reason for update
+        updated_by_roll: Roll number of who updated it
     """
-    await manager.broadcast_status_update(
-        complaint_id=complaint_id,
-        status_data={
-            "old_status": old_status,
-            "new_status": new_status,
-            "updated_by": updated_by,
-            "reason": reason
-        }
-    )
-
-
-# ============================================
-# PERIODIC CLEANUP TASK
-# ============================================
-
-async def periodic_cleanup_task():
-    """
-    Background task to periodically clean stale connections
-    Run this as a background task in FastAPI
-    """
-    while True:
-        await asyncio.sleep(300)  # Every 5 minutes
-        await manager.cleanup_stale_connections()
+    if not manager.get_connection_count(complaint_id):
+        return
+    
+    await manager.broadcast_raw(complaint_id, _encode({
+        "type": "status_update",
+        "complaint_id": complaint_id,
+        "old_status": old_status,
+        "new_status": new_status,
+        "updated_by": updated_by,
+        "updated_by_roll": updated_by_roll,
+        "reason": reason,
+        "timestamp": _broadcast_timestamp()
+    }))
 
 
 # ============================================
@@ -449,9 +672,9 @@ async def periodic_cleanup_task():
 # ============================================
 
 __all__ = [
+    "ConnMeta",
     "ConnectionManager",
     "manager",
     "send_vote_update",
     "send_status_update",
-    "periodic_cleanup_task",
 ]